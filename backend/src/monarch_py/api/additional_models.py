@@ -5,6 +5,7 @@ from fastapi import Query, Request
 from pydantic import BaseModel, Field
 
 from monarch_py.datamodels.category_enums import EntityCategory
+from monarch_py.datamodels.model import SemsimSearchResult
 
 
 class PaginationParams(BaseModel):
@@ -74,6 +75,41 @@ class SemsimSearchRequest(BaseModel):
     limit: Optional[int] = Field(10, title="Limit the number of results", ge=1, le=50)
 
 
+class SemsimSearchPageRequest(SemsimSearchRequest):
+    limit: Optional[int] = Field(50, title="Number of results per page", ge=1, le=500)
+    offset: int = Field(0, title="Rank of the first result to return", ge=0)
+    depth: int = Field(1000, title="Number of top-ranked results to page through", ge=1, le=10_000)
+
+
+class SemsimProfile(BaseModel):
+    id: str = Field(..., title="Identifier of the profile (e.g. a phenopacket or patient id)")
+    termset: List[str] = Field(..., title="Phenotype terms of the profile", max_length=500)
+
+
+class SemsimBatchSearchRequest(BaseModel):
+    # larger jobs belong to the `monarch semsim-batch` CLI, which holds no API worker
+    profiles: List[SemsimProfile] = Field(..., title="Profiles to search with", max_length=100)
+    group: SemsimSearchGroup = Field(..., title="Group of entities to search within (e.g. Human Genes)")
+    metric: SemsimMetric = Field(SemsimMetric.ANCESTOR_INFORMATION_CONTENT, title="Similarity metric to use")
+    directionality: SemsimDirectionality = Field(
+        SemsimDirectionality.BIDIRECTIONAL, title="Directionality of the search"
+    )
+    limit: int = Field(10, title="Number of results per profile", ge=1, le=500)
+
+
+class SemsimBatchSearchResult(BaseModel):
+    id: str = Field(..., title="Identifier of the profile")
+    results: List[SemsimSearchResult] = Field(..., title="Best-matching entities for the profile, best first")
+
+
+class SemsimSearchPage(BaseModel):
+    items: List[SemsimSearchResult] = Field(..., title="Results on this page, best first")
+    offset: int = Field(..., title="Rank of the first result on this page")
+    limit: int = Field(..., title="Number of results per page")
+    total: int = Field(..., title="Number of ranked results (at most the requested depth)")
+    next_cursor: Optional[str] = Field(None, title="Cursor for the next page; absent on the last page")
+
+
 class TextAnnotationRequest(BaseModel):
     content: str = Field(..., title="The text content to annotate")
     prefix: Optional[List[str]] = Field(
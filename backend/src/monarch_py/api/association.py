@@ -3,7 +3,7 @@ from typing import List, Union
 from fastapi import APIRouter, Depends, Query, Response
 
 from monarch_py.api.additional_models import OutputFormat, PaginationParams
-from monarch_py.api.config import solr
+from monarch_py.api.config import solr_async
 from monarch_py.datamodels.model import AssociationResults, CompactAssociationResults, MultiEntityAssociationResults
 from monarch_py.datamodels.category_enums import AssociationCategory, AssociationPredicate, EntityCategory
 from monarch_py.utils.format_utils import to_tsv
@@ -43,7 +43,7 @@ async def _get_associations(
     ),
 ) -> Union[AssociationResults, CompactAssociationResults, str]:
     """Retrieves all associations for a given entity, or between two entities."""
-    response = solr().get_associations(
+    response = await solr_async().get_associations(
         category=category,
         subject=subject,
         predicate=predicate,
@@ -86,7 +86,7 @@ async def _get_multi_entity_associations(
     ),
 ) -> List[MultiEntityAssociationResults]:
     """Retrieves all associations between each entity and each counterpart category."""
-    response = solr().get_multi_entity_associations(
+    response = await solr_async().get_multi_entity_associations(
         entity=entity,
         counterpart_category=counterpart_category,
         offset=pagination.offset,
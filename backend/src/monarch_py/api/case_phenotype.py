@@ -4,7 +4,7 @@ import logging
 import re
 from fastapi import APIRouter, HTTPException, Query, Path
 
-from monarch_py.api.config import solr
+from monarch_py.api.config import solr_async
 from monarch_py.datamodels.model import CasePhenotypeMatrixResponse, Node
 
 logger = logging.getLogger(__name__)
@@ -121,11 +121,11 @@ async def get_case_phenotype_matrix(
     """
     normalized_id = validate_disease_id(disease_id)
 
-    solr_impl = solr()
+    solr_impl = solr_async()
 
     # Check if entity exists and is a disease
     try:
-        entity = solr_impl.get_entity(normalized_id, extra=False)
+        entity = await solr_impl.get_entity(normalized_id, extra=False)
         if entity is None:
             raise HTTPException(
                 status_code=404,
@@ -148,7 +148,7 @@ async def get_case_phenotype_matrix(
 
     # Get the matrix
     try:
-        return solr_impl.get_case_phenotype_matrix(
+        return await solr_impl.get_case_phenotype_matrix(
             disease_id=normalized_id,
             direct_only=direct,
             limit=limit,
@@ -1,8 +1,10 @@
 import os
 from functools import lru_cache
+from typing import Optional
 
 from pydantic import BaseModel
 
+from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
 from monarch_py.implementations.solr.solr_implementation import SolrImplementation
 from monarch_py.implementations.spacy.spacy_implementation import SpacyImplementation
 from monarch_py.service.semsim_service import SemsimianService
@@ -18,6 +20,12 @@ def _int_env(name: str, default: int) -> int:
         return default
 
 
+def _choice_env(name: str, default: str, choices) -> str:
+    """An env var restricted to `choices`, falling back to `default` on anything else"""
+    value = os.getenv(name, default).lower()
+    return value if value in choices else default
+
+
 class Settings(BaseModel):
     solr_host: str = os.getenv("SOLR_HOST") if os.getenv("SOLR_HOST") else "127.0.0.1"
     solr_port: str = os.getenv("SOLR_PORT") if os.getenv("SOLR_PORT") else 8983
@@ -35,8 +43,41 @@ class Settings(BaseModel):
     # per-worker DuckDB caps (tunable for memory-constrained hosts: workers x limit must fit RAM)
     ducksim_memory_limit: str = os.getenv("DUCKSIM_MEMORY_LIMIT", "2GB")
     ducksim_threads: int = _int_env("DUCKSIM_THREADS", 2)
+    # connections per worker: how many ducksim queries (each on up to DUCKSIM_THREADS threads) run at once
+    ducksim_pool_size: int = _int_env("DUCKSIM_POOL_SIZE", 4)
+    # load the closure into each worker as a resident ancestor index (faster compare; costs RAM per worker)
+    ducksim_resident_index: bool = os.getenv("DUCKSIM_RESIDENT_INDEX", "").lower() in ("1", "true", "yes")
+    # ...or build that index once into this directory and memory-map it from every worker (one copy in RAM)
+    ducksim_shared_index_dir: Optional[str] = os.getenv("DUCKSIM_SHARED_INDEX_DIR") or None
+    # another artifact's indexes there are removed once unused this long (old workers mid rolling deploy)
+    ducksim_shared_index_stale_after: int = _int_env("DUCKSIM_SHARED_INDEX_STALE_SECONDS", 24 * 3600)
+    # MinHash/LSH prefilter for hybrid search (cost independent of the entity count; approximate recall)
+    ducksim_minhash: bool = os.getenv("DUCKSIM_MINHASH", "").lower() in ("1", "true", "yes")
+    # ...or IC-weighted profile embeddings, whose nearest neighbours hybrid search then reranks
+    ducksim_embedding: bool = os.getenv("DUCKSIM_EMBEDDING", "").lower() in ("1", "true", "yes")
+    # per-worker LRU caches: query-term ancestor sets, and ranked search pages
+    ducksim_term_cache_size: int = _int_env("DUCKSIM_TERM_CACHE_SIZE", 10_000)
+    ducksim_page_cache_size: int = _int_env("DUCKSIM_PAGE_CACHE_SIZE", 256)
+    # deep (paginated / streamed) search rankings held per worker, and for how many seconds
+    ducksim_result_set_size: int = _int_env("DUCKSIM_RESULT_SET_SIZE", 32)
+    ducksim_result_set_ttl: int = _int_env("DUCKSIM_RESULT_SET_TTL", 300)
+    # search ranking: "hybrid" (semsimian's Jaccard prefilter, default) or "full" (exact). The engine's
+    # pruned "topk" isn't offered until `monarch semsim-benchmark` shows it beating "full".
+    ducksim_search_mode: str = _choice_env("DUCKSIM_SEARCH_MODE", "hybrid", ("hybrid", "full"))
 
     monarch_kg_version: str = os.getenv("MONARCH_KG_VERSION", "unknown")
+
+    # Entity node response cache: in-process LRU size, plus an optional on-disk tier (kept across
+    # restarts, shareable by workers) enabled by pointing NODE_CACHE_DIR at a writable directory.
+    node_cache_size: int = _int_env("NODE_CACHE_SIZE", 1024)
+    node_cache_dir: Optional[str] = os.getenv("NODE_CACHE_DIR") or None
+    node_cache_disk_size: int = _int_env("NODE_CACHE_DISK_SIZE", 50000)
+    # another KG version's disk entries are removed once unused this long (old workers mid rolling deploy)
+    node_cache_disk_stale_after: int = _int_env("NODE_CACHE_DISK_STALE_SECONDS", 24 * 3600)
+    # how often the KG version the cache is keyed on is re-read from Solr, and how long nodes are kept
+    # in memory while it can't be read
+    node_cache_version_refresh: int = _int_env("NODE_CACHE_VERSION_REFRESH_SECONDS", 60)
+    node_cache_unknown_ttl: int = _int_env("NODE_CACHE_UNKNOWN_TTL_SECONDS", 60)
     monarch_api_version: str = os.getenv("MONARCH_API_VERSION", "unknown")
     monarch_kg_source: str = os.getenv("MONARCH_KG_SOURCE", "unknown")
 
@@ -71,6 +112,34 @@ def solr():
     return SolrImplementation(settings.solr_url)
 
 
+@lru_cache(maxsize=1)
+def solr_async():
+    """Awaitable Solr implementation for the async routes, so Solr I/O never blocks the event loop."""
+    return AsyncSolrImplementation(settings.solr_url)
+
+
+@lru_cache(maxsize=1)
+def node_cache():
+    """Per-worker cache of built entity nodes, keyed by (KG version, entity id)."""
+    from monarch_py.service.node_cache import NodeCache
+
+    return NodeCache.from_settings(
+        settings.node_cache_size,
+        settings.node_cache_dir,
+        settings.node_cache_disk_size,
+        settings.node_cache_disk_stale_after,
+        settings.node_cache_unknown_ttl,
+    )
+
+
+@lru_cache(maxsize=1)
+def node_cache_version():
+    """The KG version `node_cache()` is keyed on, as loaded in Solr (see `KGVersion`)."""
+    from monarch_py.service.node_cache import KGVersion
+
+    return KGVersion(solr_async().get_index_version, settings.monarch_kg_version, settings.node_cache_version_refresh)
+
+
 @lru_cache(maxsize=1)
 def ducksim():
     """In-process DuckDB similarity engine over the read-only monarch-kg.duckdb artifact."""
@@ -81,9 +150,19 @@ def ducksim():
         settings.monarch_kg_duckdb_path,
         memory_limit=settings.ducksim_memory_limit,
         threads=settings.ducksim_threads,
+        pool_size=settings.ducksim_pool_size,
+        resident_index=settings.ducksim_resident_index,
+        shared_index_dir=settings.ducksim_shared_index_dir,
+        shared_index_stale_after=settings.ducksim_shared_index_stale_after,
+        minhash=settings.ducksim_minhash,
+        embedding=settings.ducksim_embedding,
+        term_cache_size=settings.ducksim_term_cache_size,
+        page_cache_size=settings.ducksim_page_cache_size,
+        result_set_size=settings.ducksim_result_set_size,
+        result_set_ttl=settings.ducksim_result_set_ttl,
     )
     # No entity store needed: the DuckDB backend hydrates result entities from the KG `nodes` table.
-    return DucksimService(engine=engine)
+    return DucksimService(engine=engine, search_mode=settings.ducksim_search_mode)
 
 
 @lru_cache(maxsize=1)
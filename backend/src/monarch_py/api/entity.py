@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response
 from fastapi.responses import StreamingResponse
 
 from monarch_py.api.additional_models import PaginationParams
-from monarch_py.api.config import solr
+from monarch_py.api.config import node_cache, node_cache_version, solr, solr_async
 from monarch_py.api.additional_models import OutputFormat
 from monarch_py.datamodels.model import AssociationTableResults, Node
 from monarch_py.datamodels.category_enums import AssociationCategory
@@ -16,6 +16,7 @@ router = APIRouter(tags=["entity"], responses={404: {"description": "Not Found"}
 
 @router.get("/{id}")
 async def _get_entity(
+    http_response: Response,
     id: str = Path(
         title="ID of the entity to retrieve",
         examples=["MONDO:0019391"],
@@ -37,16 +38,26 @@ async def _get_entity(
     <b>Returns:</b> <br>
         Node: Entity details for the specified id
     """
-    response = solr().get_entity(id, extra=True)
+    timings = {}
+    kg_version = await node_cache_version().get()
+    response = await node_cache().aget(kg_version, id)
     if response is None:
-        raise HTTPException(status_code=404, detail="Entity not found")
+        response = await solr_async().get_entity(id, extra=True, timings=timings)
+        if response is None:
+            raise HTTPException(status_code=404, detail="Entity not found")
+        await node_cache().aput(kg_version, id, response)
+        # Per-lookup Solr timings, visible in the browser's network panel
+        server_timing = {"Server-Timing": ", ".join(f"{name};dur={ms}" for name, ms in timings.items())}
+    else:
+        server_timing = {"Server-Timing": "node_cache;desc=hit"}
     if format == OutputFormat.json:
+        http_response.headers.update(server_timing)
         return Node(**response.__dict__)  # This is an odd consequence of how Node extends Entity
     elif format == OutputFormat.tsv:
         tsv = ""
         for row in to_tsv(response, print_output=False):
             tsv += row
-        return Response(content=tsv, media_type="text/tab-separated-values")
+        return Response(content=tsv, media_type="text/tab-separated-values", headers=server_timing)
 
 
 @router.get("/{id}/{category}")
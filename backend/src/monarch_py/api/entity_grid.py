@@ -12,7 +12,7 @@ from enum import Enum
 from typing import List
 from fastapi import APIRouter, HTTPException, Query, Path
 
-from monarch_py.api.config import solr
+from monarch_py.api.config import solr_async
 from monarch_py.datamodels.model import EntityGridResponse
 from monarch_py.datamodels.category_enums import AssociationCategory, EntityCategory
 from monarch_py.utils.association_type_utils import AssociationTypeMappings
@@ -38,7 +38,7 @@ router = APIRouter(
 )
 
 
-def _validate_entity_category(entity_id: str, expected_category: EntityCategory) -> None:
+async def _validate_entity_category(entity_id: str, expected_category: EntityCategory) -> None:
     """Validate that an entity exists and has the expected category.
 
     Args:
@@ -48,9 +48,9 @@ def _validate_entity_category(entity_id: str, expected_category: EntityCategory)
     Raises:
         HTTPException: If entity not found or wrong category
     """
-    solr_impl = solr()
+    solr_impl = solr_async()
     try:
-        entity = solr_impl.get_entity(entity_id, extra=False)
+        entity = await solr_impl.get_entity(entity_id, extra=False)
         if entity is None:
             raise HTTPException(
                 status_code=404,
@@ -83,7 +83,7 @@ def _validate_entity_category(entity_id: str, expected_category: EntityCategory)
         )
 
 
-def _get_grid(
+async def _get_grid(
     context_id: str,
     grid_type: str,
     direct: bool,
@@ -103,9 +103,9 @@ def _get_grid(
     Raises:
         HTTPException: On errors
     """
-    solr_impl = solr()
+    solr_impl = solr_async()
     try:
-        return solr_impl.get_entity_grid(
+        return await solr_impl.get_entity_grid(
             context_id=context_id,
             grid_type=grid_type,
             direct_only=direct,
@@ -153,8 +153,8 @@ async def get_case_phenotype_grid(
 
     The context_id must be a disease ID (e.g., MONDO:0007078).
     """
-    _validate_entity_category(context_id, EntityCategory.DISEASE)
-    return _get_grid(context_id, "case-phenotype", direct, limit)
+    await _validate_entity_category(context_id, EntityCategory.DISEASE)
+    return await _get_grid(context_id, "case-phenotype", direct, limit)
 
 
 @router.get(
@@ -194,8 +194,8 @@ async def get_disease_phenotype_grid(
 
     The context_id must be a gene ID (e.g., HGNC:4851).
     """
-    _validate_entity_category(context_id, EntityCategory.GENE)
-    return _get_grid(context_id, "disease-phenotype", direct, limit)
+    await _validate_entity_category(context_id, EntityCategory.GENE)
+    return await _get_grid(context_id, "disease-phenotype", direct, limit)
 
 
 @router.get(
@@ -235,8 +235,8 @@ async def get_ortholog_phenotype_grid(
 
     The context_id must be a gene ID (e.g., HGNC:4851).
     """
-    _validate_entity_category(context_id, EntityCategory.GENE)
-    return _get_grid(context_id, "ortholog-phenotype", direct, limit)
+    await _validate_entity_category(context_id, EntityCategory.GENE)
+    return await _get_grid(context_id, "ortholog-phenotype", direct, limit)
 
 
 # =============================================================================
@@ -310,14 +310,14 @@ async def get_generic_entity_grid(
     This endpoint dynamically constructs a grid based on the specified
     association categories, allowing flexible exploration of relationships.
     """
-    solr_impl = solr()
+    solr_impl = solr_async()
 
     # Convert enum values to strings
     column_categories = [cat.value for cat in column_association_category]
     row_categories = [cat.value for cat in row_association_category]
 
     try:
-        return solr_impl.get_generic_entity_grid(
+        return await solr_impl.get_generic_entity_grid(
             context_id=context_id,
             column_assoc_categories=column_categories,
             row_assoc_categories=row_categories,
@@ -2,7 +2,7 @@ from typing import Union
 
 from fastapi import APIRouter, HTTPException, Path, Query, Response
 
-from monarch_py.api.config import solr
+from monarch_py.api.config import solr_async
 from monarch_py.api.additional_models import OutputFormat
 from monarch_py.datamodels.model import HistoPheno
 from monarch_py.utils.format_utils import to_tsv
@@ -26,7 +26,7 @@ async def _get_histopheno(
     ),
 ) -> Union[HistoPheno, str]:
     """Retrieves the entity with the specified id"""
-    response = solr().get_histopheno(id)
+    response = await solr_async().get_histopheno(id)
     if response is None:
         raise HTTPException(status_code=404, detail="Entity not found")
     if format == OutputFormat.json:
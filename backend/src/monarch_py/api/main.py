@@ -3,6 +3,7 @@ import uvicorn
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
+from loguru import logger
 
 from monarch_py.api import (
     association,
@@ -17,24 +18,31 @@ from monarch_py.api import (
     sources_versions,
     text_annotation,
 )
-from monarch_py.api.config import semsimian, spacyner, settings
+from monarch_py.api.config import ducksim, node_cache, settings, solr_async
 from monarch_py.api.middleware.logging_middleware import LoggingMiddleware
+from monarch_py.service.solr_transport import aclose_transports, transport_stats
 from monarch_py.utils.utils import get_release_metadata, get_release_versions
 
 PREFIX = "/v3/api"
 
-app = FastAPI(
-    docs_url="/v3/docs",
-    redoc_url="/v3/redoc",
-)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    semsimian()
-    spacyner()
-    # oak()
+    # semsimian(), spacyner() and oak() stay lazy: loading them here would make every worker's
+    # startup depend on the semsim server and the spaCy model download.
+    try:
+        await solr_async().prefetch_relation_labels()
+    except Exception:
+        logger.opt(exception=True).warning("Could not prefetch relation labels; they will be resolved on first use")
     yield
+    await aclose_transports()
+
+
+app = FastAPI(
+    docs_url="/v3/docs",
+    redoc_url="/v3/redoc",
+    lifespan=lifespan,
+)
 
 
 app.include_router(association.router, prefix=f"{PREFIX}/association")
@@ -98,6 +106,19 @@ async def _version():
     }
 
 
+@app.get(f"{PREFIX}/stats", include_in_schema=False)
+async def _stats():
+    """Operational counters for this worker (connection pool utilisation, etc.)"""
+    stats = {
+        "solr_pools": transport_stats(),
+        "node_cache": node_cache().stats(),
+    }
+    if ducksim.cache_info().currsize:  # only once this worker has loaded the ducksim engine
+        stats["ducksim_cache"] = ducksim().engine.cache_stats()
+        stats["ducksim_pool"] = ducksim().engine.pool_stats()
+    return stats
+
+
 def run():
     uvicorn.run("monarch_py.api.main:app", host="127.0.0.1", port=8000, reload=True)
 
@@ -6,7 +6,7 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from monarch_py.api.config import solr
+from monarch_py.api.config import solr_async
 
 router = APIRouter(tags=["meta"])
 
@@ -50,7 +50,7 @@ async def get_meta_page(entity_id: str, request: Request) -> HTMLResponse:
     Raises:
         HTTPException: 404 if entity not found
     """
-    entity = solr().get_entity(entity_id, extra=False)
+    entity = await solr_async().get_entity(entity_id, extra=False)
     if entity is None:
         raise HTTPException(status_code=404, detail=f"Entity not found: {entity_id}")
 
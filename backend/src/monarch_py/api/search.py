@@ -3,7 +3,7 @@ from typing import List, Union
 from fastapi import APIRouter, Depends, Query, Response
 
 from monarch_py.api.additional_models import OutputFormat, PaginationParams
-from monarch_py.api.config import solr
+from monarch_py.api.config import solr_async
 from monarch_py.datamodels.model import SearchResults, MappingResults
 from monarch_py.datamodels.category_enums import EntityCategory, MappingPredicate
 from monarch_py.utils.format_utils import to_tsv
@@ -36,7 +36,7 @@ async def search(
     facet_fields = ["category", "in_taxon_label"]
     if category is None:
         category = []
-    response = solr().search(
+    response = await solr_async().search(
         q=q or "*:*",
         category=category,
         in_taxon_label=in_taxon_label,
@@ -65,7 +65,7 @@ async def autocomplete(
     Returns:
         SearchResults
     """
-    response = solr().autocomplete(q=q)
+    response = await solr_async().autocomplete(q=q)
     return response
 
 
@@ -83,7 +83,7 @@ async def mappings(
         examples=["json", "tsv"],
     ),
 ):
-    response = solr().get_mappings(
+    response = await solr_async().get_mappings(
         entity_id=entity_id,
         subject_id=subject_id,
         predicate_id=predicate_id,
@@ -1,10 +1,14 @@
 from typing import Optional
 
-from fastapi import APIRouter, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi.responses import StreamingResponse
 
 from monarch_py.api.additional_models import (
+    SemsimBatchSearchRequest,
     SemsimCompareRequest,
     SemsimMetric,
+    SemsimSearchPage,
+    SemsimSearchPageRequest,
     SemsimSearchRequest,
     SemsimSearchGroup,
     SemsimMultiCompareRequest,
@@ -177,3 +181,123 @@ def _post_search(request: SemsimSearchRequest, engine: Optional[str] = EnginePar
         directionality=request.directionality,
         limit=request.limit,
     )
+
+
+def _deep_search_service(engine: Optional[str]):
+    """Paginated, streamed and batch search are only implemented by the ducksim backend."""
+    service = semsim_service(engine)
+    if not hasattr(service, "search_page"):
+        raise HTTPException(
+            status_code=501, detail="Paginated, streamed and batch search need the ducksim backend (?engine=ducksim)"
+        )
+    return service
+
+
+@router.post("/search/pages")
+def _post_search_pages(request: SemsimSearchPageRequest, engine: Optional[str] = EngineParam) -> SemsimSearchPage:
+    """
+        Search for terms in a termset, a page at a time, through the top `depth` results <br>
+        The ranking is computed once and held briefly on the server; follow `next_cursor` with
+        GET /semsim/search/pages?cursor=... (or repeat this request with a new `offset`) for later pages. <br>
+        <br>
+        Example: <br>
+    <pre>
+    {
+      "termset": ["HP:0002104", "HP:0012378"],
+      "group": "Human Diseases",
+      "metric": "ancestor_information_content",
+      "depth": 5000,
+      "offset": 0,
+      "limit": 100
+    }
+    </pre>
+    """
+    return _deep_search_service(engine).search_page(
+        termset=request.termset,
+        prefix=parse_similarity_prefix(request.group.value),
+        metric=request.metric,
+        directionality=request.directionality,
+        depth=request.depth,
+        offset=request.offset,
+        limit=request.limit,
+    )
+
+
+@router.get("/search/pages")
+def _search_pages(
+    cursor: str = Query(..., title="`next_cursor` of the previous page"),
+    engine: Optional[str] = EngineParam,
+) -> SemsimSearchPage:
+    """Get the next page of a paginated search
+
+    <b>Args:</b> <br>
+        cursor (str): `next_cursor` returned with the previous page
+
+    <b>Returns:</b> <br>
+        SemsimSearchPage: The next page of results, with a cursor for the page after it
+    """
+    service = _deep_search_service(engine)
+    try:
+        return service.search_page_at(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/search/stream")
+def _post_search_stream(request: SemsimSearchPageRequest, engine: Optional[str] = EngineParam):
+    """
+        Search for terms in a termset, streaming the top `depth` results (from `offset`) as
+        newline-delimited JSON, one SemsimSearchResult per line, best first. Results are enriched
+        `limit` at a time as the response is written. <br>
+        <br>
+        Example: <br>
+    <pre>
+    {
+      "termset": ["HP:0002104", "HP:0012378"],
+      "group": "Human Diseases",
+      "depth": 5000
+    }
+    </pre>
+    """
+    chunks = _deep_search_service(engine).search_stream(
+        termset=request.termset,
+        prefix=parse_similarity_prefix(request.group.value),
+        metric=request.metric,
+        directionality=request.directionality,
+        depth=request.depth,
+        offset=request.offset,
+        chunk=request.limit,
+    )
+    lines = ("".join(result.model_dump_json() + "\n" for result in chunk) for chunk in chunks)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@router.post("/search/batch")
+def _post_search_batch(request: SemsimBatchSearchRequest, engine: Optional[str] = EngineParam):
+    """
+        Search with many profiles (termsets) at once, streaming one line of newline-delimited JSON
+        per profile, in request order: `{"id": ..., "results": [SemsimSearchResult, ...]}`. <br>
+        Profiles are ranked exactly (no Hybrid prefilter), without per-result similarity detail; work
+        shared between profiles (closure lookups, scores for terms they have in common) is done once. <br>
+        At most 100 profiles of at most 500 terms each; search larger files with `monarch semsim-batch`. <br>
+        <br>
+        Example: <br>
+    <pre>
+    {
+      "profiles": [
+        {"id": "patient-1", "termset": ["HP:0002104", "HP:0012378"]},
+        {"id": "patient-2", "termset": ["HP:0001250", "HP:0001263", "HP:0012378"]}
+      ],
+      "group": "Human Diseases",
+      "limit": 20
+    }
+    </pre>
+    """
+    results = _deep_search_service(engine).batch_search(
+        request.profiles,
+        prefix=parse_similarity_prefix(request.group.value),
+        metric=request.metric,
+        directionality=request.directionality,
+        limit=request.limit,
+    )
+    return StreamingResponse((result.model_dump_json() + "\n" for result in results), media_type="application/x-ndjson")
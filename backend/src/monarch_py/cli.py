@@ -1,13 +1,18 @@
 import importlib
 import importlib.util
+import json
+import sys
+import tempfile
+import time
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
 
 from monarch_py import solr_cli, sql_cli
-from monarch_py.api.config import semsimian
-from monarch_py.api.additional_models import SemsimMetric
+from monarch_py.api.config import ducksim, semsimian, settings
+from monarch_py.api.additional_models import SemsimDirectionality, SemsimMetric, SemsimSearchGroup
+from monarch_py.api.utils.similarity_utils import parse_similarity_prefix
 from monarch_py.utils.solr_cli_utils import check_for_docker
 from monarch_py.utils.utils import (
     set_log_level,
@@ -15,6 +20,7 @@ from monarch_py.utils.utils import (
     get_release_versions,
 )
 from monarch_py.utils.format_utils import format_output
+from monarch_py.utils.semsim_batch_utils import ProfileFormat, profile_format, read_profiles, write_results
 from monarch_py.utils import cli_fields as fields
 
 
@@ -64,7 +70,7 @@ def callback(
             fg=typer.colors.YELLOW,
         )
         raise typer.Exit()
-    if ctx.invoked_subcommand != "compare":
+    if ctx.invoked_subcommand not in ("compare", "semsim-batch", "semsim-recall", "semsim-benchmark"):
         check_for_docker()
     set_log_level(log_level="DEBUG" if debug else "WARNING" if quiet else "INFO")
     return
@@ -143,6 +149,261 @@ def compare(
     format_output(fmt, response, output)
 
 
+@app.command("semsim-batch")
+def semsim_batch(
+    profiles: Annotated[
+        Path,
+        typer.Argument(
+            help="File of profiles: JSON Lines (an object with id and termset per line) or TSV (id, tab, comma separated terms)",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    group: Annotated[
+        SemsimSearchGroup,
+        typer.Option(
+            "--group",
+            "-g",
+            help="Group of entities to search within",
+        ),
+    ] = SemsimSearchGroup.MONDO,
+    metric: Annotated[
+        SemsimMetric,
+        typer.Option(
+            "--metric",
+            "-m",
+            help="The metric to use for comparison",
+        ),
+    ] = SemsimMetric.ANCESTOR_INFORMATION_CONTENT,
+    directionality: Annotated[
+        SemsimDirectionality,
+        typer.Option(
+            "--directionality",
+            help="Directionality of the search",
+        ),
+    ] = SemsimDirectionality.BIDIRECTIONAL,
+    limit: fields.LimitOption = 10,
+    input_format: Annotated[
+        Optional[ProfileFormat],
+        typer.Option(
+            "--input-format",
+            help="Format of the profiles file (default: from its extension; .tsv/.txt are TSV)",
+        ),
+    ] = None,
+    fmt: Annotated[
+        ProfileFormat,
+        typer.Option(
+            "--format",
+            "-f",
+            help="The format of the output: one JSON line per profile, or one TSV row per match",
+        ),
+    ] = ProfileFormat.jsonl,
+    output: fields.OutputOption = None,
+    kg: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--kg",
+            help="monarch-kg.duckdb to search (default: MONARCH_KG_DUCKDB_PATH)",
+        ),
+    ] = None,
+):
+    """Search with every profile in a file via ducksim, streaming the best matches of each to the output"""
+    if kg is not None:
+        settings.monarch_kg_duckdb_path = str(kg)
+    service = ducksim()
+    with open(profiles) as lines:
+        batch = list(read_profiles(lines, profile_format(profiles, input_format)))
+    start = time.perf_counter()
+    results = service.batch_search(
+        batch, prefix=parse_similarity_prefix(group.value), metric=metric, directionality=directionality, limit=limit
+    )
+    if output:
+        with open(output, "w") as out:
+            count = write_results(results, out, fmt)
+    else:
+        count = write_results(results, sys.stdout, fmt)
+    elapsed = time.perf_counter() - start
+    typer.secho(
+        f"{count} profiles in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.1f} profiles/s)",
+        fg=typer.colors.GREEN,
+        err=True,
+    )
+
+
+@app.command("semsim-recall")
+def semsim_recall(
+    profiles: Annotated[
+        Path,
+        typer.Argument(
+            help="File of profiles, as for semsim-batch",
+            exists=True,
+            dir_okay=False,
+        ),
+    ],
+    group: Annotated[
+        SemsimSearchGroup,
+        typer.Option(
+            "--group",
+            "-g",
+            help="Group of entities to search within",
+        ),
+    ] = SemsimSearchGroup.MONDO,
+    metric: Annotated[
+        SemsimMetric,
+        typer.Option(
+            "--metric",
+            "-m",
+            help="The metric to use for comparison",
+        ),
+    ] = SemsimMetric.ANCESTOR_INFORMATION_CONTENT,
+    directionality: Annotated[
+        SemsimDirectionality,
+        typer.Option(
+            "--directionality",
+            help="Directionality of the search",
+        ),
+    ] = SemsimDirectionality.BIDIRECTIONAL,
+    limit: fields.LimitOption = 10,
+    input_format: Annotated[
+        Optional[ProfileFormat],
+        typer.Option(
+            "--input-format",
+            help="Format of the profiles file (default: from its extension; .tsv/.txt are TSV)",
+        ),
+    ] = None,
+    output: fields.OutputOption = None,
+    kg: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--kg",
+            help="monarch-kg.duckdb to search (default: MONARCH_KG_DUCKDB_PATH)",
+        ),
+    ] = None,
+):
+    """Report recall at the limit and latency of ducksim hybrid search, with each candidate prefilter, against full search"""
+    from monarch_py.utils.semsim_benchmark_utils import candidate_recall
+
+    if kg is not None:
+        settings.monarch_kg_duckdb_path = str(kg)
+    settings.ducksim_minhash = settings.ducksim_embedding = True
+    engine = ducksim().engine
+    with open(profiles) as lines:
+        termsets = [p.termset for p in read_profiles(lines, profile_format(profiles, input_format))]
+    report = candidate_recall(
+        engine,
+        termsets,
+        k=limit,
+        prefix=parse_similarity_prefix(group.value),
+        metric=metric.value,
+        direction=directionality.value,
+    )
+    format_output(fields.OutputFormat.json, report, output)
+
+
+@app.command("semsim-benchmark")
+def semsim_benchmark(
+    kg: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--kg",
+            help="monarch-kg.duckdb to benchmark (default: a synthetic KG generated from the options below)",
+            exists=True,
+            dir_okay=False,
+        ),
+    ] = None,
+    terms: Annotated[int, typer.Option("--terms", help="Synthetic ontology: number of terms")] = 5000,
+    depth: Annotated[int, typer.Option("--depth", help="Synthetic ontology: number of levels")] = 8,
+    entities: Annotated[int, typer.Option("--entities", help="Synthetic KG: number of annotated entities")] = 1000,
+    phenotypes: Annotated[
+        int, typer.Option("--phenotypes", help="Synthetic KG: mean number of phenotypes per entity")
+    ] = 10,
+    seed: Annotated[int, typer.Option("--seed", help="Seed for the synthetic KG and the sampled profiles")] = 0,
+    sizes: Annotated[
+        str, typer.Option("--sizes", help="Comma separated profile sizes (number of terms) to measure")
+    ] = "1,5,10,20",
+    queries: Annotated[int, typer.Option("--queries", help="Profiles measured per size")] = 20,
+    group: Annotated[
+        SemsimSearchGroup,
+        typer.Option(
+            "--group",
+            "-g",
+            help="Group of entities to search within",
+        ),
+    ] = SemsimSearchGroup.MONDO,
+    metric: Annotated[
+        SemsimMetric,
+        typer.Option(
+            "--metric",
+            "-m",
+            help="The metric to use for comparison",
+        ),
+    ] = SemsimMetric.ANCESTOR_INFORMATION_CONTENT,
+    limit: fields.LimitOption = 10,
+    output: fields.OutputOption = None,
+    baseline: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--baseline",
+            help="Report of an earlier run to compare against; exits with status 1 on a regression",
+            exists=True,
+            dir_okay=False,
+        ),
+    ] = None,
+    latency_tolerance: Annotated[
+        float, typer.Option("--latency-tolerance", help="Fraction a median latency may grow over the baseline")
+    ] = 0.25,
+    recall_tolerance: Annotated[
+        float, typer.Option("--recall-tolerance", help="How far a mean recall may drop below the baseline")
+    ] = 0.05,
+):
+    """Benchmark ducksim compare, multi-compare, full, top-k and hybrid search latency, peak memory and hybrid recall, as JSON"""
+    from monarch_py.service.ducksim import Ducksim
+    from monarch_py.utils.semsim_benchmark_utils import environment, regressions, run_benchmark, synthetic_kg
+
+    with tempfile.TemporaryDirectory() as scratch:
+        report = {"environment": environment()}
+        if kg is None:
+            kg = Path(scratch) / "synthetic-kg.duckdb"
+            shape = synthetic_kg(kg, terms=terms, depth=depth, entities=entities, phenotypes=phenotypes, seed=seed)
+            report["kg"] = {"synthetic": shape}
+        else:
+            report["kg"] = {"path": str(kg)}
+        start = time.perf_counter()
+        engine = Ducksim.from_duckdb(
+            str(kg),
+            memory_limit=settings.ducksim_memory_limit,
+            threads=settings.ducksim_threads,
+            page_cache_size=0,
+            minhash=True,
+            embedding=True,
+        )
+        report["load_seconds"] = round(time.perf_counter() - start, 3)
+        report.update(
+            run_benchmark(
+                engine,
+                sizes=[int(size) for size in sizes.split(",")],
+                queries=queries,
+                k=limit,
+                prefix=parse_similarity_prefix(group.value),
+                metric=metric.value,
+                seed=seed,
+            )
+        )
+        engine.con.close()
+    format_output(fields.OutputFormat.json, report, output)
+    if baseline is not None:
+        found = regressions(
+            json.loads(baseline.read_text()),
+            report,
+            latency_tolerance=latency_tolerance,
+            recall_tolerance=recall_tolerance,
+        )
+        for regression in found:
+            typer.secho(regression, fg=typer.colors.RED, err=True)
+        if found:
+            raise typer.Exit(1)
+
+
 ### CLI Commands for Release Info ###
 
 
@@ -92,6 +92,7 @@ class SolrQuery(BaseModel):
     filter_queries: Optional[List[str]] = Field(default_factory=list)
     facet_mincount: int = 1
     query_fields: Optional[str] = None
+    field_list: Optional[str] = None
     def_type: str = "edismax"
     q_op: str = "AND"  # See SOLR-8812, need this plus mm=100% to allow boolean operators in queries
     mm: str = "100%"  # All tokens in the query must be found in the doc
@@ -137,6 +138,8 @@ class SolrQuery(BaseModel):
             return "facet.mincount"
         elif value == "query_fields":
             return "qf"
+        elif value == "field_list":
+            return "fl"
         elif value == "def_type":
             return "defType"
         elif value == "q_op":
@@ -0,0 +1,611 @@
+"""asyncio counterpart of SolrImplementation for the `async def` API routes.
+
+The API routes are `async def`, so a blocking Solr round-trip inside one stalls the whole event
+loop — every other request on the worker waits behind it. AsyncSolrImplementation issues the same
+queries as SolrImplementation over `AsyncSolrService` (a pooled `httpx.AsyncClient`), and reuses
+SolrImplementation's query builders and pure helpers so that the two stay in lock-step: only the
+Solr I/O differs between them.
+
+Only the methods the async routes need are implemented; the CLI and the sync routes (e.g. the
+association table export) keep using SolrImplementation.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, ClassVar, Dict, List, Optional, Union
+
+from monarch_py.datamodels.category_enums import (
+    AssociationCategory,
+    AssociationPredicate,
+    EntityCategory,
+    MappingPredicate,
+)
+from monarch_py.datamodels.grid_configs import get_grid_config
+from monarch_py.datamodels.grid_groupings import get_row_grouping
+from monarch_py.datamodels.model import (
+    AssociationCountList,
+    AssociationResults,
+    CasePhenotypeMatrixResponse,
+    CategoryGroupedAssociationResults,
+    CompactAssociation,
+    CrossSpeciesTermClique,
+    Entity,
+    EntityGridResponse,
+    HistoPheno,
+    MappingResults,
+    MultiEntityAssociationResults,
+    Node,
+    NodeHierarchy,
+    NodeRelationship,
+    SearchResults,
+)
+from monarch_py.datamodels.solr import core
+from monarch_py.implementations.solr.solr_implementation import SolrImplementation, logger
+from monarch_py.implementations.solr.solr_parsers import (
+    parse_association_batch,
+    parse_association_counts,
+    parse_associations,
+    parse_autocomplete,
+    parse_entity,
+    parse_histopheno,
+    parse_mappings,
+    parse_search,
+)
+from monarch_py.implementations.solr.solr_query_utils import (
+    ENTITY_FIELDS,
+    build_association_batch_query,
+    build_association_counts_query,
+    build_autocomplete_query,
+    build_case_disease_query,
+    build_case_phenotype_query,
+    build_entity_lookup_query,
+    build_grid_column_query,
+    build_grid_row_query,
+    build_histopheno_query,
+    build_mapping_query,
+    build_multi_entity_association_query,
+    build_search_query,
+)
+from monarch_py.service.solr_service import AsyncSolrService
+from monarch_py.service.solr_stream import aiter_docs, stream_params
+from monarch_py.service.solr_transport import get_async_transport
+from monarch_py.utils.case_phenotype_utils import CasePhenotypeMatrixBuilder
+from monarch_py.utils.entity_grid_utils import EntityGridBuilder
+
+# Pure helpers (no Solr I/O) are borrowed from the sync implementation rather than re-implemented.
+_sync = SolrImplementation
+
+
+async def gather_timed(lookups: Dict[str, Awaitable], timings: Dict[str, float]) -> Dict[str, Any]:
+    """Await `lookups` concurrently, returning their results by name and recording each one's
+    wall time in milliseconds into `timings`.
+
+    Concurrency is bounded by the Solr transport's connection pool (SOLR_POOL_SIZE): lookups beyond
+    it queue for a free connection rather than opening more."""
+
+    async def _timed(name: str, awaitable: Awaitable):
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    results = await asyncio.gather(*(_timed(name, awaitable) for name, awaitable in lookups.items()))
+    return dict(zip(lookups, results))
+
+
+async def feed(builder: Union[CasePhenotypeMatrixBuilder, EntityGridBuilder], docs: AsyncIterator[dict]):
+    """Fold a stream of documents into a matrix or grid builder as they are decoded"""
+    async for doc in docs:
+        builder.add(doc)
+
+
+@dataclass
+class AsyncSolrImplementation:
+    """Awaitable Solr-backed implementation of the entity, association and search lookups"""
+
+    base_url: str = os.getenv("MONARCH_SOLR_URL", "http://localhost:8983/solr")
+
+    # In-flight relation label lookups, by relation CURIE
+    _relation_label_lookups: ClassVar[Dict[str, asyncio.Future]] = {}
+
+    async def solr_is_available(self) -> bool:
+        """Check if the Solr instance is available"""
+        try:
+            return (await get_async_transport(self.base_url).get(self.base_url)).status_code == 200
+        except Exception:
+            return False
+
+    async def get_index_version(self) -> str:
+        """Version of the loaded index: the Lucene index versions of the cores a `Node` is built from.
+
+        Unlike MONARCH_KG_VERSION (fixed when the worker starts), this changes as soon as a new KG is
+        loaded into Solr, and stays the same across Solr and API restarts on the same index."""
+        cores = [core.ENTITY, core.ASSOCIATION, core.SSSOM]
+
+        async def _version(solr_core: core) -> str:
+            url = f"{self.base_url}/{solr_core.value}/admin/luke?numTerms=0&show=index&wt=json"
+            response = await get_async_transport(self.base_url, solr_core.value).get(url)
+            response.raise_for_status()
+            return str(response.json()["index"]["version"])
+
+        return "solr-" + ".".join(await asyncio.gather(*(_version(solr_core) for solr_core in cores)))
+
+    ##########
+    # Entity #
+    ##########
+
+    async def get_entity(
+        self, id: str, extra: bool, timings: Optional[Dict[str, float]] = None
+    ) -> Optional[Union[Node, Entity]]:
+        """Retrieve a specific entity by exact ID match, with optional extras (see SolrImplementation.get_entity)
+
+        The extras only depend on the entity document, not on each other, so they are fetched
+        concurrently: the header costs roughly its slowest lookup rather than the sum of them all.
+        The small association lookups behind the header (inheritance, causal genes, Mondo
+        relationships, hierarchy) share a single batched Solr request.
+        Pass a dict as `timings` to have it filled with the wall time (ms) of each lookup.
+        """
+        timings = {} if timings is None else timings
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ENTITY)
+        solr_document = (await gather_timed({"entity": solr.get(id, fields=ENTITY_FIELDS)}, timings))["entity"]
+        if solr_document is None:
+            return None
+        if not extra:
+            return parse_entity(solr_document)
+
+        entity = _sync._entity_from_document(solr_document)
+        results = await gather_timed(
+            {
+                "header_associations": self.get_association_batch(self._header_association_filters(entity)),
+                "cross_species_term_clique": self._get_cross_species_term_clique(entity),
+                "association_counts": self.get_association_counts(id, entity_category=entity.category),
+                "mappings": self._get_mapped_entities(entity),
+            },
+            timings,
+        )
+        header = results["header_associations"]
+
+        mode_of_inheritance_associations = header.get("mode_of_inheritance")
+        if mode_of_inheritance_associations is not None and len(mode_of_inheritance_associations.items) == 1:
+            entity.inheritance = _sync._get_counterpart_entity(mode_of_inheritance_associations.items[0], entity)
+        if "causal_gene" in header:
+            entity.causal_gene = _sync._deduplicate_entities(
+                _sync._get_counterpart_entity(association, entity) for association in header["causal_gene"].items
+            )
+        if "causes_disease" in header:
+            entity.causes_disease = _sync._deduplicate_entities(
+                _sync._get_counterpart_entity(association, entity) for association in header["causes_disease"].items
+            )
+        if "node_relationships" in header:
+            relationships = self._node_relationships(entity, header["node_relationships"].items)
+            entity.node_relationships = (await gather_timed({"relation_labels": relationships}, timings))[
+                "relation_labels"
+            ]
+        logger.debug(f"get_entity({id}) lookup timings (ms): {timings}")
+        return _sync._build_node(
+            entity,
+            cross_species_term_clique=results["cross_species_term_clique"],
+            node_hierarchy=NodeHierarchy(
+                super_classes=[_sync._get_counterpart_entity(a, entity) for a in header["super_classes"].items],
+                sub_classes=[_sync._get_counterpart_entity(a, entity) for a in header["sub_classes"].items],
+            ),
+            association_counts=results["association_counts"].items,
+            mappings=results["mappings"],
+        )
+
+    @staticmethod
+    def _header_association_filters(entity: Entity) -> Dict[str, dict]:
+        """get_associations filters for every association lookup behind the node header, by name"""
+        filters = {
+            "super_classes": dict(subject=entity.id, predicate=[AssociationPredicate.SUBCLASS_OF], limit=1000),
+            "sub_classes": dict(object=entity.id, predicate=[AssociationPredicate.SUBCLASS_OF], limit=1000),
+        }
+        causal = dict(
+            predicate=[AssociationPredicate.CAUSES], category=[AssociationCategory.CAUSAL_GENE_TO_DISEASE_ASSOCIATION]
+        )
+        if "biolink:Disease" == entity.category:
+            filters["mode_of_inheritance"] = dict(
+                subject=entity.id, predicate=[AssociationPredicate.HAS_MODE_OF_INHERITANCE]
+            )
+            filters["causal_gene"] = dict(object=entity.id, **causal)
+            filters["node_relationships"] = _sync._node_relationship_filters(entity)
+        if "biolink:Gene" == entity.category:
+            filters["causes_disease"] = dict(subject=entity.id, **causal)
+            filters["node_relationships"] = _sync._node_relationship_filters(entity)
+        for lookup in filters.values():
+            lookup["direct"] = True
+        return filters
+
+    async def _get_mapped_entities(self, this_entity: Entity) -> list:
+        return _sync._mapped_entity_curies(this_entity, await self.get_mappings(entity_id=this_entity.id))
+
+    async def _node_relationships(self, this_entity: Entity, associations: list) -> List[NodeRelationship]:
+        """NodeRelationships from this_entity's Mondo related_to associations, resolving each relation's label"""
+        associations = _sync._curated_node_relationship_associations(this_entity, associations)
+        relations = list(dict.fromkeys(a.original_predicate or a.predicate for a in associations))
+        labels = dict(zip(relations, await asyncio.gather(*(self._get_relation_label(r) for r in relations))))
+        return _sync._build_node_relationships(this_entity, associations, labels)
+
+    async def _get_relation_label(self, relation: str) -> Optional[str]:
+        """KG label of an RO relation, sharing SolrImplementation's process-level label cache.
+        Concurrent misses for the same relation share one in-flight lookup."""
+        cache = _sync._relation_label_cache
+        if relation in cache:
+            return cache[relation]
+        lookup = self._relation_label_lookups.get(relation)
+        if lookup is None or lookup.get_loop() is not asyncio.get_running_loop():
+            lookup = asyncio.ensure_future(self._lookup_relation_label(relation))
+            self._relation_label_lookups[relation] = lookup
+            lookup.add_done_callback(lambda done: self._forget_relation_label_lookup(relation, done))
+        # shielded, so one cancelled request doesn't cancel the lookup the others are waiting on
+        return await asyncio.shield(lookup)
+
+    @classmethod
+    def _forget_relation_label_lookup(cls, relation: str, lookup: asyncio.Future):
+        if cls._relation_label_lookups.get(relation) is lookup:
+            del cls._relation_label_lookups[relation]
+
+    async def _lookup_relation_label(self, relation: str) -> Optional[str]:
+        # Only definitive results are memoized; see SolrImplementation._get_relation_label
+        try:
+            relation_entity = await self.get_entity(relation, extra=False)
+        except Exception:
+            logger.warning(f"Could not resolve label for relation {relation}", exc_info=True)
+            return None
+        relation_label = relation_entity.name if relation_entity is not None else None
+        _sync._relation_label_cache[relation] = relation_label
+        return relation_label
+
+    async def prefetch_relation_labels(self, relations: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+        """Resolve and memoize relation labels in one Solr query (see SolrImplementation.prefetch_relation_labels)"""
+        relations = list(relations or _sync.MONDO_HEADER_RELATIONS)
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ENTITY)
+        return _sync._cache_relation_labels(relations, await solr.query(build_entity_lookup_query(relations)))
+
+    async def get_counterpart_entities(
+        self,
+        this_entity: Entity,
+        entity: Optional[str] = None,
+        subject: Optional[str] = None,
+        subject_category: Optional[List[EntityCategory]] = None,
+        subject_namespace: Optional[List[str]] = None,
+        predicate: List[AssociationPredicate] = None,
+        object: Optional[str] = None,
+        object_category: Optional[List[EntityCategory]] = None,
+        object_namespace: Optional[List[str]] = None,
+    ) -> List[Entity]:
+        """Entities directly associated with this_entity (see SolrImplementation.get_counterpart_entities)"""
+        associations = await self.get_associations(
+            entity=entity,
+            subject=subject,
+            subject_category=subject_category,
+            subject_namespace=subject_namespace,
+            predicate=predicate,
+            object=object,
+            object_category=object_category,
+            object_namespace=object_namespace,
+            direct=True,
+            limit=1000,
+            offset=0,
+        )
+        return [_sync._get_counterpart_entity(association, this_entity) for association in associations.items]
+
+    async def _get_cross_species_term_clique(self, entity: Entity) -> Optional[CrossSpeciesTermClique]:
+        is_root_term = _sync._is_cross_species_root(entity.id)
+        if not is_root_term and not _sync._is_species_specific(entity.id):
+            return None
+
+        if is_root_term:
+            root_term = entity
+        else:
+            root_term = await self._find_cross_species_parent(entity)
+            if root_term is None:
+                return None
+        children = await self._get_species_specific_children(root_term.id)
+        if not children:
+            return None
+
+        child_ids = [c.id for c in children]
+        lookups = [
+            self.get_associations(
+                subject=child_ids,
+                object=[root_term.id],
+                predicate=[AssociationPredicate.SUBCLASS_OF],
+                direct=True,
+                limit=500,
+            )
+        ]
+        if len(child_ids) > 1:
+            lookups.append(
+                self.get_associations(subject=child_ids, predicate=_sync.SIDEWAYS_PREDICATES, direct=True, limit=500)
+            )
+        vertical, *sideways = await asyncio.gather(*lookups)
+        vertical_assocs = vertical.items
+        all_sideways = sideways[0].items if sideways else []
+        return _sync._assemble_cross_species_term_clique(root_term, children, vertical_assocs, all_sideways)
+
+    async def _find_cross_species_parent(self, entity: Entity) -> Optional[Entity]:
+        parents = await self.get_counterpart_entities(
+            this_entity=entity,
+            subject=entity.id,
+            predicate=[AssociationPredicate.SUBCLASS_OF],
+        )
+        cross_species_parents = [p for p in parents if _sync._is_cross_species_root(p.id)]
+        return cross_species_parents[0] if cross_species_parents else None
+
+    async def _get_species_specific_children(self, root_id: str) -> List[Entity]:
+        all_children = await self.get_counterpart_entities(
+            this_entity=Entity(id=root_id),
+            object=root_id,
+            predicate=[AssociationPredicate.SUBCLASS_OF],
+        )
+        return [c for c in all_children if _sync._is_species_specific(c.id)]
+
+    ################
+    # Associations #
+    ################
+
+    async def get_associations(self, compact: bool = False, **filters) -> Union[AssociationResults, CompactAssociation]:
+        """Retrieve paginated association records; accepts the filters of SolrImplementation.get_associations"""
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ASSOCIATION)
+        query_result = await solr.query(_sync._association_query(**filters))
+        return parse_associations(query_result, compact, filters.get("offset", 0), filters.get("limit", 20))
+
+    async def get_association_batch(self, lookups: Dict[str, dict]) -> Dict[str, AssociationResults]:
+        """Run several small get_associations lookups, each given as its filter kwargs, in one Solr request
+
+        Lookups must be unsorted, unpaged filter queries (no `q`, `sort` or `offset`).
+        """
+        queries = {name: _sync._association_query(**filters) for name, filters in lookups.items()}
+        query_result = await self._raw_solr_query(build_association_batch_query(queries))
+        return parse_association_batch(query_result, queries)
+
+    async def get_histopheno(self, subject: Optional[str] = None) -> HistoPheno:
+        """Get histopheno counts for a given subject_closure"""
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ASSOCIATION)
+        query_result = await solr.query(build_histopheno_query(subject))
+        return parse_histopheno(query_result, subject)
+
+    async def get_multi_entity_associations(
+        self,
+        entity: List[str],
+        counterpart_category: Optional[List[str]] = None,
+        offset: int = 0,
+        limit_per_group: int = 20,
+    ) -> List[MultiEntityAssociationResults]:
+        """Associations between multiple entities and counterparts of the given categories"""
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ASSOCIATION)
+        results = []
+        for entity_id in entity:
+            ent = await self.get_entity(entity_id, extra=False)
+            if ent is None:
+                results.append(
+                    MultiEntityAssociationResults(
+                        id=entity_id, name="Entity not found", total=0, offset=0, limit=0, associated_categories=[]
+                    )
+                )
+                continue
+            entity_result = MultiEntityAssociationResults(
+                id=ent.id, name=ent.name, total=0, offset=offset, limit=limit_per_group, associated_categories=[]
+            )
+            for category in counterpart_category or []:
+                query = build_multi_entity_association_query(
+                    entity=ent.id, counterpart_category=category, offset=offset, limit=limit_per_group
+                )
+                associations = parse_associations(await solr.query(query))
+                entity_result.associated_categories.append(
+                    CategoryGroupedAssociationResults(
+                        counterpart_category=category,
+                        items=associations.items,
+                        total=associations.total,
+                        offset=associations.offset,
+                        limit=associations.limit,
+                    )
+                )
+                entity_result.total += associations.total
+            results.append(entity_result)
+        return results
+
+    async def get_association_counts(self, entity: str, entity_category: Optional[str] = None) -> AssociationCountList:
+        """Get list of association counts for a given entity (and, for genes, its orthologs)"""
+        entities = [entity]
+        if entity_category == "biolink:Gene":
+            ortholog_associations = await self.get_associations(**_sync._ortholog_filters(entity))
+            entities.extend(_sync._counterpart_ids(entity, ortholog_associations.items))
+
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ASSOCIATION)
+        query_result = await solr.query(build_association_counts_query(entities))
+        return parse_association_counts(query_result, entities)
+
+    async def get_mappings(
+        self,
+        entity_id: Optional[List[str]] = None,
+        subject_id: Optional[List[str]] = None,
+        predicate_id: Optional[List[MappingPredicate]] = None,
+        object_id: Optional[List[str]] = None,
+        mapping_justification: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> MappingResults:
+        solr = AsyncSolrService(base_url=self.base_url, core=core.SSSOM)
+        query = build_mapping_query(
+            entity_id=[entity_id] if isinstance(entity_id, str) else entity_id,
+            subject_id=[subject_id] if isinstance(subject_id, str) else subject_id,
+            predicate_id=[p.value for p in predicate_id] if predicate_id else None,
+            object_id=[object_id] if isinstance(object_id, str) else object_id,
+            mapping_justification=(
+                [mapping_justification] if isinstance(mapping_justification, str) else mapping_justification
+            ),
+            offset=offset,
+            limit=limit,
+        )
+        return parse_mappings(await solr.query(query), offset, limit)
+
+    ##########
+    # Search #
+    ##########
+
+    async def search(
+        self,
+        q: str = "*:*",
+        category: Union[List[EntityCategory], None] = None,
+        in_taxon_label: Union[List[str], None] = None,
+        facet_fields: Union[List[str], None] = None,
+        facet_queries: Union[List[str], None] = None,
+        filter_queries: Union[List[str], None] = None,
+        sort: Optional[str] = None,
+        highlighting: bool = False,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> SearchResults:
+        """Search for entities by label, with optional filters"""
+        query = build_search_query(
+            q=q,
+            category=[c.value for c in category] if category else None,
+            in_taxon_label=in_taxon_label,
+            facet_fields=facet_fields,
+            facet_queries=facet_queries,
+            filter_queries=filter_queries,
+            highlighting=highlighting,
+            sort=sort,
+            offset=offset,
+            limit=limit,
+        )
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ENTITY)
+        return parse_search(await solr.query(query))
+
+    async def autocomplete(
+        self, q: str, category: List[EntityCategory] = None, prioritized_predicates: List[AssociationPredicate] = None
+    ) -> SearchResults:
+        solr = AsyncSolrService(base_url=self.base_url, core=core.ENTITY)
+        query = build_autocomplete_query(
+            q,
+            category=[cat.value for cat in category] if category else None,
+            prioritized_predicates=prioritized_predicates,
+        )
+        return parse_autocomplete(await solr.query(query))
+
+    #########################
+    # Case-phenotype / grid #
+    #########################
+
+    async def get_case_phenotype_matrix(
+        self,
+        disease_id: str,
+        direct_only: bool = True,
+        limit: int = 200,
+    ) -> CasePhenotypeMatrixResponse:
+        """Fetch case-phenotype matrix for a disease (see SolrImplementation.get_case_phenotype_matrix)"""
+        case_result = await self._raw_solr_query(
+            build_case_disease_query(disease_id=disease_id, direct_only=direct_only, rows=limit + 1)
+        )
+        case_docs = case_result.get("response", {}).get("docs", [])
+        _sync._check_case_limit(case_docs, limit)
+        if not case_docs:
+            return _sync._empty_case_phenotype_matrix(disease_id, await self._get_entity_name(disease_id))
+
+        phenotype_params = build_case_phenotype_query(disease_id=disease_id, direct_only=direct_only)
+        builder = CasePhenotypeMatrixBuilder(disease_id, case_docs)
+        facet_counts = {}
+        _, disease_name = await asyncio.gather(
+            feed(builder, self._raw_solr_docs(phenotype_params, facet_counts)),
+            self._get_entity_name(disease_id),
+        )
+        return builder.build(disease_name, facet_counts.get("facet_queries", {}))
+
+    async def get_entity_grid(
+        self,
+        context_id: str,
+        grid_type: str,
+        direct_only: bool = True,
+        limit: int = 200,
+    ) -> EntityGridResponse:
+        """Fetch entity grid for any supported grid type (see SolrImplementation.get_entity_grid)"""
+        config = get_grid_config(grid_type)
+        grouping = get_row_grouping(config.row_entity_category.value)
+
+        col_result = await self._raw_solr_query(
+            build_grid_column_query(context_id=context_id, config=config, direct_only=direct_only, rows=limit + 1)
+        )
+        col_docs = col_result.get("response", {}).get("docs", [])
+        _sync._check_column_limit(col_docs, limit)
+        if not col_docs:
+            context_name = await self._get_entity_name(context_id)
+            return _sync._empty_entity_grid(context_id, context_name, config.context_category.value)
+
+        row_params = build_grid_row_query(
+            context_id=context_id, config=config, grouping=grouping, direct_only=direct_only
+        )
+        builder = EntityGridBuilder(context_id, config, grouping, col_docs)
+        facet_counts = {}
+        _, context_name = await asyncio.gather(
+            feed(builder, self._raw_solr_docs(row_params, facet_counts)),
+            self._get_entity_name(context_id),
+        )
+        return builder.build(context_name, config.context_category.value, facet_counts.get("facet_queries", {}))
+
+    async def get_generic_entity_grid(
+        self,
+        context_id: str,
+        column_assoc_categories: List[str],
+        row_assoc_categories: List[str],
+        row_grouping: str = "histopheno",
+        group_columns_by_category: bool = False,
+        direct_only: bool = True,
+        limit: int = 500,
+    ) -> EntityGridResponse:
+        """Fetch generic entity grid (see SolrImplementation.get_generic_entity_grid)"""
+        context_entity = await self.get_entity(context_id, extra=False)
+        if not context_entity:
+            raise ValueError(f"Context entity not found: {context_id}")
+        plan = _sync._plan_generic_entity_grid(
+            context_id,
+            context_entity,
+            column_assoc_categories,
+            row_assoc_categories,
+            row_grouping=row_grouping,
+            direct_only=direct_only,
+            limit=limit,
+        )
+
+        col_result = await self._raw_solr_query(plan.column_params)
+        col_docs = col_result.get("response", {}).get("docs", [])
+        _sync._check_column_limit(col_docs, limit)
+        if not col_docs:
+            context_name = await self._get_entity_name(context_id)
+            return _sync._empty_entity_grid(context_id, context_name, plan.context_category)
+
+        builder = EntityGridBuilder(context_id, plan.config, plan.grouping, col_docs)
+        facet_counts = {}
+        _, context_name = await asyncio.gather(
+            feed(builder, self._raw_solr_docs(plan.row_params, facet_counts)),
+            self._get_entity_name(context_id),
+        )
+        grid = builder.build(context_name, plan.context_category, facet_counts.get("facet_queries", {}))
+        return _sync._group_generic_grid_columns(plan, grid, group_columns_by_category)
+
+    async def _get_entity_name(self, entity_id: str) -> str:
+        """Entity name, or the ID if the name cannot be fetched"""
+        try:
+            entity = await self.get_entity(entity_id, extra=False)
+            return entity.name if entity and entity.name else entity_id
+        except Exception:
+            return entity_id
+
+    async def _raw_solr_query(self, params: dict) -> dict:
+        """Execute a raw Solr query with dictionary parameters against the association core"""
+        url = f"{self.base_url}/{core.ASSOCIATION.value}/select?{_sync._raw_query_string(params)}"
+        response = await get_async_transport(self.base_url, core.ASSOCIATION.value).get(url)
+        response.raise_for_status()
+        return response.json()
+
+    async def _raw_solr_docs(self, params: dict, facet_counts: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Stream the documents of a raw Solr query, decoded one at a time as they arrive, then fill
+        `facet_counts` (if given) with the response's facets (see SolrImplementation._raw_solr_docs)"""
+        url = f"{self.base_url}/{core.ASSOCIATION.value}/select?{_sync._raw_query_string(stream_params(params))}"
+        async with get_async_transport(self.base_url, core.ASSOCIATION.value).stream("GET", url) as response:
+            async for doc in aiter_docs(response, facet_counts):
+                yield doc
@@ -1,7 +1,8 @@
 import logging
 import os
+import threading
 from dataclasses import dataclass
-from typing import ClassVar, Dict, List, Union, Optional
+from typing import Any, ClassVar, Dict, Iterator, List, Union, Optional
 
 import requests
 from monarch_py.datamodels.model import (
@@ -23,7 +24,7 @@ from monarch_py.datamodels.model import (
     NodeRelationship,
     SearchResults,
 )
-from monarch_py.datamodels.solr import core
+from monarch_py.datamodels.solr import SolrQuery, core
 from monarch_py.datamodels.category_enums import (
     AssociationCategory,
     AssociationPredicate,
@@ -45,12 +46,14 @@ from monarch_py.implementations.solr.solr_parsers import (
     parse_search,
 )
 from monarch_py.implementations.solr.solr_query_utils import (
+    ENTITY_FIELDS,
     build_association_counts_query,
     build_association_query,
     build_association_table_query,
     build_autocomplete_query,
     build_case_disease_query,
     build_case_phenotype_query,
+    build_entity_lookup_query,
     build_grid_column_query,
     build_grid_row_query,
     build_histopheno_query,
@@ -64,8 +67,10 @@ from monarch_py.interfaces.entity_interface import EntityInterface
 from monarch_py.interfaces.search_interface import SearchInterface
 from monarch_py.interfaces.grounding_interface import GroundingInterface
 from monarch_py.service.solr_service import SolrService
-from monarch_py.utils.case_phenotype_utils import build_matrix
-from monarch_py.utils.entity_grid_utils import build_entity_grid
+from monarch_py.service.solr_stream import iter_docs, stream_params
+from monarch_py.service.solr_transport import get_transport
+from monarch_py.utils.case_phenotype_utils import CasePhenotypeMatrixBuilder
+from monarch_py.utils.entity_grid_utils import EntityGridBuilder
 from monarch_py.datamodels.grid_configs import get_grid_config
 from monarch_py.datamodels.grid_groupings import get_row_grouping
 from monarch_py.utils.entity_utils import get_expanded_curie, get_uri
@@ -74,6 +79,18 @@ from monarch_py.utils.utils import get_provided_by_link, get_links_for_field
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class GenericGridPlan:
+    """Everything get_generic_entity_grid works out before querying Solr"""
+
+    context_category: str
+    column_assoc_categories: List[str]
+    column_params: dict
+    row_params: dict
+    config: Any
+    grouping: Any
+
+
 @dataclass
 class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface, GroundingInterface):
     """Implementation of Monarch Interfaces for Solr endpoint"""
@@ -129,16 +146,19 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
     # Process-level cache of RO relation CURIE -> KG label. RO labels (loaded from
     # phenio) are stable for the lifetime of a server process, so resolving each
     # relation once avoids a per-page Solr round-trip. ClassVar keeps it off the
-    # dataclass field list. The check-then-write below is intentionally lock-free:
-    # concurrent requests racing on the same uncached relation may each do one extra
-    # Solr lookup at startup, but the write is idempotent, so the cost is bounded and
-    # not worth a lock.
+    # dataclass field list. The API fills it for every MONDO_HEADER_RELATIONS entry at
+    # startup (prefetch_relation_labels); anything else is resolved on first use, with
+    # concurrent misses for the same relation coalesced into a single lookup.
     _relation_label_cache: ClassVar[Dict[str, Optional[str]]] = {}
+    _relation_label_lock: ClassVar[threading.Lock] = threading.Lock()
+    _relation_label_inflight: ClassVar[Dict[str, threading.Event]] = {}
+    # How long a request waits on another thread's in-flight label lookup before giving up on the label
+    RELATION_LABEL_WAIT_SECONDS = 10
 
     def solr_is_available(self) -> bool:
         """Check if the Solr instance is available"""
         try:
-            return requests.get(self.base_url).status_code == 200
+            return get_transport(self.base_url).get(self.base_url).status_code == 200
         except Exception:
             return False
 
@@ -158,21 +178,14 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             Node: Dataclass representing results of an entity search with extra=True.
         """
         solr = SolrService(base_url=self.base_url, core=core.ENTITY)
-        solr_document = solr.get(id)
+        solr_document = solr.get(id, fields=ENTITY_FIELDS)
         if solr_document is None:
             return None
         if not extra:
             return parse_entity(solr_document)
 
         # Get extra data (this logic is very tricky to test because of the calls to Solr)
-        # Normalize for Node since that's the target model with additional fields
-        normalized_doc = normalize_solr_doc_for_model(solr_document, Node)
-        entity = Entity(**normalized_doc)
-        entity.uri = get_uri(entity.id)
-        # Strip bulky descendant lists - these can be 10+ MB for high-level ontology
-        # terms and are not used by the frontend. Keep has_descendant_count (an integer).
-        entity.has_descendant = None
-        entity.has_descendant_label = None
+        entity = self._entity_from_document(solr_document)
         if "biolink:Disease" == entity.category:
             # Get mode of inheritance
             mode_of_inheritance_associations = self.get_associations(
@@ -206,24 +219,56 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             )
             # Mondo gene<-disease related_to associations (RO original_predicate)
             entity.node_relationships = self._get_node_relationships(entity)
-        node: Node = Node(
-            **entity.model_dump(),
+        return self._build_node(
+            entity,
             cross_species_term_clique=self._get_cross_species_term_clique(entity),
             node_hierarchy=self._get_node_hierarchy(entity),
             association_counts=self.get_association_counts(id, entity_category=entity.category).items,
-            external_links=get_links_for_field(entity.xref) if entity.xref else [],
-            provided_by_link=get_provided_by_link(entity.provided_by),
             mappings=self._get_mapped_entities(entity),
         )
 
-        return node
-
     ### Entity helpers ###
+    # The pure (no Solr I/O) helpers below are shared with AsyncSolrImplementation.
+
+    @staticmethod
+    def _entity_from_document(solr_document: Dict) -> Entity:
+        """Entity for the node header, normalized against Node (the target model with additional fields)"""
+        normalized_doc = normalize_solr_doc_for_model(solr_document, Node)
+        entity = Entity(**normalized_doc)
+        entity.uri = get_uri(entity.id)
+        # Strip bulky descendant lists - these can be 10+ MB for high-level ontology
+        # terms and are not used by the frontend. Keep has_descendant_count (an integer).
+        entity.has_descendant = None
+        entity.has_descendant_label = None
+        return entity
+
+    @staticmethod
+    def _build_node(
+        entity: Entity,
+        cross_species_term_clique: Optional[CrossSpeciesTermClique],
+        node_hierarchy: Optional[NodeHierarchy],
+        association_counts: list,
+        mappings: list,
+    ) -> Node:
+        """Assemble the Node from an entity and its separately fetched extras"""
+        return Node(
+            **entity.model_dump(),
+            cross_species_term_clique=cross_species_term_clique,
+            node_hierarchy=node_hierarchy,
+            association_counts=association_counts,
+            external_links=get_links_for_field(entity.xref) if entity.xref else [],
+            provided_by_link=get_provided_by_link(entity.provided_by),
+            mappings=mappings,
+        )
 
     def _get_mapped_entities(self, this_entity: Entity) -> list:
         """..."""
+        return self._mapped_entity_curies(this_entity, self.get_mappings(entity_id=this_entity.id))
+
+    @staticmethod
+    def _mapped_entity_curies(this_entity: Entity, mappings: MappingResults) -> list:
+        """Expanded curies of the entities mapped to this_entity, whichever side of the mapping it is on"""
         mapped_entities = []
-        mappings = self.get_mappings(entity_id=this_entity.id)
         for m in mappings.items:
             if this_entity.id == m.subject_id:
                 mapped_entities.append(get_expanded_curie(m.object_id))
@@ -233,7 +278,8 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
                 pass
         return mapped_entities
 
-    def _get_counterpart_entity(self, association: Association, this_entity: Entity) -> Entity:
+    @staticmethod
+    def _get_counterpart_entity(association: Association, this_entity: Entity) -> Entity:
         """Returns the id, name, and category of the other Entity in an Association given this_entity"""
         if this_entity.id == association.subject:
             entity = Entity(
@@ -252,6 +298,11 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
 
         return entity
 
+    # Disease is always the subject of these Mondo associations. The limit is applied by Solr before
+    # the curated-relation filter, so an overflow could silently drop curated edges; warn if we ever
+    # hit the cap.
+    NODE_RELATIONSHIP_FETCH_LIMIT = 500
+
     def _get_node_relationships(self, this_entity: Entity) -> List[NodeRelationship]:
         """Surface Mondo disease<->X `related_to` associations on the node header.
 
@@ -266,51 +317,98 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         sensible display. The relation label is resolved from the KG itself (RO terms
         are loaded as entities from phenio), looked up once per distinct relation CURIE.
         """
+        associations = self.get_associations(**self._node_relationship_filters(this_entity)).items
+        associations = self._curated_node_relationship_associations(this_entity, associations)
+        labels = {
+            relation: self._get_relation_label(relation)
+            for relation in dict.fromkeys(a.original_predicate or a.predicate for a in associations)
+        }
+        return self._build_node_relationships(this_entity, associations, labels)
+
+    @classmethod
+    def _node_relationship_filters(cls, this_entity: Entity) -> dict:
+        """get_associations filters for this_entity's Mondo related_to associations"""
         is_disease = "biolink:Disease" == this_entity.category
-        # Disease is always the subject of these Mondo associations.
-        # The limit is applied by Solr before the curated-relation filter below, so an
-        # overflow could silently drop curated edges; warn if we ever hit the cap.
-        fetch_limit = 500
-        associations = self.get_associations(
+        return dict(
             subject=[this_entity.id] if is_disease else None,
             object=[this_entity.id] if not is_disease else None,
             predicate=[AssociationPredicate.RELATED_TO],
             primary_knowledge_source=["infores:mondo"],
             subject_category=None if is_disease else [EntityCategory.DISEASE],
             direct=True,
-            limit=fetch_limit,
-        ).items
-        if len(associations) == fetch_limit:
+            limit=cls.NODE_RELATIONSHIP_FETCH_LIMIT,
+        )
+
+    @classmethod
+    def _curated_node_relationship_associations(
+        cls, this_entity: Entity, associations: List[Association]
+    ) -> List[Association]:
+        """Keep only curated relations, ordered per MONDO_HEADER_RELATIONS."""
+        if len(associations) == cls.NODE_RELATIONSHIP_FETCH_LIMIT:
             logger.warning(
-                f"_get_node_relationships hit the {fetch_limit}-association fetch cap for {this_entity.id}; "
-                "some curated Mondo header relations may be truncated."
+                f"_get_node_relationships hit the {cls.NODE_RELATIONSHIP_FETCH_LIMIT}-association fetch cap for "
+                f"{this_entity.id}; some curated Mondo header relations may be truncated."
             )
-
-        # Keep only curated relations, ordered per MONDO_HEADER_RELATIONS.
-        relation_order = self.MONDO_HEADER_RELATION_ORDER
+        relation_order = cls.MONDO_HEADER_RELATION_ORDER
         associations = [a for a in associations if (a.original_predicate or a.predicate) in relation_order]
         associations.sort(key=lambda a: relation_order[a.original_predicate or a.predicate])
+        return associations
 
+    def _get_relation_label(self, relation: str) -> Optional[str]:
+        """KG label of an RO relation, memoized in the process-level `_relation_label_cache`."""
+        if relation in self._relation_label_cache:
+            return self._relation_label_cache[relation]
+        # Single-flight: the first thread to miss does the lookup, others wait for its result.
+        with self._relation_label_lock:
+            in_flight = self._relation_label_inflight.get(relation)
+            if in_flight is None:
+                done = self._relation_label_inflight[relation] = threading.Event()
+        if in_flight is not None:
+            in_flight.wait(self.RELATION_LABEL_WAIT_SECONDS)
+            return self._relation_label_cache.get(relation)
+        # A failure resolving one RO term's label must not blank out the whole
+        # relationships block, so degrade to no label rather than propagating.
+        # Only memoize definitive results (resolved name or confirmed-missing);
+        # on a transient error leave the cache empty so a later request retries
+        # instead of being permanently poisoned with None.
+        try:
+            relation_entity = self.get_entity(relation, extra=False)
+            relation_label = relation_entity.name if relation_entity is not None else None
+            self._relation_label_cache[relation] = relation_label
+            return relation_label
+        except Exception:
+            logger.warning(f"Could not resolve label for relation {relation}", exc_info=True)
+            return None
+        finally:
+            with self._relation_label_lock:
+                self._relation_label_inflight.pop(relation, None)
+            done.set()
+
+    def prefetch_relation_labels(self, relations: Optional[List[str]] = None) -> Dict[str, Optional[str]]:
+        """Resolve the labels of `relations` (default: MONDO_HEADER_RELATIONS) in one Solr query and
+        memoize them, so the first disease pages after a deploy don't each pay for the lookups."""
+        relations = list(relations or self.MONDO_HEADER_RELATIONS)
+        solr = SolrService(base_url=self.base_url, core=core.ENTITY)
+        return self._cache_relation_labels(relations, solr.query(build_entity_lookup_query(relations)))
+
+    @classmethod
+    def _cache_relation_labels(cls, relations: List[str], query_result) -> Dict[str, Optional[str]]:
+        """Memoize the labels found by a `build_entity_lookup_query` (relations not found have no label)"""
+        found = {doc["id"]: doc.get("name") for doc in query_result.response.docs}
+        labels = {relation: found.get(relation) for relation in relations}
+        cls._relation_label_cache.update(labels)
+        return labels
+
+    @classmethod
+    def _build_node_relationships(
+        cls, this_entity: Entity, associations: List[Association], labels: Dict[str, Optional[str]]
+    ) -> List[NodeRelationship]:
+        """NodeRelationships for curated associations, given each relation's resolved label"""
         relationships: List[NodeRelationship] = []
         seen: set[tuple[str, str]] = set()
         for association in associations:
             relation = association.original_predicate or association.predicate
-            if relation in self._relation_label_cache:
-                relation_label = self._relation_label_cache[relation]
-            else:
-                # A failure resolving one RO term's label must not blank out the whole
-                # relationships block, so degrade to no label rather than propagating.
-                # Only memoize definitive results (resolved name or confirmed-missing);
-                # on a transient error leave the cache empty so a later request retries
-                # instead of being permanently poisoned with None.
-                try:
-                    relation_entity = self.get_entity(relation, extra=False)
-                    relation_label = relation_entity.name if relation_entity is not None else None
-                    self._relation_label_cache[relation] = relation_label
-                except Exception:
-                    logger.warning(f"Could not resolve label for relation {relation}", exc_info=True)
-                    relation_label = None
-            counterpart = self._get_counterpart_entity(association, this_entity)
+            counterpart = cls._get_counterpart_entity(association, this_entity)
             # Mondo may assert the same relation->counterpart from multiple rows; show it once.
             if (relation, counterpart.id) in seen:
                 continue
@@ -331,7 +429,7 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             relationships.append(
                 NodeRelationship(
                     relation=relation,
-                    relation_label=relation_label,
+                    relation_label=labels.get(relation),
                     related_entity=counterpart,
                 )
             )
@@ -422,8 +520,8 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         vertical (subclass_of) and horizontal (same_as, homologous_to) associations
         between clique members.
         """
-        is_root_term = any(entity.id.startswith(f"{prefix}:") for prefix in self.CROSS_SPECIES_PREFIXES)
-        is_species_specific = any(entity.id.startswith(f"{prefix}:") for prefix in self.SPECIES_SPECIFIC_PREFIXES)
+        is_root_term = self._is_cross_species_root(entity.id)
+        is_species_specific = self._is_species_specific(entity.id)
 
         if not is_root_term and not is_species_specific:
             return None
@@ -451,7 +549,7 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         ).items
 
         # Collect sideways associations (same_as, homologous_to between children)
-        sideways_assocs = []
+        all_sideways = []
         if len(child_ids) > 1:
             all_sideways = self.get_associations(
                 subject=child_ids,
@@ -459,11 +557,28 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
                 direct=True,
                 limit=500,
             ).items
-            # Filter to only edges where both endpoints are in this clique
-            child_id_set = set(child_ids)
-            sideways_assocs = [a for a in all_sideways if a.object in child_id_set]
-            sideways_assocs = self._deduplicate_sideways(sideways_assocs)
 
+        return self._assemble_cross_species_term_clique(root_term, children, vertical_assocs, all_sideways)
+
+    @classmethod
+    def _is_cross_species_root(cls, entity_id: str) -> bool:
+        return any(entity_id.startswith(f"{prefix}:") for prefix in cls.CROSS_SPECIES_PREFIXES)
+
+    @classmethod
+    def _is_species_specific(cls, entity_id: str) -> bool:
+        return any(entity_id.startswith(f"{prefix}:") for prefix in cls.SPECIES_SPECIFIC_PREFIXES)
+
+    @classmethod
+    def _assemble_cross_species_term_clique(
+        cls,
+        root_term: Entity,
+        children: List[Entity],
+        vertical_assocs: List[Association],
+        all_sideways: List[Association],
+    ) -> CrossSpeciesTermClique:
+        """Build the clique, keeping only sideways edges where both endpoints are in the clique"""
+        child_id_set = {c.id for c in children}
+        sideways_assocs = cls._deduplicate_sideways([a for a in all_sideways if a.object in child_id_set])
         return CrossSpeciesTermClique(
             root_term=root_term,
             clique_entities=children,
@@ -477,9 +592,7 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             subject=entity.id,
             predicate=[AssociationPredicate.SUBCLASS_OF],
         )
-        cross_species_parents = [
-            p for p in parents if any(p.id.startswith(f"{prefix}:") for prefix in self.CROSS_SPECIES_PREFIXES)
-        ]
+        cross_species_parents = [p for p in parents if self._is_cross_species_root(p.id)]
         return cross_species_parents[0] if cross_species_parents else None
 
     def _get_species_specific_children(self, root_id: str) -> list[Entity]:
@@ -489,9 +602,7 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             object=root_id,
             predicate=[AssociationPredicate.SUBCLASS_OF],
         )
-        return [
-            c for c in all_children if any(c.id.startswith(f"{prefix}:") for prefix in self.SPECIES_SPECIFIC_PREFIXES)
-        ]
+        return [c for c in all_children if self._is_species_specific(c.id)]
 
     @staticmethod
     def _deduplicate_sideways(assocs: list[Association]) -> list[Association]:
@@ -556,7 +667,60 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             AssociationResults: Dataclass representing results of an association search.
         """
         solr = SolrService(base_url=self.base_url, core=core.ASSOCIATION)
-        query = build_association_query(
+        query = self._association_query(
+            category=category,
+            subject=subject,
+            subject_closure=subject_closure,
+            subject_category=subject_category,
+            subject_namespace=subject_namespace,
+            subject_taxon=subject_taxon,
+            predicate=predicate,
+            object=object,
+            object_closure=object_closure,
+            object_category=object_category,
+            object_namespace=object_namespace,
+            object_taxon=object_taxon,
+            entity=entity,
+            primary_knowledge_source=primary_knowledge_source,
+            direct=direct,
+            q=q,
+            facet_fields=facet_fields,
+            facet_queries=facet_queries,
+            filter_queries=filter_queries,
+            offset=offset,
+            limit=limit,
+        )
+        query_result = solr.query(query)
+
+        associations = parse_associations(query_result, compact, offset, limit)
+        return associations
+
+    @staticmethod
+    def _association_query(
+        category: List[AssociationCategory] = None,
+        subject: Optional[List[str]] = None,
+        subject_closure: Optional[str] = None,
+        subject_category: List[EntityCategory] = None,
+        subject_namespace: Optional[List[str]] = None,
+        subject_taxon: Optional[List[str]] = None,
+        predicate: List[AssociationPredicate] = None,
+        object: Optional[List[str]] = None,
+        object_closure: Optional[str] = None,
+        object_category: List[EntityCategory] = None,
+        object_namespace: Optional[List[str]] = None,
+        object_taxon: Optional[List[str]] = None,
+        entity: Optional[List[str]] = None,
+        primary_knowledge_source: Optional[List[str]] = None,
+        direct: bool = False,
+        q: Optional[str] = None,
+        facet_fields: Optional[List[str]] = None,
+        facet_queries: Optional[List[str]] = None,
+        filter_queries: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> SolrQuery:
+        """The get_associations SolrQuery, accepting enum values and single ids in place of lists"""
+        return build_association_query(
             category=[c.value for c in category] if category else [],
             predicate=[p.value for p in predicate] if predicate else [],
             subject=[subject] if isinstance(subject, str) else subject,
@@ -579,10 +743,6 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             offset=offset,
             limit=limit,
         )
-        query_result = solr.query(query)
-
-        associations = parse_associations(query_result, compact, offset, limit)
-        return associations
 
     def get_histopheno(self, subject: Optional[str] = None) -> HistoPheno:
         """Get histopheno counts for a given subject_closure"""
@@ -716,13 +876,8 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         """
         entities = [entity]
         if entity_category == "biolink:Gene":
-            ortholog_associations = self.get_associations(
-                entity=[entity], predicate=[AssociationPredicate.ORTHOLOGOUS_TO], limit=500
-            )
-            orthologous_entities = [
-                self._get_counterpart_entity(a, Entity(id=entity)) for a in ortholog_associations.items
-            ]
-            entities.extend([ent.id for ent in orthologous_entities])
+            ortholog_associations = self.get_associations(**self._ortholog_filters(entity))
+            entities.extend(self._counterpart_ids(entity, ortholog_associations.items))
 
         query = build_association_counts_query(entities)
         solr = SolrService(base_url=self.base_url, core=core.ASSOCIATION)
@@ -730,6 +885,16 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         association_counts = parse_association_counts(query_result, entities)
         return association_counts
 
+    @staticmethod
+    def _ortholog_filters(entity: str) -> dict:
+        """get_associations filters for the orthologs of a gene"""
+        return dict(entity=[entity], predicate=[AssociationPredicate.ORTHOLOGOUS_TO], limit=500)
+
+    @classmethod
+    def _counterpart_ids(cls, entity: str, associations: List[Association]) -> List[str]:
+        """Ids of the entities on the other side of each association from `entity`"""
+        return [cls._get_counterpart_entity(a, Entity(id=entity)).id for a in associations]
+
     def get_association_facets(
         self,
         category: List[AssociationCategory] = None,
@@ -789,13 +954,8 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
     ) -> AssociationTableResults:
         entities = [entity]
         if traverse_orthologs:
-            ortholog_associations = self.get_associations(
-                entity=[entity], predicate=[AssociationPredicate.ORTHOLOGOUS_TO], limit=500
-            )
-            orthologous_entities = [
-                self._get_counterpart_entity(a, Entity(id=entity)) for a in ortholog_associations.items
-            ]
-            entities.extend([ent.id for ent in orthologous_entities])
+            ortholog_associations = self.get_associations(**self._ortholog_filters(entity))
+            entities.extend(self._counterpart_ids(entity, ortholog_associations.items))
         query = build_association_table_query(
             entity=entities,
             category=category.value,
@@ -906,40 +1066,43 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         case_docs = case_result.get("response", {}).get("docs", [])
 
         # Step 2: Check limit
-        if len(case_docs) > limit:
-            raise ValueError(
-                f"Case count ({len(case_docs)}) exceeds limit ({limit}). Use direct=true or increase limit."
-            )
+        self._check_case_limit(case_docs, limit)
 
         # Handle no cases
         if not case_docs:
-            return CasePhenotypeMatrixResponse(
-                disease_id=disease_id,
-                disease_name=self._get_entity_name(disease_id),
-                total_cases=0,
-                total_phenotypes=0,
-                cases=[],
-                phenotypes=[],
-                bins=[],
-                cells={},
-            )
+            return self._empty_case_phenotype_matrix(disease_id, self._get_entity_name(disease_id))
 
-        # Step 3: Get phenotype associations via JOIN query
+        # Step 3: Get phenotype associations via JOIN query, streamed
         phenotype_query_params = build_case_phenotype_query(
             disease_id=disease_id,
             direct_only=direct_only,
         )
-        phenotype_result = self._raw_solr_query(phenotype_query_params)
-        phenotype_docs = phenotype_result.get("response", {}).get("docs", [])
-        facet_counts = phenotype_result.get("facet_counts", {}).get("facet_queries", {})
 
-        # Step 4: Build matrix
-        return build_matrix(
+        # Step 4: Build matrix, folding in the phenotype docs as they are decoded (facets follow them)
+        facet_counts = {}
+        builder = CasePhenotypeMatrixBuilder(disease_id, case_docs)
+        for doc in self._raw_solr_docs(phenotype_query_params, facet_counts):
+            builder.add(doc)
+        return builder.build(self._get_entity_name(disease_id), facet_counts.get("facet_queries", {}))
+
+    @staticmethod
+    def _check_case_limit(case_docs: list, limit: int):
+        if len(case_docs) > limit:
+            raise ValueError(
+                f"Case count ({len(case_docs)}) exceeds limit ({limit}). Use direct=true or increase limit."
+            )
+
+    @staticmethod
+    def _empty_case_phenotype_matrix(disease_id: str, disease_name: str) -> CasePhenotypeMatrixResponse:
+        return CasePhenotypeMatrixResponse(
             disease_id=disease_id,
-            disease_name=self._get_entity_name(disease_id),
-            case_docs=case_docs,
-            phenotype_docs=phenotype_docs,
-            facet_counts=facet_counts,
+            disease_name=disease_name,
+            total_cases=0,
+            total_phenotypes=0,
+            cases=[],
+            phenotypes=[],
+            bins=[],
+            cells={},
         )
 
     def get_entity_grid(
@@ -990,25 +1153,12 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         col_docs = col_result.get("response", {}).get("docs", [])
 
         # Step 3: Check limit
-        if len(col_docs) > limit:
-            raise ValueError(
-                f"Column count ({len(col_docs)}) exceeds limit ({limit}). Use direct=true or reduce the scope."
-            )
+        self._check_column_limit(col_docs, limit)
 
         # Handle no columns
         if not col_docs:
             context_name = self._get_entity_name(context_id)
-            return EntityGridResponse(
-                context_id=context_id,
-                context_name=context_name,
-                context_category=config.context_category.value,
-                total_columns=0,
-                total_rows=0,
-                columns=[],
-                rows=[],
-                bins=[],
-                cells={},
-            )
+            return self._empty_entity_grid(context_id, context_name, config.context_category.value)
 
         # Step 4: Get row associations via JOIN query
         row_params = build_grid_row_query(
@@ -1017,20 +1167,35 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             grouping=grouping,
             direct_only=direct_only,
         )
-        row_result = self._raw_solr_query(row_params)
-        row_docs = row_result.get("response", {}).get("docs", [])
-        facet_counts = row_result.get("facet_counts", {}).get("facet_queries", {})
 
-        # Step 5: Build grid
-        return build_entity_grid(
+        # Step 5: Build grid, folding in the row docs as they are decoded (facets follow them)
+        facet_counts = {}
+        builder = EntityGridBuilder(context_id, config, grouping, col_docs)
+        for doc in self._raw_solr_docs(row_params, facet_counts):
+            builder.add(doc)
+        return builder.build(
+            self._get_entity_name(context_id), config.context_category.value, facet_counts.get("facet_queries", {})
+        )
+
+    @staticmethod
+    def _check_column_limit(col_docs: list, limit: int):
+        if len(col_docs) > limit:
+            raise ValueError(
+                f"Column count ({len(col_docs)}) exceeds limit ({limit}). Use direct=true or reduce the scope."
+            )
+
+    @staticmethod
+    def _empty_entity_grid(context_id: str, context_name: str, context_category: str) -> EntityGridResponse:
+        return EntityGridResponse(
             context_id=context_id,
-            context_name=self._get_entity_name(context_id),
-            context_category=config.context_category.value,
-            config=config,
-            grouping=grouping,
-            column_docs=col_docs,
-            row_docs=row_docs,
-            facet_counts=facet_counts,
+            context_name=context_name,
+            context_category=context_category,
+            total_columns=0,
+            total_rows=0,
+            columns=[],
+            rows=[],
+            bins=[],
+            cells={},
         )
 
     def get_generic_entity_grid(
@@ -1063,6 +1228,53 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         Raises:
             ValueError: If column count exceeds limit or configuration is invalid
         """
+        # Get context entity's category to determine field mappings
+        context_entity = self.get_entity(context_id, extra=False)
+        if not context_entity:
+            raise ValueError(f"Context entity not found: {context_id}")
+        plan = self._plan_generic_entity_grid(
+            context_id,
+            context_entity,
+            column_assoc_categories,
+            row_assoc_categories,
+            row_grouping=row_grouping,
+            direct_only=direct_only,
+            limit=limit,
+        )
+
+        # Step 1: Get column entities (filtering out columns with no row associations)
+        col_result = self._raw_solr_query(plan.column_params)
+        col_docs = col_result.get("response", {}).get("docs", [])
+
+        # Step 2: Check limit
+        self._check_column_limit(col_docs, limit)
+
+        # Step 3: Handle no columns
+        if not col_docs:
+            return self._empty_entity_grid(context_id, self._get_entity_name(context_id), plan.context_category)
+
+        # Step 4: Get row associations via JOIN query, folding in the row docs as they are decoded
+        # (facets follow them)
+        facet_counts = {}
+        builder = EntityGridBuilder(context_id, plan.config, plan.grouping, col_docs)
+        for doc in self._raw_solr_docs(plan.row_params, facet_counts):
+            builder.add(doc)
+        grid = builder.build(
+            self._get_entity_name(context_id), plan.context_category, facet_counts.get("facet_queries", {})
+        )
+        return self._group_generic_grid_columns(plan, grid, group_columns_by_category)
+
+    @staticmethod
+    def _plan_generic_entity_grid(
+        context_id: str,
+        context_entity: Entity,
+        column_assoc_categories: List[str],
+        row_assoc_categories: List[str],
+        row_grouping: str,
+        direct_only: bool,
+        limit: int,
+    ) -> "GenericGridPlan":
+        """Work out field directions, grouping, config and both Solr queries for a generic grid"""
         from monarch_py.datamodels.grid_configs import GridTypeConfig
         from monarch_py.datamodels.grid_groupings import get_row_grouping, get_empty_grouping
         from monarch_py.datamodels.category_enums import AssociationCategory, EntityCategory
@@ -1070,12 +1282,6 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             build_multi_category_column_query,
             build_multi_category_row_query,
         )
-        from monarch_py.utils.entity_grid_utils import build_entity_grid, sort_columns_by_category
-
-        # Get context entity's category to determine field mappings
-        context_entity = self.get_entity(context_id, extra=False)
-        if not context_entity:
-            raise ValueError(f"Context entity not found: {context_id}")
 
         context_category = context_entity.category
         if isinstance(context_category, list):
@@ -1139,8 +1345,7 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         else:
             grouping = get_empty_grouping()
 
-        # Step 1: Get column entities (filtering out columns with no row associations)
-        col_params = build_multi_category_column_query(
+        column_params = build_multi_category_column_query(
             context_id=context_id,
             column_assoc_categories=column_assoc_categories,
             context_field=context_field,
@@ -1152,30 +1357,6 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             filter_empty_columns=True,
             rows=limit + 1,
         )
-        col_result = self._raw_solr_query(col_params)
-        col_docs = col_result.get("response", {}).get("docs", [])
-
-        # Step 2: Check limit
-        if len(col_docs) > limit:
-            raise ValueError(
-                f"Column count ({len(col_docs)}) exceeds limit ({limit}). Use direct=true or reduce the scope."
-            )
-
-        # Step 3: Handle no columns
-        if not col_docs:
-            return EntityGridResponse(
-                context_id=context_id,
-                context_name=self._get_entity_name(context_id),
-                context_category=context_category,
-                total_columns=0,
-                total_rows=0,
-                columns=[],
-                rows=[],
-                bins=[],
-                cells={},
-            )
-
-        # Step 4: Get row associations via JOIN query
         row_params = build_multi_category_row_query(
             context_id=context_id,
             column_assoc_categories=column_assoc_categories,
@@ -1188,11 +1369,8 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             grouping=grouping,
             direct_only=direct_only,
         )
-        row_result = self._raw_solr_query(row_params)
-        row_docs = row_result.get("response", {}).get("docs", [])
-        facet_counts = row_result.get("facet_counts", {}).get("facet_queries", {})
 
-        # Create a dynamic config for build_entity_grid
+        # Create a dynamic config for the grid builder
         # Determine column entity category from association type
         if "Disease" in column_assoc_categories[0]:
             col_entity_cat = EntityCategory.DISEASE
@@ -1225,23 +1403,26 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             context_closure_field=context_closure_field,
         )
 
-        # Step 5: Build grid
-        grid = build_entity_grid(
-            context_id=context_id,
-            context_name=self._get_entity_name(context_id),
+        return GenericGridPlan(
             context_category=context_category,
+            column_assoc_categories=column_assoc_categories,
+            column_params=column_params,
+            row_params=row_params,
             config=temp_config,
             grouping=grouping,
-            column_docs=col_docs,
-            row_docs=row_docs,
-            facet_counts=facet_counts,
         )
 
-        # Step 6: Optionally sort columns by category
-        if group_columns_by_category and len(column_assoc_categories) > 1:
+    @staticmethod
+    def _group_generic_grid_columns(
+        plan: "GenericGridPlan", grid: EntityGridResponse, group_columns_by_category: bool
+    ) -> EntityGridResponse:
+        """Optionally sort a generic grid's columns by their source association category"""
+        from monarch_py.utils.entity_grid_utils import sort_columns_by_category
+
+        if group_columns_by_category and len(plan.column_assoc_categories) > 1:
             grid.columns = sort_columns_by_category(
                 grid.columns,
-                column_assoc_categories,
+                plan.column_assoc_categories,
             )
 
         return grid
@@ -1270,6 +1451,26 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
         Returns:
             Raw JSON response from Solr as a dictionary
         """
+        url = f"{self.base_url}/{core.ASSOCIATION.value}/select?{self._raw_query_string(params)}"
+
+        response = get_transport(self.base_url, core.ASSOCIATION.value).get(url)
+        response.raise_for_status()
+        return response.json()
+
+    def _raw_solr_docs(self, params: dict, facet_counts: Optional[dict] = None) -> Iterator[dict]:
+        """Stream the documents of a raw Solr query, decoded one at a time as they arrive.
+
+        Solr sends the facets after the documents, so `facet_counts` (if given) is only filled with
+        the response's `facet_counts` once the documents are exhausted (see `solr_stream`).
+        The request is only sent once iteration starts.
+        """
+        url = f"{self.base_url}/{core.ASSOCIATION.value}/select?{self._raw_query_string(stream_params(params))}"
+        response = get_transport(self.base_url, core.ASSOCIATION.value).get(url, stream=True)
+        yield from iter_docs(response, facet_counts)
+
+    @staticmethod
+    def _raw_query_string(params: dict) -> str:
+        """Encode a dictionary of Solr query parameters"""
         # Handle list parameters (like facet.query)
         query_parts = []
         for key, value in params.items():
@@ -1281,9 +1482,4 @@ class SolrImplementation(EntityInterface, AssociationInterface, SearchInterface,
             else:
                 query_parts.append(f"{key}={requests.utils.quote(str(value))}")
 
-        query_string = "&".join(query_parts)
-        url = f"{self.base_url}/{core.ASSOCIATION.value}/select?{query_string}"
-
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return "&".join(query_parts)
@@ -0,0 +1,136 @@
+"""Fast construction of API models from trusted Solr documents.
+
+Solr documents are produced by our own KG build and indexed against a schema that mirrors the
+models, so running every field of every document through pydantic validation (and re-inspecting
+the model's type hints per document to unwrap multi-valued fields) buys little and dominated the
+CPU cost of shaping a 500-row association page.
+
+`model_plan` works out, once per model, what a document needs before it can become that model:
+which scalar fields Solr may hand back as single-element lists, and which fields hold nested
+models or enums that still need converting. `build_model` applies the plan and builds the model
+with `model_construct`, skipping validation of everything else. A document missing a required
+field still fails with a ValidationError, as it would under full validation.
+
+Set MONARCH_VALIDATE_SOLR_DOCS=true (e.g. when debugging a new KG build or schema change) to run
+full pydantic validation instead.
+"""
+
+import enum
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+VALIDATE_SOLR_DOCS = os.getenv("MONARCH_VALIDATE_SOLR_DOCS", "false").lower() in ("1", "true", "yes")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _is_scalar_type(type_hint: Any) -> bool:
+    """
+    Check if a type hint represents a scalar (non-list) type.
+
+    Handles Optional[T], Union[T, None], and plain types.
+    Returns True for str, int, bool, float, etc.
+    Returns False for list[T], List[T], etc.
+    """
+    origin = get_origin(type_hint)
+
+    # Handle Optional[T] which is Union[T, None]
+    if origin is Union:
+        args = get_args(type_hint)
+        # Filter out NoneType and check remaining types
+        non_none_args = [a for a in args if a is not type(None)]
+        if len(non_none_args) == 1:
+            return _is_scalar_type(non_none_args[0])
+        return False
+
+    # list, List[T] have origin of list
+    if origin is list:
+        return False
+
+    # Plain types (str, int, bool, etc.) have no origin
+    if origin is None:
+        return type_hint in (str, int, float, bool)
+
+    return False
+
+
+def _needs_conversion(type_hint: Any) -> bool:
+    """Whether values of this type must go through pydantic to end up as the declared type
+    (nested models, enums), as opposed to JSON values that can be stored as they are."""
+    if isinstance(type_hint, type) and issubclass(type_hint, (BaseModel, enum.Enum)):
+        return True
+    return any(_needs_conversion(arg) for arg in get_args(type_hint))
+
+
+@dataclass(frozen=True)
+class ModelPlan:
+    """What a Solr document needs before it can be stored as `model` without validation"""
+
+    model: Type[BaseModel]
+    required_fields: Tuple[str, ...]
+    # Scalar fields that Solr may return as (single-element) lists
+    scalar_fields: FrozenSet[str]
+    # Validators for the fields holding nested models or enums
+    converters: Dict[str, Callable[[Any], Any]]
+
+    def normalize(self, doc: Dict) -> Dict:
+        """Copy of `doc` with single-element lists unwrapped for the model's scalar fields"""
+        normalized = dict(doc)
+        for field_name in self.scalar_fields.intersection(doc):
+            value = doc[field_name]
+            if isinstance(value, list):
+                # Convert list to scalar: take first element or None
+                normalized[field_name] = value[0] if value else None
+        return normalized
+
+    def build(self, normalized: Dict, **values) -> BaseModel:
+        """The model for an already normalized document (see `build_model`)"""
+        if VALIDATE_SOLR_DOCS:
+            return self.model(**normalized, **values)
+        data = {**normalized, **values}
+        missing = [field_name for field_name in self.required_fields if field_name not in data]
+        if missing:
+            raise ValidationError.from_exception_data(
+                self.model.__name__,
+                [{"type": "missing", "loc": (field_name,), "input": normalized} for field_name in missing],
+            )
+        for field_name, convert in self.converters.items():
+            if data.get(field_name) is not None:
+                data[field_name] = convert(data[field_name])
+        return self.model.model_construct(**data)
+
+
+@lru_cache(maxsize=None)
+def model_plan(model: Type[BaseModel]) -> ModelPlan:
+    """The construction plan for `model`, computed on first use"""
+    required_fields = []
+    scalar_fields = set()
+    converters = {}
+    for field_name, field in model.model_fields.items():
+        if field.is_required():
+            required_fields.append(field_name)
+        if _is_scalar_type(field.annotation):
+            scalar_fields.add(field_name)
+        elif _needs_conversion(field.annotation):
+            adapter = TypeAdapter(field.annotation, config=model.model_config)
+            converters[field_name] = adapter.validate_python
+    return ModelPlan(
+        model=model,
+        required_fields=tuple(required_fields),
+        scalar_fields=frozenset(scalar_fields),
+        converters=converters,
+    )
+
+
+def build_model(model: Type[ModelT], doc: Dict, **values) -> ModelT:
+    """`model(**doc, **values)` for a trusted Solr document, without per-field validation.
+
+    `values` are app-computed fields (links, direction, ...) set alongside the document's own.
+    With MONARCH_VALIDATE_SOLR_DOCS set, the model is fully validated instead.
+    """
+    plan = model_plan(model)
+    return plan.build(plan.normalize(doc), **values)
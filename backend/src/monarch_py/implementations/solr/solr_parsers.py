@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Type, Union, get_args, get_origin, get_type_hints
+from typing import Dict, List, Type
 
 from loguru import logger
 from pydantic import BaseModel, ValidationError
@@ -23,9 +23,15 @@ from monarch_py.datamodels.model import (
     SearchResult,
     SearchResults,
 )
-from monarch_py.datamodels.solr import HistoPhenoKeys, SolrQueryResult
+from monarch_py.datamodels.solr import HistoPhenoKeys, SolrQuery, SolrQueryResult
 from monarch_py.service.curie_service import converter
-from monarch_py.implementations.solr.solr_query_utils import build_association_count_suffixes
+from monarch_py.service.solr_service import SolrService
+from monarch_py.implementations.solr.solr_model_plans import (
+    ModelT,
+    build_model,
+    model_plan,
+)
+from monarch_py.implementations.solr.solr_query_utils import association_group_query, build_association_count_suffixes
 from monarch_py.utils.association_type_utils import get_association_type_mapping_by_query_string
 from monarch_py.utils.utils import get_links_for_field, get_provided_by_link
 
@@ -35,36 +41,6 @@ from monarch_py.utils.utils import get_links_for_field, get_provided_by_link
 #############################
 
 
-def _is_scalar_type(type_hint: Any) -> bool:
-    """
-    Check if a type hint represents a scalar (non-list) type.
-
-    Handles Optional[T], Union[T, None], and plain types.
-    Returns True for str, int, bool, float, etc.
-    Returns False for list[T], List[T], etc.
-    """
-    origin = get_origin(type_hint)
-
-    # Handle Optional[T] which is Union[T, None]
-    if origin is Union:
-        args = get_args(type_hint)
-        # Filter out NoneType and check remaining types
-        non_none_args = [a for a in args if a is not type(None)]
-        if len(non_none_args) == 1:
-            return _is_scalar_type(non_none_args[0])
-        return False
-
-    # list, List[T] have origin of list
-    if origin is list:
-        return False
-
-    # Plain types (str, int, bool, etc.) have no origin
-    if origin is None:
-        return type_hint in (str, int, float, bool)
-
-    return False
-
-
 def normalize_solr_doc_for_model(doc: Dict, model_class: Type[BaseModel]) -> Dict:
     """
     Normalize a Solr document to match Pydantic model field types.
@@ -72,7 +48,8 @@ def normalize_solr_doc_for_model(doc: Dict, model_class: Type[BaseModel]) -> Dic
     Solr often returns single values as lists when the field schema isn't
     pre-defined (dynamic fields default to multiValued). This converts
     single-element lists to scalars for fields that expect scalar types
-    in the target Pydantic model.
+    in the target Pydantic model. Which fields those are is worked out
+    once per model (see `model_plan`).
 
     Args:
         doc: Raw Solr document dictionary
@@ -81,26 +58,7 @@ def normalize_solr_doc_for_model(doc: Dict, model_class: Type[BaseModel]) -> Dic
     Returns:
         Normalized document with list-to-scalar conversions applied
     """
-    try:
-        hints = get_type_hints(model_class)
-    except Exception:
-        # If we can't get type hints, return doc unchanged
-        return doc
-
-    normalized = dict(doc)
-
-    for field_name, value in doc.items():
-        if field_name not in hints:
-            continue
-        if not isinstance(value, list):
-            continue
-
-        field_type = hints[field_name]
-        if _is_scalar_type(field_type):
-            # Convert list to scalar: take first element or None
-            normalized[field_name] = value[0] if value else None
-
-    return normalized
+    return model_plan(model_class).normalize(doc)
 
 
 ####################
@@ -141,21 +99,12 @@ def parse_associations(
         for doc in query_result.response.docs:
             try:
                 # ExpandedAssociation is the API contract: the imported Association
-                # (KG truth) plus app-computed link/expansion fields the parser sets
-                # below. AssociationResults.items declares list[ExpandedAssociation].
-                association = ExpandedAssociation(**doc)
+                # (KG truth) plus app-computed link/expansion fields.
+                # AssociationResults.items declares list[ExpandedAssociation].
+                association = build_model(ExpandedAssociation, doc, **get_association_links(doc))
             except ValidationError:
                 logger.error(f"Validation error for {doc}")
                 raise
-            association.provided_by_link = (
-                get_provided_by_link(association.provided_by) if association.provided_by else []
-            )
-            association.has_evidence_links = (
-                get_links_for_field(association.has_evidence) if association.has_evidence else []
-            )
-            association.publications_links = (
-                get_links_for_field(association.publications) if association.publications else []
-            )
             associations.append(association)
         return AssociationResults(
             items=associations,
@@ -167,6 +116,26 @@ def parse_associations(
         )
 
 
+def parse_association_batch(query_result: dict, queries: Dict[str, SolrQuery]) -> Dict[str, AssociationResults]:
+    """Demultiplex a `build_association_batch_query` response into one AssociationResults per query"""
+    grouped = query_result.get("grouped", {})
+    results = {}
+    for key, query in queries.items():
+        doclist = grouped.get(association_group_query(query), {}).get("doclist", {})
+        docs = []
+        for doc in doclist.get("docs", [])[: query.rows]:
+            doc = dict(doc)
+            SolrService._strip_excluded_fields(doc)
+            docs.append(doc)
+        group_result = SolrQueryResult(
+            responseHeader=query_result.get("responseHeader", {"QTime": 0, "params": {}}),
+            response={"numFound": doclist.get("numFound", 0), "start": 0, "docs": docs},
+            facet_counts={"facet_fields": {}, "facet_queries": {}},
+        )
+        results[key] = parse_associations(group_result, offset=0, limit=query.rows)
+    return results
+
+
 def parse_association_counts(query_result: SolrQueryResult, entities: List[str]) -> AssociationCountList:
     """Parse facet query results into AssociationCount objects with direct, closure, and ortholog counts.
 
@@ -265,16 +234,7 @@ def parse_association_table(
     for doc in query_result.response.docs:
         try:
             direction = get_association_direction(entity, doc)
-            association = DirectionalAssociation(**doc, direction=direction)
-            association.provided_by_link = (
-                get_provided_by_link(association.provided_by) if association.provided_by else []
-            )
-            association.has_evidence_links = (
-                get_links_for_field(association.has_evidence) if association.has_evidence else []
-            )
-            association.publications_links = (
-                get_links_for_field(association.publications) if association.publications else []
-            )
+            association = build_model(DirectionalAssociation, doc, direction=direction, **get_association_links(doc))
             associations.append(association)
         except ValidationError:
             logger.error(f"Validation error for {doc}")
@@ -312,14 +272,7 @@ def parse_search(
     offset: int = 0,
     limit: int = 20,
 ) -> SearchResults:
-    items = []
-    for doc in query_result.response.docs:
-        try:
-            result = SearchResult(**doc)
-            items.append(result)
-        except ValidationError:
-            logger.error(f"Validation error for {doc}")
-            raise
+    items = parse_documents(query_result.response.docs, SearchResult)
     total = query_result.response.num_found
     facet_fields = convert_facet_fields(query_result.facet_counts.facet_fields)
     facet_queries = convert_facet_queries(query_result.facet_counts.facet_queries)
@@ -330,27 +283,13 @@ def parse_search(
 
 def parse_autocomplete(query_result: SolrQueryResult) -> SearchResults:
     total = query_result.response.num_found
-    items = []
-    for doc in query_result.response.docs:
-        try:
-            result = SearchResult(**doc)
-            items.append(result)
-        except ValidationError:
-            logger.error(f"Validation error for {doc}")
-            raise
+    items = parse_documents(query_result.response.docs, SearchResult)
     return SearchResults(limit=10, offset=0, total=total, items=items)
 
 
 def parse_mappings(query_result: SolrQueryResult, offset: int = 0, limit: int = 20) -> MappingResults:
     total = query_result.response.num_found
-    items = []
-    for doc in query_result.response.docs:
-        try:
-            result = Mapping(**doc)
-            items.append(result)
-        except ValidationError:
-            logger.error(f"Validation error for {doc}")
-            raise
+    items = parse_documents(query_result.response.docs, Mapping)
     return MappingResults(limit=limit, offset=offset, total=total, items=items)
 
 
@@ -359,6 +298,19 @@ def parse_mappings(query_result: SolrQueryResult, offset: int = 0, limit: int =
 ##################
 
 
+def parse_documents(docs: List[Dict], model_class: Type[ModelT]) -> List[ModelT]:
+    """Build `model_class` items from a page of Solr documents, with the model's plan looked up once"""
+    plan = model_plan(model_class)
+    items = []
+    for doc in docs:
+        try:
+            items.append(plan.build(plan.normalize(doc)))
+        except ValidationError:
+            logger.error(f"Validation error for {doc}")
+            raise
+    return items
+
+
 def convert_facet_fields(solr_facet_fields: Dict) -> List[FacetField]:
     """Converts list of raw Solr facet fields FacetField instances"""
     facet_fields: List[FacetField] = []
@@ -376,6 +328,18 @@ def convert_facet_queries(solr_facet_queries: Dict[str, int]) -> List[FacetValue
     return [FacetValue(label=k, count=v) for k, v in solr_facet_queries.items()]
 
 
+def get_association_links(document: Dict) -> Dict:
+    """The app-computed link fields of an association, from its Solr document"""
+    provided_by = document.get("provided_by")
+    has_evidence = document.get("has_evidence")
+    publications = document.get("publications")
+    return {
+        "provided_by_link": get_provided_by_link(provided_by) if provided_by else None,
+        "has_evidence_links": get_links_for_field(has_evidence) if has_evidence else [],
+        "publications_links": get_links_for_field(publications) if publications else [],
+    }
+
+
 def get_association_direction(entity: List[str], document: Dict) -> AssociationDirectionEnum:
     """Get the direction of an association based on the entity and the association document"""
     if document.get("subject") in entity or (
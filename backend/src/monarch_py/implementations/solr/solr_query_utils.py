@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Type
 
+from pydantic import BaseModel
+
+from monarch_py.datamodels.model import Association, Entity, Mapping, SearchResult
 from monarch_py.datamodels.solr import HistoPhenoKeys, SolrQuery
 from monarch_py.datamodels.category_enums import AssociationPredicate
 from monarch_py.utils.association_type_utils import AssociationTypeMappings, get_solr_query_fragment
@@ -70,6 +73,34 @@ def build_association_count_suffixes(entities: List[str]) -> AssociationCountSuf
     )
 
 
+def model_field_list(model: Type[BaseModel], exclude: Iterable[str] = (), include: Iterable[str] = ()) -> str:
+    """Solr field list (`fl`) for documents that are parsed into `model`
+
+    Only the fields the model declares are requested, so Solr never serializes (and we never
+    download or decode) `_version_`, the copy-field variants or anything else the parsers throw away.
+    `include` names stored fields the model doesn't declare but the API passes through as extras.
+    """
+    excluded = set(exclude)
+    fields = [field for field in model.model_fields if field not in excluded]
+    return ",".join(fields + [field for field in include if field not in fields])
+
+
+# The bulky descendant lists (10+ MB for high-level ontology terms) and the iri are dropped by the
+# entity parsers, so they are never fetched. has_descendant_count is kept.
+ENTITY_FIELDS = model_field_list(Entity, exclude=["iri", "has_descendant", "has_descendant_label"])
+ASSOCIATION_FIELDS = model_field_list(Association)
+# score is only returned when asked for; it is not part of the search output
+SEARCH_RESULT_FIELDS = model_field_list(SearchResult, exclude=["iri", "score"])
+MAPPING_FIELDS = model_field_list(Mapping, include=["mapping_source"])
+
+
+def build_entity_lookup_query(ids: List[str]) -> SolrQuery:
+    """Fetch several entities by id in one request (e.g. to resolve a set of labels)"""
+    query = SolrQuery(rows=len(ids), facet=False, field_list="id,name")
+    query.add_field_filter_query("id", ids)
+    return query
+
+
 def build_association_query(
     category: Optional[List[str]] = None,
     subject: Optional[List[str]] = None,
@@ -97,7 +128,7 @@ def build_association_query(
 ) -> SolrQuery:
     """Populate a SolrQuery object with association filters"""
     entity_fields = ["subject", "object", "disease_context_qualifier"]
-    query = SolrQuery(start=offset, rows=limit)
+    query = SolrQuery(start=offset, rows=limit, field_list=ASSOCIATION_FIELDS)
     query.add_field_filter_query("category", None if not category else [c for c in category])
     query.add_field_filter_query("predicate", None if not predicate else [p for p in predicate])
     query.add_field_filter_query("subject_closure", subject_closure)
@@ -145,6 +176,32 @@ def build_association_query(
     return query
 
 
+def association_group_query(query: SolrQuery) -> str:
+    """Fold a filter-only association query into a single query string, for use as a `group.query`"""
+    if query.q != "*:*" or query.start or query.sort:
+        raise ValueError("Only unsorted, unpaged filter queries can be batched")
+    return " AND ".join(f"({fq})" for fq in query.filter_queries) or "*:*"
+
+
+def build_association_batch_query(queries: Dict[str, SolrQuery]) -> Dict[str, Any]:
+    """Raw Solr params answering several small association queries in one round-trip.
+
+    Each query becomes a `group.query`; Solr returns one doclist per group, which
+    `parse_association_batch` hands back to the query it came from. Every group is fetched
+    with the largest `rows` of the batch and trimmed to its own limit when parsed.
+    """
+    group_queries = list(dict.fromkeys(association_group_query(query) for query in queries.values()))
+    return {
+        "q": "*:*",
+        # with grouping, rows is the number of groups returned
+        "rows": len(group_queries),
+        "group": True,
+        "group.query": group_queries,
+        "group.limit": max(query.rows for query in queries.values()),
+        "fl": ASSOCIATION_FIELDS,
+    }
+
+
 def build_association_table_query(
     entity: List[str],
     category: str,
@@ -220,7 +277,7 @@ def build_multi_entity_association_query(
     limit: int = 20,
 ) -> SolrQuery:
     """Populate a SolrQuery object with association filters"""
-    query = SolrQuery(start=offset, rows=limit)
+    query = SolrQuery(start=offset, rows=limit, field_list=ASSOCIATION_FIELDS)
     if counterpart_category:
         query.add_filter_query(
             f'(subject:"{escape(entity)}" AND object_category:"{escape(counterpart_category)}") OR (object:"{escape(entity)}" AND subject_category:"{escape(counterpart_category)}")'
@@ -242,7 +299,7 @@ def build_search_query(
     highlighting: bool = False,
     sort: Optional[str] = None,
 ) -> SolrQuery:
-    query = SolrQuery(start=offset, rows=limit, sort=sort)
+    query = SolrQuery(start=offset, rows=limit, sort=sort, field_list=SEARCH_RESULT_FIELDS)
     query.q = q
     query.def_type = "edismax"
     query.query_fields = entity_query_fields()
@@ -266,7 +323,7 @@ def build_search_query(
 def build_autocomplete_query(
     q: str, category: List[str] = None, prioritized_predicates: List[AssociationPredicate] = None
 ) -> SolrQuery:
-    query = SolrQuery(q=q, rows=10, start=0)
+    query = SolrQuery(q=q, rows=10, start=0, field_list=SEARCH_RESULT_FIELDS)
     query.q = q
     if category:
         query.add_filter_query(" OR ".join(f'category:"{cat}"' for cat in category))
@@ -290,7 +347,7 @@ def build_mapping_query(
     offset: int = 0,
     limit: int = 20,
 ) -> SolrQuery:
-    query = SolrQuery(start=offset, rows=limit)
+    query = SolrQuery(start=offset, rows=limit, field_list=MAPPING_FIELDS)
     if entity_id:
         query.add_filter_query(" OR ".join([f'subject_id:"{escape(i)}" OR object_id:"{escape(i)}"' for i in entity_id]))
     if subject_id:
@@ -318,7 +375,7 @@ def build_grounding_query(
         category: Optional list of biolink categories (e.g. ["biolink:Disease"]) to
             restrict results to, matched against the entity `category` field.
     """
-    query = SolrQuery(q=text, rows=10, start=0)
+    query = SolrQuery(q=text, rows=10, start=0, field_list=SEARCH_RESULT_FIELDS)
     query.q = f'"{text}"'  # quoting so that the complete text is matched as a unit
     # Prefer keyword/string fields over tokenized fields, and prefer exact_synonym
     # (scope = "this string IS another name for me") over the union `synonym` field
@@ -17,11 +17,25 @@ shared ancestors; Phenodigm = sqrt(Resnik·Jaccard); termset score = bidirection
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from statistics import mean
 from typing import NamedTuple
 
 import duckdb
+import numpy as np
+
+from monarch_py.service.ducksim_bounds import ScoreBounds
+from monarch_py.service.ducksim_cache import ExpiringCache, LRUCache, artifact_identity
+from monarch_py.service.ducksim_embedding import EmbeddingIndex
+from monarch_py.service.ducksim_index import AncestorIndex
+from monarch_py.service.ducksim_minhash import MinHashIndex
+from monarch_py.service.ducksim_pool import ConnectionPool
 
 DEFAULT_PREDICATES = ("rdfs:subClassOf",)
 
@@ -30,7 +44,7 @@ class _Metric(NamedTuple):
     """How to score one semsimian metric. (Only Resnik's two fields differ:
     "ancestor_information_content" is semsimian's name for the Resnik measure.)"""
 
-    detail_key: str  # which per-pair score to read out of an _all_pairs_detail() dict
+    detail_key: str  # which PairMatrix score matrix (from _all_pairs_detail()) to rank by
     sql_rank: str  # SQL expression over the `scored` CTE's resnik/jaccard columns to rank by
 
 
@@ -42,7 +56,191 @@ _METRICS = {
 }
 
 
+# ---- query templates ------------------------------------------------------
+# Per-request queries are constant SQL with their term/entity lists bound as `$name` list parameters
+# (never spliced in as literals), so nothing is formatted or quoted per call.
+
+_ENTITY_PHENOTYPES_SQL = """
+    SELECT en.entity, t.term FROM _ent_ph ep
+    JOIN _entities en ON en.id = ep.entity JOIN _terms t ON t.id = ep.phenotype
+    WHERE en.entity IN (SELECT unnest($ids::VARCHAR[]))
+    ORDER BY en.entity, t.term
+"""
+
+# Ancestors (by term id, with IC where the term has one) of each listed term, for the term cache.
+# The per-request queries below take the cached ancestry as parallel `$anc_term` / `$anc_id` /
+# `$anc_ic` lists instead of joining the on-disk closure each time.
+_ANCESTRY_SQL = """
+    SELECT c.s, list(anc.id ORDER BY anc.id), list(ic.ic ORDER BY anc.id)
+    FROM (SELECT DISTINCT s, o FROM _clo WHERE s IN (SELECT unnest($terms::VARCHAR[]))) c
+    JOIN _terms anc ON anc.term = c.o LEFT JOIN _ic_i ic ON ic.id = anc.id
+    GROUP BY c.s
+"""
+
+_PAIRS_DETAIL_SQL = """
+    WITH s_terms(t) AS (SELECT unnest($subjects::VARCHAR[])),
+         o_terms(t) AS (SELECT unnest($objects::VARCHAR[])),
+         qanc AS MATERIALIZED (SELECT unnest($anc_term::VARCHAR[]) AS t, unnest($anc_id::INTEGER[]) AS a,
+                                      unnest($anc_ic::DOUBLE[]) AS ic),
+         sizes AS (SELECT t, count(*) AS sz FROM qanc GROUP BY t),
+         -- split by side before joining on the ancestor: bound lists carry no statistics, so left to
+         -- itself the planner joins every term's ancestors with every other's first
+         sanc AS MATERIALIZED (SELECT t, a, ic FROM qanc WHERE t IN (SELECT t FROM s_terms) AND ic IS NOT NULL),
+         oanc AS MATERIALIZED (SELECT t, a FROM qanc WHERE t IN (SELECT t FROM o_terms)),
+         -- one row per shared ancestor (with IC) of each (s, o) pair
+         common AS (
+           SELECT sa.t AS s, oa.t AS o, sa.a AS a, sa.ic AS ic
+           FROM sanc sa JOIN oanc oa ON oa.a = sa.a
+         ),
+         detail AS (
+           SELECT c.s, c.o,
+                  count(*) AS inter,            -- |shared ancestors|
+                  max(c.ic) AS resnik,          -- Resnik = max IC over shared ancestors
+                  arg_max(c.a, c.ic) AS mica,    -- the most-informative shared ancestor (MICA)
+                  zs.sz AS sz_s, zo.sz AS sz_o
+           FROM common c JOIN sizes zs ON zs.t = c.s JOIN sizes zo ON zo.t = c.o
+           GROUP BY c.s, c.o, zs.sz, zo.sz
+         )
+    SELECT d.s, d.o, d.inter, d.resnik, t.term AS mica, d.sz_s, d.sz_o
+    FROM detail d JOIN _terms t ON t.id = d.mica
+"""
+
+# Only the query-dependent join runs per call: the entity-side aggregates come from the tables
+# `_ensure_search_tables` built, and pairs are scored per distinct phenotype (its ancestors don't
+# depend on the entity) before fanning out to the entities annotated to it. `{score}` / `{combine}`
+# are filled from _METRICS / _DIRECTION_COMBINERS by _termset_search_sql.
+_TERMSET_SEARCH_SQL = """
+    WITH qterms(q) AS (SELECT unnest($query::VARCHAR[])),
+         q_anc AS (SELECT * FROM (SELECT unnest($anc_term::VARCHAR[]) AS q, unnest($anc_id::INTEGER[]) AS a,
+                                         unnest($anc_ic::DOUBLE[]) AS ic)
+                   WHERE ic IS NOT NULL),
+         qsize AS (SELECT q, count(*) AS sz FROM q_anc GROUP BY q),
+         nq AS (SELECT count(*) AS n FROM qterms),
+         ent_ph AS (SELECT entity AS e, phenotype AS p FROM _ent_ph
+                    WHERE entity IN (SELECT id FROM _entities
+                                     WHERE ($prefix IS NULL OR prefix = $prefix)
+                                       AND ($candidates IS NULL
+                                            OR entity IN (SELECT unnest($candidates::VARCHAR[]))))),
+         -- narrow to the searched entities' phenotypes before the join (not after, as the
+         -- optimizer would): candidate searches then only touch their own phenotypes' ancestors
+         ph_anc AS MATERIALIZED (SELECT p, a FROM _ph_anc WHERE p IN (SELECT p FROM ent_ph)),
+         pair AS (
+           SELECT pa.p, qa.q, count(*) AS inter, max(qa.ic) AS resnik
+           FROM ph_anc pa JOIN q_anc qa ON qa.a = pa.a
+           GROUP BY pa.p, qa.q
+         ),
+         scored AS (
+           SELECT pr.p, pr.q, pr.resnik,
+                  pr.inter::DOUBLE / (ps.sz + qs.sz - pr.inter) AS jaccard
+           FROM pair pr JOIN _psize ps ON ps.p = pr.p
+                        JOIN qsize qs ON qs.q = pr.q
+         ),
+         ranked AS (SELECT p, q, {score} AS score FROM scored),
+         pbest AS (SELECT p, max(score) AS best FROM ranked GROUP BY p),
+         dir1 AS (SELECT ep.e, sum(pb.best) / np.n AS avg1
+                  FROM ent_ph ep JOIN pbest pb ON pb.p = ep.p
+                  JOIN _np np ON np.entity = ep.e GROUP BY ep.e, np.n),
+         dir2 AS (SELECT bm.e, sum(bm.best) / (SELECT n FROM nq) AS avg2
+                  FROM (SELECT ep.e, r.q, max(r.score) AS best
+                        FROM ent_ph ep JOIN ranked r ON r.p = ep.p GROUP BY ep.e, r.q) bm
+                  GROUP BY bm.e)
+    SELECT en.entity, {combine} AS score
+    FROM dir1 d1 FULL OUTER JOIN dir2 d2 ON d1.e = d2.e
+    JOIN _entities en ON en.id = coalesce(d1.e, d2.e)
+    ORDER BY score DESC, en.id LIMIT $limit
+"""
+
+# Many termsets ("profiles") ranked in one statement: the (phenotype, query term) scores don't depend
+# on which profile a term came from, so they are computed once for the union of the profiles' terms;
+# `$qid` / `$qterm` then say which terms make up each profile, and every profile keeps its own top
+# `$limit`. Scores match _TERMSET_SEARCH_SQL's for each profile on its own (Full mode).
+_BATCH_SEARCH_SQL = """
+    WITH members AS (SELECT DISTINCT * FROM (SELECT unnest($qid::INTEGER[]) AS qid,
+                                                    unnest($qterm::VARCHAR[]) AS q)),
+         q_anc AS (SELECT * FROM (SELECT unnest($anc_term::VARCHAR[]) AS q, unnest($anc_id::INTEGER[]) AS a,
+                                         unnest($anc_ic::DOUBLE[]) AS ic)
+                   WHERE ic IS NOT NULL),
+         qsize AS (SELECT q, count(*) AS sz FROM q_anc GROUP BY q),
+         nq AS (SELECT qid, count(*) AS n FROM members GROUP BY qid),
+         ent_ph AS (SELECT entity AS e, phenotype AS p FROM _ent_ph
+                    WHERE entity IN (SELECT id FROM _entities WHERE $prefix IS NULL OR prefix = $prefix)),
+         ph_anc AS MATERIALIZED (SELECT p, a FROM _ph_anc WHERE p IN (SELECT p FROM ent_ph)),
+         pair AS (
+           SELECT pa.p, qa.q, count(*) AS inter, max(qa.ic) AS resnik
+           FROM ph_anc pa JOIN q_anc qa ON qa.a = pa.a
+           GROUP BY pa.p, qa.q
+         ),
+         scored AS (
+           SELECT pr.p, pr.q, pr.resnik,
+                  pr.inter::DOUBLE / (ps.sz + qs.sz - pr.inter) AS jaccard
+           FROM pair pr JOIN _psize ps ON ps.p = pr.p
+                        JOIN qsize qs ON qs.q = pr.q
+         ),
+         ranked AS MATERIALIZED (SELECT p, q, {score} AS score FROM scored),
+         -- each entity's best match for each term, also profile-independent
+         ebest AS MATERIALIZED (SELECT ep.e, r.q, max(r.score) AS best
+                                FROM ent_ph ep JOIN ranked r ON r.p = ep.p GROUP BY ep.e, r.q),
+         pbest AS (SELECT m.qid, r.p, max(r.score) AS best
+                   FROM ranked r JOIN members m ON m.q = r.q GROUP BY m.qid, r.p),
+         dir1 AS (SELECT pb.qid, ep.e, sum(pb.best) / np.n AS avg1
+                  FROM ent_ph ep JOIN pbest pb ON pb.p = ep.p
+                  JOIN _np np ON np.entity = ep.e GROUP BY pb.qid, ep.e, np.n),
+         dir2 AS (SELECT m.qid, eb.e, sum(eb.best) / nq.n AS avg2
+                  FROM ebest eb JOIN members m ON m.q = eb.q JOIN nq ON nq.qid = m.qid
+                  GROUP BY m.qid, eb.e, nq.n),
+         combined AS (SELECT coalesce(d1.qid, d2.qid) AS qid, en.id, en.entity, {combine} AS score
+                      FROM dir1 d1 FULL OUTER JOIN dir2 d2 ON d1.qid = d2.qid AND d1.e = d2.e
+                      JOIN _entities en ON en.id = coalesce(d1.e, d2.e))
+    SELECT qid, entity, score FROM combined
+    QUALIFY $limit IS NULL OR row_number() OVER (PARTITION BY qid ORDER BY score DESC, id) <= $limit
+    ORDER BY qid, score DESC, id
+"""
+
+# profiles ranked per batch-search statement; bounds the statement's (profile, phenotype) fan-out
+_BATCH_SIZE = 64
+
+# nearest embedding neighbours hybrid search reranks per requested result (see ducksim_embedding)
+_EMBEDDING_DEPTH = 20
+
+_FLAT_SQL = """
+    WITH q_anc AS (SELECT DISTINCT unnest($anc_id::INTEGER[]) AS a),
+         qn AS (SELECT count(*) AS n FROM q_anc),
+         -- narrow the phenotype ancestors to the query's before fanning out to entities
+         pq AS (SELECT p, a FROM _ph_anc WHERE a IN (SELECT a FROM q_anc)),
+         inter AS (SELECT ep.entity, count(DISTINCT pq.a) AS inter
+                   FROM _ent_ph ep JOIN pq ON pq.p = ep.phenotype GROUP BY ep.entity)
+    SELECT en.entity, i.inter::DOUBLE / ((SELECT n FROM qn) + e.pn - i.inter) AS jaccard
+    FROM inter i JOIN _ent_size e ON e.entity = i.entity JOIN _entities en ON en.id = i.entity
+    WHERE $prefix IS NULL OR en.prefix = $prefix ORDER BY jaccard DESC, en.id
+"""
+
+# how many best-bound entities topk_search scores first, and how much larger each next batch is
+_TOPK_FIRST_BATCH = 128
+_TOPK_BATCH_GROWTH = 4
+
+# how the per-direction best-match averages combine into an entity's score (the entity is the
+# subject: dir1 = entity->query, dir2 = query->entity)
+_DIRECTION_COMBINERS = {
+    "subject_to_object": "coalesce(d1.avg1, 0)",
+    "object_to_subject": "coalesce(d2.avg2, 0)",
+    "bidirectional": "(coalesce(d1.avg1, 0) + coalesce(d2.avg2, 0)) / 2.0",
+}
+
+
+@lru_cache(maxsize=None)
+def _termset_search_sql(score: str, direction: str) -> str:
+    """The termset-search query for one metric ranking expression and direction."""
+    return _TERMSET_SEARCH_SQL.format(score=score, combine=_DIRECTION_COMBINERS[direction])
+
+
+@lru_cache(maxsize=None)
+def _batch_search_sql(score: str, direction: str) -> str:
+    """The batch termset-search query for one metric ranking expression and direction."""
+    return _BATCH_SEARCH_SQL.format(score=score, combine=_DIRECTION_COMBINERS[direction])
+
+
 def _quote_list(values) -> str:
+    """SQL string literals for setup DDL (views can't take bound parameters)."""
     return ",".join("'" + str(v).replace("'", "''") + "'" for v in values)
 
 
@@ -50,6 +248,82 @@ def _dedupe(seq):
     return list(dict.fromkeys(seq))  # preserve order, drop duplicates
 
 
+class PairMatrix:
+    """Pairwise detail for every (subject term x object term) as dense arrays, rows aligned with
+    `subjects` and columns with `objects`. Pairs sharing no ancestor with IC score 0 with `mica` -1;
+    other `mica` entries index `mica_terms`."""
+
+    def __init__(self, subjects, objects, jaccard, resnik, mica, mica_terms, phenodigm=None):
+        self.subjects, self.objects = list(subjects), list(objects)
+        self.jaccard, self.resnik, self.mica = jaccard, resnik, mica
+        self.phenodigm = np.sqrt(resnik * jaccard) if phenodigm is None else phenodigm
+        self.mica_terms = mica_terms
+        self._rows = {term: i for i, term in enumerate(self.subjects)}
+        self._cols = {term: i for i, term in enumerate(self.objects)}
+
+    @classmethod
+    def from_rows(cls, subjects, objects, rows) -> "PairMatrix":
+        """Fill the matrices from `_PAIRS_DETAIL_SQL` rows (s, o, inter, resnik, mica, sz_s, sz_o)."""
+        shape = (len(subjects), len(objects))
+        jaccard, resnik = np.zeros(shape), np.zeros(shape)
+        mica = np.full(shape, -1, dtype=np.int64)
+        mica_ids = {}
+        row_of = {term: i for i, term in enumerate(subjects)}
+        col_of = {term: i for i, term in enumerate(objects)}
+        for s, o, inter, ic, ancestor, sz_s, sz_o in rows:
+            i, j = row_of[s], col_of[o]
+            jaccard[i, j] = inter / (sz_s + sz_o - inter)
+            resnik[i, j] = ic
+            mica[i, j] = mica_ids.setdefault(ancestor, len(mica_ids))
+        return cls(subjects, objects, jaccard, resnik, mica, list(mica_ids))
+
+    def detail(self, row, col):
+        """{jaccard, resnik, phenodigm, mica} for the pair at (row, col), None if it shares nothing."""
+        mica = int(self.mica[row, col])
+        if mica < 0:
+            return None
+        return {
+            "jaccard": float(self.jaccard[row, col]),
+            "resnik": float(self.resnik[row, col]),
+            "phenodigm": float(self.phenodigm[row, col]),
+            "mica": self.mica_terms[mica],
+        }
+
+    def get(self, subject, obj):
+        """`detail` looked up by term; None for pairs (or terms) not covered."""
+        row, col = self._rows.get(subject), self._cols.get(obj)
+        return None if row is None or col is None else self.detail(row, col)
+
+    def block(self, subjects, objects) -> "PairMatrix":
+        """The sub-matrix for a subset of the terms (e.g. one entity's phenotypes on a search page).
+        Terms this matrix doesn't cover come back as rows/columns of non-matching pairs."""
+        if subjects == self.subjects and objects == self.objects:
+            return self
+        rows = np.array([self._rows.get(t, -1) for t in subjects], dtype=np.int64)
+        cols = np.array([self._cols.get(t, -1) for t in objects], dtype=np.int64)
+        if (rows >= 0).all() and (cols >= 0).all():
+            index = np.ix_(rows, cols)
+            return PairMatrix(
+                subjects,
+                objects,
+                self.jaccard[index],
+                self.resnik[index],
+                self.mica[index],
+                self.mica_terms,
+                self.phenodigm[index],
+            )
+        shape = (len(subjects), len(objects))
+        src = np.ix_(rows[rows >= 0], cols[cols >= 0])
+        dst = np.ix_(rows >= 0, cols >= 0)
+        arrays = []
+        for matrix, fill in ((self.jaccard, 0.0), (self.resnik, 0.0), (self.mica, -1), (self.phenodigm, 0.0)):
+            out = np.full(shape, fill, dtype=matrix.dtype)
+            out[dst] = matrix[src]
+            arrays.append(out)
+        jaccard, resnik, mica, phenodigm = arrays
+        return PairMatrix(subjects, objects, jaccard, resnik, mica, self.mica_terms, phenodigm)
+
+
 class Ducksim:
     """Semantic-similarity engine over `monarch-kg.duckdb` (closure + edges), computed in DuckDB."""
 
@@ -65,19 +339,49 @@ class Ducksim:
         "AND NOT coalesce(try_cast(negated AS BOOLEAN), false)"
     )
 
-    def __init__(self, con: duckdb.DuckDBPyConnection):
+    def __init__(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        *,
+        term_cache_size=10_000,
+        page_cache_size=256,
+        pool_size=4,
+        result_set_size=32,
+        result_set_ttl=300,
+    ):
         self.con = con
+        # connections per-request reads are checked out from (see ducksim_pool)
+        self.pool = ConnectionPool(con, pool_size)
+        # identity of the attached artifact, part of every cache key (see ducksim_cache)
+        self.artifact = None
+        self.term_cache = LRUCache(term_cache_size)  # term -> (ancestor ids, their IC)
+        self.page_cache = LRUCache(page_cache_size)  # search request -> enriched result page
+        # deep search request -> its ranking, held briefly while it's paged through (see `ranking`)
+        self.result_sets = ExpiringCache(result_set_size, result_set_ttl)
+        # optional resident ancestor index (see ducksim_index); None scores pairs in SQL
+        self.index = None
+        # optional MinHash/LSH candidate index for hybrid search (see ducksim_minhash); None uses Flat
+        self.minhash = None
+        # optional IC-weighted embedding index for hybrid search (see ducksim_embedding)
+        self.embedding = None
+        # per-entity score bounds for topk_search (see ducksim_bounds), built on its first use
+        self.bounds = None
+        self._search_tables_lock = threading.Lock()
+        self._search_tables_ready = False
 
-    def _read(self, sql, params=None):
-        """Run a read query on a fresh cursor off the shared connection. The endpoints are sync, so
-        FastAPI runs them in a threadpool; cursors from the same connection still serialize on the
-        connection's internal lock (so intra-worker queries don't truly run in parallel), but a
-        cursor per call keeps concurrent calls from clobbering each other's result state. Real
-        parallelism comes from each uvicorn/gunicorn worker holding its own connection. Cursors
-        share the same DuckDB instance, so they see the attached `src` db and the
-        `_clo`/`_ic`/`_assoc`/`_esize` objects."""
-        cur = self.con.cursor()
-        return cur.execute(sql, params) if params is not None else cur.execute(sql)
+    def _read(self, sql, params=None, *, records=False):
+        """Run a read query on a pooled connection and fetch all of it: rows as tuples, or as
+        column->value dicts with `records`. The endpoints are sync, so FastAPI runs them in a
+        threadpool; each in-flight query holds its own connection (one connection runs one query
+        at a time) and queries on different connections run in parallel. Pooled connections share
+        this DuckDB instance, so they see the attached `src` db, the `_clo`/`_ic`/`_assoc`/`_esize`
+        views and the search tables."""
+        with self.pool.connection() as cur:
+            rows = (cur.execute(sql, params) if params is not None else cur.execute(sql)).fetchall()
+            if not records:
+                return rows
+            cols = [d[0] for d in cur.description]
+        return [dict(zip(cols, row)) for row in rows]
 
     @classmethod
     def from_duckdb(
@@ -92,12 +396,34 @@ class Ducksim:
         associations="default",
         memory_limit="2GB",
         threads=2,
+        resident_index=False,
+        shared_index_dir=None,
+        shared_index_stale_after=24 * 3600,
+        term_cache_size=10_000,
+        page_cache_size=256,
+        pool_size=4,
+        result_set_size=32,
+        result_set_ttl=300,
+        minhash=False,
+        embedding=False,
     ):
         """Attach `path` read-only and define the closure/IC/association views over it.
 
         Read-only attach is what lets many workers share the OS page cache instead of each holding
         the ontology resident; `memory_limit` caps each worker's buffer pool. The attached db must
         carry koza's `information_content` / `closure_size` precompute tables (see module docstring).
+        `resident_index` additionally loads the closure into this worker's memory as an
+        `AncestorIndex`, which the pairwise paths then use instead of the per-query closure join.
+        `shared_index_dir` does the same with an index built once into that directory and
+        memory-mapped read-only by every worker (see `AncestorIndex.shared`); indexes another
+        artifact left there are removed once unused for `shared_index_stale_after` seconds.
+        `term_cache_size` / `page_cache_size` bound the per-worker term-ancestry and search-page
+        caches (0 disables either). `pool_size` is how many of this worker's queries can run at once
+        (see `ConnectionPool`); each of them uses up to `threads` threads. `result_set_size` /
+        `result_set_ttl` bound how many deep rankings are held for paging, and for how many seconds.
+        `minhash` builds a `MinHashIndex` (kept in `shared_index_dir` when given) that hybrid search
+        then draws its candidates from instead of the exact Flat prefilter; `embedding` likewise
+        builds an `EmbeddingIndex`, whose nearest neighbours hybrid search then prefers.
         """
         con = duckdb.connect()
         # Single-quote-escape values interpolated into SQL (path comes from the
@@ -107,12 +433,44 @@ class Ducksim:
         con.execute(f"SET memory_limit = '{safe_mem}'")
         con.execute(f"SET threads = {int(threads)}")
         con.execute(f"ATTACH '{safe_path}' AS src (READ_ONLY)")
-        self = cls(con)
-        self._define_closure(
-            f"SELECT {subject_col} AS s, {predicate_col} AS p, {object_col} AS o FROM src.{closure_table}", predicates
+        self = cls(
+            con,
+            term_cache_size=term_cache_size,
+            page_cache_size=page_cache_size,
+            pool_size=pool_size,
+            result_set_size=result_set_size,
+            result_set_ttl=result_set_ttl,
         )
-        if associations is not None:
-            self._define_associations(cls.DEFAULT_ASSOCIATIONS if associations == "default" else associations)
+        self.artifact = artifact_identity(path)
+        closure_sql = f"SELECT {subject_col} AS s, {predicate_col} AS p, {object_col} AS o FROM src.{closure_table}"
+        self._define_closure(closure_sql, predicates)
+        assoc_sql = cls.DEFAULT_ASSOCIATIONS if associations == "default" else associations
+        if assoc_sql is not None:
+            self._define_associations(assoc_sql)
+        self._define_dictionary()
+        # everything the indexes are derived from: a change to any of it means different indexes
+        definition = json.dumps([self.artifact, closure_sql, list(predicates), assoc_sql])
+        key = hashlib.sha1(definition.encode()).hexdigest()[:16]
+        if shared_index_dir:
+            self.index = AncestorIndex.shared(
+                con, shared_index_dir, key, profiles=self.has_search, stale_after=shared_index_stale_after
+            )
+        elif resident_index:
+            self.index = AncestorIndex.from_ducksim(con, profiles=self.has_search)
+        if (minhash or embedding) and not self.has_search:
+            raise RuntimeError("candidate indexes need associations; pass associations= to from_duckdb")
+        if minhash:
+            self._ensure_search_tables()
+            if shared_index_dir:
+                self.minhash = MinHashIndex.shared(con, shared_index_dir, key, stale_after=shared_index_stale_after)
+            else:
+                self.minhash = MinHashIndex.from_ducksim(con)
+        if embedding:
+            self._ensure_search_tables()
+            if shared_index_dir:
+                self.embedding = EmbeddingIndex.shared(con, shared_index_dir, key, stale_after=shared_index_stale_after)
+            else:
+                self.embedding = EmbeddingIndex.from_ducksim(con)
         return self
 
     # ---- setup ----------------------------------------------------------
@@ -154,6 +512,108 @@ class Ducksim:
         self.con.execute("CREATE VIEW _esize AS SELECT entity, size AS pn FROM src.closure_size")
         self.has_search = True
 
+    def _define_dictionary(self):
+        """Dictionary-encode CURIEs as dense integers, once per worker, so the hot joins compare
+        integers rather than VARCHARs: `_terms` numbers every closure term (and annotated phenotype)
+        in CURIE order, `_ic_i` is the IC table keyed by those ids and, with associations,
+        `_entities` numbers the annotated entities (carrying their CURIE prefix for filtering).
+        Ids sort like their CURIEs, so ORDER BY tie-breaks are unchanged; queries translate back to
+        CURIEs only for the rows they return."""
+        phenotypes = "UNION SELECT phenotype AS t FROM _assoc" if self.has_search else ""
+        self.con.execute(f"""CREATE TABLE _terms AS
+            SELECT (row_number() OVER (ORDER BY t) - 1)::INTEGER AS id, t AS term
+            FROM (SELECT s AS t FROM _clo UNION SELECT o AS t FROM _clo {phenotypes})""")
+        self.con.execute("CREATE TABLE _ic_i AS SELECT t.id, _ic.ic FROM _terms t JOIN _ic ON _ic.term = t.term")
+        if self.has_search:
+            self.con.execute("""CREATE TABLE _entities AS
+                SELECT (row_number() OVER (ORDER BY entity) - 1)::INTEGER AS id, entity,
+                       split_part(entity, ':', 1) AS prefix
+                FROM (SELECT DISTINCT entity FROM _assoc)""")
+
+    def _ensure_search_tables(self):
+        """Materialize the query-independent half of search, once per worker on first use:
+        `_ent_ph` (entity, phenotype) de-duped, `_np` phenotypes per entity, `_ph_anc` the distinct
+        ancestors of every annotated phenotype, `_psize` their count and `_ent_size` each entity's
+        closure size, all in dictionary-encoded ids. They depend only on the KG
+        build, so each search then only computes the query-dependent join. In-memory tables in this
+        worker's DuckDB instance, visible to every cursor; the source artifact stays read-only."""
+        if self._search_tables_ready:
+            return
+        with self._search_tables_lock:
+            if self._search_tables_ready:
+                return
+            # DISTINCT: an entity may be annotated to the same phenotype via multiple association
+            # rows (different evidence/sources). Without dedup, the phenotype's ancestors repeat,
+            # inflating the count(*) intersection past the union size -> a zero or negative jaccard
+            # denominator (inf score; sqrt-of-negative for phenodigm).
+            self.con.execute("""CREATE TABLE _ent_ph AS
+                SELECT DISTINCT en.id AS entity, t.id AS phenotype
+                FROM _assoc a JOIN _entities en ON en.entity = a.entity JOIN _terms t ON t.term = a.phenotype""")
+            self.con.execute("CREATE TABLE _np AS SELECT entity, count(*) AS n FROM _ent_ph GROUP BY entity")
+            self.con.execute("""CREATE TABLE _ph_anc AS
+                SELECT DISTINCT ts.id AS p, tob.id AS a
+                FROM _clo c JOIN _terms ts ON ts.term = c.s JOIN _terms tob ON tob.term = c.o
+                WHERE ts.id IN (SELECT phenotype FROM _ent_ph)""")
+            self.con.execute("CREATE TABLE _psize AS SELECT p, count(*) AS sz FROM _ph_anc GROUP BY p")
+            self.con.execute(
+                "CREATE TABLE _ent_size AS SELECT en.id AS entity, e.pn FROM _esize e JOIN _entities en USING (entity)"
+            )
+            self._search_tables_ready = True
+
+    def _score_bounds(self) -> ScoreBounds:
+        """The `ScoreBounds` of this worker's search tables, read once on first use."""
+        self._ensure_search_tables()
+        if self.bounds is None:
+            with self._search_tables_lock:
+                if self.bounds is None:
+                    with self.pool.connection() as cur:
+                        self.bounds = ScoreBounds.from_ducksim(cur)
+        return self.bounds
+
+    # ---- caches ---------------------------------------------------------
+
+    def _ancestry(self, terms) -> dict:
+        """{term -> (ancestor ids, their IC or None)} through the term cache, reading only the terms
+        not cached yet from the closure. Terms outside the closure map to empty tuples (and are
+        cached as such, so they aren't looked up again)."""
+        terms = _dedupe(terms)
+        cached = self.term_cache.get_many((self.artifact, t) for t in terms)
+        found = {t: cached[(self.artifact, t)] for t in terms if (self.artifact, t) in cached}
+        missing = [t for t in terms if t not in found]
+        if missing:
+            rows = self._read(_ANCESTRY_SQL, {"terms": missing})
+            fetched = {t: (tuple(ids), tuple(ics)) for t, ids, ics in rows}
+            for t in missing:
+                found[t] = fetched.get(t, ((), ()))
+                self.term_cache.put((self.artifact, t), found[t])
+        return found
+
+    def _ancestry_params(self, terms, ancestry=None) -> dict:
+        """The `$anc_term` / `$anc_id` / `$anc_ic` parameters: one element per (term, ancestor).
+        `ancestry` is an already-read `_ancestry` of (at least) `terms`."""
+        if ancestry is None:
+            ancestry = self._ancestry(terms)
+        params = {"anc_term": [], "anc_id": [], "anc_ic": []}
+        for term in _dedupe(terms):
+            ids, ics = ancestry[term]
+            params["anc_term"] += [term] * len(ids)
+            params["anc_id"] += ids
+            params["anc_ic"] += ics
+        return params
+
+    def cache_stats(self) -> dict:
+        """Hit ratios and sizes of this worker's term, search-page and result-set caches."""
+        return {
+            "artifact": self.artifact and self.artifact[0],
+            "terms": self.term_cache.stats(),
+            "pages": self.page_cache.stats(),
+            "result_sets": self.result_sets.stats(),
+        }
+
+    def pool_stats(self) -> dict:
+        """Checkouts of this worker's connection pool and the time queries spent queued for one."""
+        return self.pool.stats()
+
     # ---- labels ---------------------------------------------------------
 
     def labels(self, ids) -> dict:
@@ -161,9 +621,7 @@ class Ducksim:
         ids = [i for i in _dedupe(i for i in ids if i)]
         if not ids:
             return {}
-        rows = self._read(
-            f"SELECT id, name FROM src.nodes WHERE id IN (SELECT unnest([{_quote_list(ids)}]::VARCHAR[]))"
-        ).fetchall()
+        rows = self._read("SELECT id, name FROM src.nodes WHERE id IN (SELECT unnest($ids::VARCHAR[]))", {"ids": ids})
         return {i: name for i, name in rows}
 
     def entity_phenotypes_batch(self, entity_ids) -> dict:
@@ -172,12 +630,11 @@ class Ducksim:
         ids = _dedupe(e for e in entity_ids if e)
         if not ids:
             return {}
+        if self.index is not None and self.index.has_profiles:
+            return self.index.entity_phenotypes(ids)
+        self._ensure_search_tables()
         # ORDER BY for a deterministic, reproducible best-match tie-break.
-        rows = self._read(
-            f"SELECT DISTINCT entity, phenotype FROM _assoc "
-            f"WHERE entity IN (SELECT unnest([{_quote_list(ids)}]::VARCHAR[])) "
-            f"ORDER BY entity, phenotype"
-        ).fetchall()
+        rows = self._read(_ENTITY_PHENOTYPES_SQL, {"ids": ids})
         out = {}
         for e, p in rows:
             out.setdefault(e, []).append(p)
@@ -189,44 +646,23 @@ class Ducksim:
         ids = _dedupe(e for e in entity_ids if e)
         if not ids:
             return {}
-        cur = self._read(f"SELECT * FROM src.nodes WHERE id IN (SELECT unnest([{_quote_list(ids)}]::VARCHAR[]))")
-        cols = [d[0] for d in cur.description]
-        rows = (dict(zip(cols, row)) for row in cur.fetchall())
+        rows = self._read(
+            "SELECT * FROM src.nodes WHERE id IN (SELECT unnest($ids::VARCHAR[]))", {"ids": ids}, records=True
+        )
         return {r["id"]: r for r in rows}
 
     # ---- pairwise detail ------------------------------------------------
 
-    def _all_pairs_detail(self, subjects, objects) -> dict:
+    def _all_pairs_detail(self, subjects, objects) -> PairMatrix:
         """For every (subject term × object term): jaccard, resnik, phenodigm, and the MICA
-        (max-IC shared ancestor). One DuckDB query. Pairs with no shared ancestor are omitted."""
-        subj_q, obj_q = _quote_list(subjects), _quote_list(objects)
-        rows = self._read(f"""
-            WITH s_terms(t) AS (SELECT unnest([{subj_q}]::VARCHAR[])),
-                 o_terms(t) AS (SELECT unnest([{obj_q}]::VARCHAR[])),
-                 allterms AS (SELECT t FROM s_terms UNION SELECT t FROM o_terms),
-                 qanc AS (SELECT DISTINCT s AS t, o AS a FROM _clo WHERE s IN (SELECT t FROM allterms)),
-                 sizes AS (SELECT t, count(*) AS sz FROM qanc GROUP BY t),
-                 -- one row per shared ancestor of each (s, o) pair, carrying its IC
-                 common AS (
-                   SELECT s.t AS s, o.t AS o, sa.a AS a, _ic.ic AS ic
-                   FROM s_terms s JOIN o_terms o ON true
-                   JOIN qanc sa ON sa.t = s.t
-                   JOIN qanc oa ON oa.t = o.t AND oa.a = sa.a
-                   JOIN _ic ON _ic.term = sa.a
-                 )
-            SELECT c.s, c.o,
-                   count(*) AS inter,            -- |shared ancestors|
-                   max(c.ic) AS resnik,          -- Resnik = max IC over shared ancestors
-                   arg_max(c.a, c.ic) AS mica,    -- the most-informative shared ancestor (MICA)
-                   zs.sz AS sz_s, zo.sz AS sz_o
-            FROM common c JOIN sizes zs ON zs.t = c.s JOIN sizes zo ON zo.t = c.o
-            GROUP BY c.s, c.o, zs.sz, zo.sz
-        """).fetchall()
-        out = {}
-        for s, o, inter, resnik, mica, sz_s, sz_o in rows:
-            jaccard = inter / (sz_s + sz_o - inter)
-            out[(s, o)] = {"jaccard": jaccard, "resnik": resnik, "phenodigm": (resnik * jaccard) ** 0.5, "mica": mica}
-        return out
+        (max-IC shared ancestor), as a dense PairMatrix. One DuckDB query, or none with a resident
+        index."""
+        subjects, objects = list(subjects), list(objects)
+        if self.index is not None:
+            return PairMatrix(subjects, objects, *self.index.pair_matrices(subjects, objects))
+        params = {"subjects": subjects, "objects": objects, **self._ancestry_params(subjects + objects)}
+        rows = self._read(_PAIRS_DETAIL_SQL, params)
+        return PairMatrix.from_rows(subjects, objects, rows)
 
     def _similarity(self, s, o, d):
         """semsimian-style similarity map for a (subject, object) pair."""
@@ -250,24 +686,33 @@ class Ducksim:
 
     def _best_matches(self, sources, targets, pairs, metric_key, *, swapped):
         """For each source term, its best-matching target term (by metric_key) + similarity detail.
-        `swapped` reverses the (s,o) key lookup when sources are the object terms."""
+        `pairs` is the comparison's (subject × object) PairMatrix; `swapped` means the sources are
+        its object terms (columns). Ties go to the first target, as in semsimian."""
+        if not targets:  # no match, score floors at 0
+            return {
+                src: {
+                    "match_target": None,
+                    "score": 0.0,
+                    "match_subsumer": None,
+                    "similarity": self._similarity(*((None, src) if swapped else (src, None)), None),
+                }
+                for src in sources
+            }
+        scores = getattr(pairs, metric_key)
+        if swapped:
+            scores = scores.T
+        best = scores.argmax(axis=1)  # first maximum, i.e. the earliest target on ties
+        best_scores = scores[np.arange(len(sources)), best].tolist()
         result = {}
-        for src in sources:
-            best_t, best_d, best_score = None, None, -1.0
-            for tgt in targets:
-                key = (tgt, src) if swapped else (src, tgt)
-                d = pairs.get(key)
-                score = d[metric_key] if d else 0.0
-                if score > best_score:
-                    best_score, best_t, best_d = score, tgt, d
-            if best_score < 0.0:  # no targets at all — no match, score floors at 0
-                best_score = 0.0
-            s_id, o_id = (best_t, src) if swapped else (src, best_t)
+        for i, (src, j) in enumerate(zip(sources, best.tolist())):
+            tgt = targets[j]
+            d = pairs.detail(j, i) if swapped else pairs.detail(i, j)
+            s_id, o_id = (tgt, src) if swapped else (src, tgt)
             result[src] = {
-                "match_target": best_t,
-                "score": best_score,
-                "match_subsumer": best_d["mica"] if best_d else None,
-                "similarity": self._similarity(s_id, o_id, best_d),
+                "match_target": tgt,
+                "score": best_scores[i],
+                "match_subsumer": d["mica"] if d else None,
+                "similarity": self._similarity(s_id, o_id, d),
             }
         return result
 
@@ -288,13 +733,29 @@ class Ducksim:
         pairs = self._all_pairs_detail(subj, obj)
         return self._shape_comparison(subj, obj, pairs, spec.detail_key, metric, direction)
 
+    def termset_multi_compare(
+        self, subjects, object_sets, metric="ancestor_information_content", direction="bidirectional"
+    ) -> list:
+        """`termset_pairwise_similarity` of `subjects` against each of `object_sets`, in order. The
+        pair detail is computed once for the subjects × the union of every set's terms (one DuckDB
+        query, or none with a resident index) and each set is shaped from its block of it, so the
+        cost follows the number of distinct terms rather than the number of sets."""
+        spec = _METRICS.get(metric.lower())
+        if spec is None:
+            raise ValueError(f"unknown metric {metric!r}")
+        subj = _dedupe(subjects)
+        objs = [_dedupe(objects) for objects in object_sets]
+        pairs = self._all_pairs_detail(subj, _dedupe(t for obj in objs for t in obj))
+        return [self._shape_comparison(subj, obj, pairs, spec.detail_key, metric, direction) for obj in objs]
+
     def _shape_comparison(self, subj, obj, pairs, detail_key, metric, direction) -> dict:
-        """Collapse a prefetched (subject×object) `pairs` detail map into the
+        """Collapse a prefetched (subject×object) `pairs` PairMatrix into the
         TermSetPairwiseSimilarity shape. Split out from `termset_pairwise_similarity` so search can
         compute `pairs` once for an entire result page (one DuckDB query) and shape every entity from
         it in memory — no per-entity round-trips. `subj`/`obj` must be pre-deduped, `detail_key` the
-        per-pair score to rank by; `pairs` may cover more terms than this one entity (extra keys are
-        ignored)."""
+        per-pair score to rank by; `pairs` may cover more terms than this one entity (the best
+        matches are reduced over this entity's block of it)."""
+        pairs = pairs.block(subj, obj)
         subject_bm = self._best_matches(subj, obj, pairs, detail_key, swapped=False)
         object_bm = self._best_matches(obj, subj, pairs, detail_key, swapped=True)
         s_scores = [bm["score"] for bm in subject_bm.values()]
@@ -322,63 +783,23 @@ class Ducksim:
 
     # ---- search ---------------------------------------------------------
 
-    def _termset_search(self, query_terms, metric, entity_filter, limit, direction="bidirectional"):
-        """Score entities passing `entity_filter` by termset best-match-average — one DuckDB query.
-        Shared by full_search (filter = prefix) and hybrid_search (Flat candidates). `direction`:
-        the entity is the subject, so subject_to_object = entity->query (dir1), object_to_subject =
-        query->entity (dir2), bidirectional = mean."""
+    def _termset_search(self, query_terms, metric, limit, direction="bidirectional", *, prefix=None, candidates=None):
+        """Score entities (those with CURIE `prefix` and/or among `candidates`) by termset
+        best-match-average — one DuckDB query. Shared by full_search (prefix) and hybrid_search
+        (Flat candidates). `direction`: the entity is the subject, so subject_to_object =
+        entity->query (dir1), object_to_subject = query->entity (dir2), bidirectional = mean."""
         if not self.has_search:
             raise RuntimeError("search needs associations; pass associations= to from_duckdb")
         spec = _METRICS.get(metric.lower())
         if spec is None:
             raise ValueError(f"unknown metric {metric!r}")
-        score_combiner = {
-            "subject_to_object": "coalesce(d1.avg1, 0)",
-            "object_to_subject": "coalesce(d2.avg2, 0)",
-            "bidirectional": "(coalesce(d1.avg1, 0) + coalesce(d2.avg2, 0)) / 2.0",
-        }.get(direction)
-        if score_combiner is None:
+        if direction not in _DIRECTION_COMBINERS:
             raise ValueError(f"unknown direction {direction!r}")
-        Q = _quote_list(set(query_terms))
-        score_expr = spec.sql_rank
-        lim = "" if limit is None else f"LIMIT {int(limit)}"
-        sql = f"""
-        WITH qterms(q) AS (SELECT unnest([{Q}]::VARCHAR[])),
-             q_anc AS (SELECT qt.q AS q, c.o AS a, ic.ic AS ic
-                       FROM qterms qt JOIN _clo c ON c.s = qt.q JOIN _ic ic ON ic.term = c.o),
-             qsize AS (SELECT q, count(*) AS sz FROM q_anc GROUP BY q),
-             nq AS (SELECT count(*) AS n FROM qterms),
-             -- DISTINCT: an entity may be annotated to the same phenotype via multiple association
-             -- rows (different evidence/sources). Without dedup, p_anc repeats that phenotype's
-             -- ancestors, inflating the count(*) intersection below past the union size -> a zero or
-             -- negative jaccard denominator (inf score; sqrt-of-negative for phenodigm). psize already
-             -- uses count(DISTINCT), so the two must agree.
-             ent_ph AS (SELECT DISTINCT entity AS e, phenotype AS p FROM _assoc {entity_filter}),
-             np AS (SELECT e, count(DISTINCT p) AS n FROM ent_ph GROUP BY e),
-             p_anc AS (SELECT ep.e, ep.p, c.o AS a FROM ent_ph ep JOIN _clo c ON c.s = ep.p),
-             psize AS (SELECT e, p, count(DISTINCT a) AS sz FROM p_anc GROUP BY e, p),
-             pair AS (
-               SELECT pa.e, pa.p, qa.q, count(*) AS inter, max(qa.ic) AS resnik
-               FROM p_anc pa JOIN q_anc qa ON qa.a = pa.a GROUP BY pa.e, pa.p, qa.q
-             ),
-             scored AS (
-               SELECT pr.e, pr.p, pr.q, pr.resnik,
-                      pr.inter::DOUBLE / (ps.sz + qs.sz - pr.inter) AS jaccard
-               FROM pair pr JOIN psize ps ON ps.e = pr.e AND ps.p = pr.p
-                            JOIN qsize qs ON qs.q = pr.q
-             ),
-             ranked AS (SELECT e, p, q, {score_expr} AS score FROM scored),
-             dir1 AS (SELECT bm.e, sum(bm.best) / np.n AS avg1
-                      FROM (SELECT e, p, max(score) AS best FROM ranked GROUP BY e, p) bm
-                      JOIN np ON np.e = bm.e GROUP BY bm.e, np.n),
-             dir2 AS (SELECT bm.e, sum(bm.best) / (SELECT n FROM nq) AS avg2
-                      FROM (SELECT e, q, max(score) AS best FROM ranked GROUP BY e, q) bm
-                      GROUP BY bm.e)
-        SELECT coalesce(d1.e, d2.e) AS entity, {score_combiner} AS score
-        FROM dir1 d1 FULL OUTER JOIN dir2 d2 ON d1.e = d2.e
-        ORDER BY score DESC, entity {lim}
-        """
-        return self._read(sql).fetchall()
+        self._ensure_search_tables()
+        query = list(set(query_terms))
+        params = {"query": query, "prefix": prefix, "candidates": candidates, "limit": limit}
+        params.update(self._ancestry_params(query))
+        return self._read(_termset_search_sql(spec.sql_rank, direction), params)
 
     def full_search(
         self, query_terms, *, limit=10, metric="ancestor_information_content", prefix=None, direction="bidirectional"
@@ -386,43 +807,107 @@ class Ducksim:
         """Score every entity (optionally restricted to CURIE `prefix`) by the termset
         best-match-average — one DuckDB query. Matches semsimian's Full mode; more accurate than
         Hybrid (no Jaccard prefilter dropping true-top entities)."""
-        ef = f"WHERE split_part(entity, ':', 1) = {_quote_list([prefix])}" if prefix else ""
-        return self._termset_search(query_terms, metric, ef, limit, direction)
+        return self._termset_search(query_terms, metric, limit, direction, prefix=prefix)
 
     def hybrid_search(
-        self, query_terms, *, limit=10, metric="ancestor_information_content", prefix=None, direction="bidirectional"
+        self,
+        query_terms,
+        *,
+        limit=10,
+        metric="ancestor_information_content",
+        prefix=None,
+        direction="bidirectional",
+        prefilter=None,
     ):
         """Hybrid search — semsimian's production mode: cheap Jaccard prefilter then termset rerank,
-        as one query over the candidate set. (The Jaccard prefilter is direction-agnostic; the
-        rerank honors `direction`.)"""
-        flat = self._flat(query_terms, prefix)
+        as one query over the candidate set. (The prefilters are direction-agnostic; the rerank
+        honors `direction`.) `prefilter` is "flat" (exact Jaccard against every entity), "minhash"
+        (estimated Jaccard for the entities sharing an LSH band with the query) or "embedding" (the
+        `_EMBEDDING_DEPTH` nearest entities per result by IC-weighted embedding); by default the
+        embedding, else MinHash, index when the engine has one."""
+        if prefilter is None:
+            prefilter = "embedding" if self.embedding is not None else "minhash" if self.minhash is not None else "flat"
+        if prefilter == "embedding":
+            if self.embedding is None:
+                raise RuntimeError("no embedding index; pass embedding=True to from_duckdb")
+            params = self._ancestry_params(set(query_terms))
+            depth = max(math.ceil((limit / 1000.0) * self.embedding.size(prefix)), _EMBEDDING_DEPTH * limit)
+            candidates = [e for e, _ in self.embedding.nearest(params["anc_id"], params["anc_ic"], prefix, depth)]
+            if not candidates:
+                return []
+            return self._termset_search(query_terms, metric, limit, direction, candidates=candidates)
+        if prefilter == "minhash":
+            if self.minhash is None:
+                raise RuntimeError("no MinHash index; pass minhash=True to from_duckdb")
+            flat = self.minhash.candidates(self._ancestry_params(set(query_terms))["anc_id"], prefix)
+        elif prefilter == "flat":
+            flat = self._flat(query_terms, prefix)
+        else:
+            raise ValueError(f"unknown prefilter {prefilter!r}")
         if not flat:
             return []
         scores = sorted({j for _, j in flat}, reverse=True)
         k = max(math.ceil((limit / 1000.0) * len(scores)), limit)
         cutoff = scores[k] if k < len(scores) else scores[-1]
         candidates = [e for e, j in flat if j >= cutoff]
-        ef = f"WHERE entity IN (SELECT unnest([{_quote_list(candidates)}]::VARCHAR[]))"
-        return self._termset_search(query_terms, metric, ef, limit, direction)
+        return self._termset_search(query_terms, metric, limit, direction, candidates=candidates)
+
+    def topk_search(
+        self, query_terms, *, limit=10, metric="ancestor_information_content", prefix=None, direction="bidirectional"
+    ):
+        """Exact top-`limit` search — the same ranking as full_search, without scoring every entity.
+        Entities are visited in order of an upper bound on their score (see `ScoreBounds`), computed
+        from query-independent per-phenotype data, and scored in batches that grow by
+        `_TOPK_BATCH_GROWTH`; once the next bound is below the `limit`-th score found so far, no
+        entity left can enter the top."""
+        spec = _METRICS.get(metric.lower())
+        if spec is None:
+            raise ValueError(f"unknown metric {metric!r}")
+        if direction not in _DIRECTION_COMBINERS:
+            raise ValueError(f"unknown direction {direction!r}")
+        if not self.has_search:
+            raise RuntimeError("search needs associations; pass associations= to from_duckdb")
+        if limit <= 0:
+            return []
+        query = list(set(query_terms))
+        entities, bounds = self._score_bounds().rank(
+            self._ancestry(query), spec.detail_key, direction, len(query), prefix
+        )
+        top, start, batch = [], 0, max(limit, _TOPK_FIRST_BATCH)
+        while start < len(entities):
+            if start == 0 and batch >= len(entities):  # everything in one batch: no pruning to do
+                return self.full_search(query, limit=limit, metric=metric, prefix=prefix, direction=direction)
+            end = min(start + batch, len(entities))
+            if len(top) == limit:
+                # the bounds and scores sum in different orders, so keep a margin for rounding
+                floor = top[-1][1] - 1e-9 * max(1.0, abs(top[-1][1]))
+                end = start + int(np.count_nonzero(bounds[start:end] >= floor))
+                if end == start:
+                    break
+            candidates = [e.decode() for e in entities[start:end]]
+            top += self._termset_search(query, metric, limit, direction, candidates=candidates)
+            # same order as the SQL's `score DESC, en.id`: entity ids follow CURIE order
+            top = sorted(top, key=lambda row: (-row[1], row[0]))[:limit]
+            start, batch = end, batch * _TOPK_BATCH_GROWTH
+        return top
 
     def _flat(self, query_terms, prefix):
         """Cheap set-Jaccard ranking of all (prefix) entities vs the query — Hybrid's candidate gen."""
-        Q = _quote_list(set(query_terms))
-        pfilter = f"AND split_part(i.entity, ':', 1) = {_quote_list([prefix])}" if prefix else ""
-        return self._read(f"""
-            WITH qt(t) AS (SELECT unnest([{Q}]::VARCHAR[])),
-                 q_anc AS (SELECT DISTINCT c.o AS a FROM _clo c JOIN qt ON c.s = qt.t),
-                 qn AS (SELECT count(*) AS n FROM q_anc),
-                 inter AS (SELECT a.entity, count(DISTINCT c.o) AS inter
-                           FROM _assoc a JOIN _clo c ON c.s = a.phenotype JOIN q_anc q ON q.a = c.o
-                           GROUP BY a.entity)
-            SELECT i.entity, i.inter::DOUBLE / ((SELECT n FROM qn) + e.pn - i.inter) AS jaccard
-            FROM inter i JOIN _esize e ON e.entity = i.entity
-            WHERE true {pfilter} ORDER BY jaccard DESC, i.entity
-        """).fetchall()
+        self._ensure_search_tables()
+        params = {"prefix": prefix, "anc_id": self._ancestry_params(set(query_terms))["anc_id"]}
+        return self._read(_FLAT_SQL, params)
 
     # ---- search with full per-result detail -----------------------------
 
+    def _ranker(self, metric, mode):
+        """The ranking method for search `mode`, after checking `metric` is known."""
+        if metric.lower() not in _METRICS:
+            raise ValueError(f"unknown metric {metric!r}")
+        rankers = {"hybrid": self.hybrid_search, "full": self.full_search, "topk": self.topk_search}
+        if mode not in rankers:
+            raise ValueError(f"unknown search mode {mode!r}")
+        return rankers[mode]
+
     def search(
         self,
         query_terms,
@@ -433,24 +918,61 @@ class Ducksim:
         direction="bidirectional",
         mode="hybrid",
     ):
-        """All-DuckDB search: rank entities (Hybrid by default; Full when `mode="full"`), then enrich
-        the whole page with full termset detail in a constant number of queries — independent of
-        `limit`, no per-result round-trips. Returns [(entity_id, score, comparison)] where
-        `comparison` matches `termset_pairwise_similarity`'s shape (the entity's phenotypes are the
-        subjects, the query terms the objects — so `comparison["average_score"]` equals `score`).
-        Labels and entity hydration are added by the caller (also batched)."""
-        spec = _METRICS.get(metric.lower())
-        if spec is None:
-            raise ValueError(f"unknown metric {metric!r}")
-        ranker = self.full_search if mode == "full" else self.hybrid_search
+        """All-DuckDB search: rank entities (Hybrid by default; Full when `mode="full"`, or its pruned
+        equivalent `topk_search` when `mode="topk"`), then enrich the whole page with full termset
+        detail in a constant number of queries — independent of `limit`, no per-result round-trips.
+        Returns [(entity_id, score, comparison)] where `comparison` matches
+        `termset_pairwise_similarity`'s shape (the entity's phenotypes are the subjects, the query
+        terms the objects — so `comparison["average_score"]` equals `score`). Labels and entity
+        hydration are added by the caller (also batched).
+
+        Pages are cached per (termset, prefix, metric, direction, mode, limit), so a repeated search
+        — in any term order — is a dictionary lookup; callers must treat the returned comparisons as
+        read-only."""
+        ranker = self._ranker(metric, mode)
+        key = (self.artifact, frozenset(query_terms), prefix, metric.lower(), direction, mode, limit)
+        page = self.page_cache.get(key)
+        if page is not None:
+            return list(page)
         ranked = ranker(query_terms, limit=limit, metric=metric, prefix=prefix, direction=direction)
+        out = self.enrich(ranked, query_terms, metric=metric, direction=direction)
+        self.page_cache.put(key, out)
+        return list(out)
+
+    def ranking(
+        self,
+        query_terms,
+        *,
+        depth=1000,
+        metric="ancestor_information_content",
+        prefix=None,
+        direction="bidirectional",
+        mode="hybrid",
+    ):
+        """The top-`depth` [(entity_id, score)] of a search, without per-result detail: ranked once
+        and held in `result_sets` for a few minutes, so a deep result list is paged through (or
+        streamed) with `enrich` on slices of it instead of ranking again for every page."""
+        ranker = self._ranker(metric, mode)
+        key = (self.artifact, frozenset(query_terms), prefix, metric.lower(), direction, mode, depth)
+        ranked = self.result_sets.get(key)
+        if ranked is None:
+            ranked = ranker(query_terms, limit=depth, metric=metric, prefix=prefix, direction=direction)
+            self.result_sets.put(key, ranked)
+        return ranked
+
+    def enrich(self, ranked, query_terms, *, metric="ancestor_information_content", direction="bidirectional"):
+        """[(entity_id, score)] -> [(entity_id, score, comparison)]: full termset detail for every
+        ranked entity, in a constant number of queries however many there are. The query terms are
+        the objects in sorted order, whatever order the caller gave them in: pages and rankings are
+        cached per set of terms, and best-match ties go to the first object term."""
         if not ranked:
             return []
+        spec = _METRICS[metric.lower()]
         entity_ids = [e for e, _ in ranked]
         pheno_by_entity = self.entity_phenotypes_batch(entity_ids)
-        obj = _dedupe(query_terms)
+        obj = _dedupe(sorted(query_terms))
         # every phenotype across the page, scored against the query once (single DuckDB query); each
-        # entity then reuses the relevant slice of this `pairs` map when shaped below.
+        # entity then reuses its block of this `pairs` matrix when shaped below.
         all_phenos = _dedupe(p for e in entity_ids for p in pheno_by_entity.get(e, []))
         pairs = self._all_pairs_detail(all_phenos, obj)
         out = []
@@ -459,3 +981,59 @@ class Ducksim:
             comparison = self._shape_comparison(subj, obj, pairs, spec.detail_key, metric, direction)
             out.append((entity_id, score, comparison))
         return out
+
+    # ---- batch search ---------------------------------------------------
+
+    def batch_search(
+        self,
+        profiles,
+        *,
+        limit=10,
+        metric="ancestor_information_content",
+        prefix=None,
+        direction="bidirectional",
+        batch_size=_BATCH_SIZE,
+    ):
+        """Rank entities for many termsets ("profiles") at once. Yields each profile's top-`limit`
+        [(entity_id, score)], in input order, ranked as `full_search` ranks it on its own.
+
+        Work shared between profiles is done once: one closure read for the union of every
+        profile's terms, and — per batch of `batch_size` profiles — one statement that scores each
+        (phenotype, term) pair once however many of the batch's profiles contain the term (see
+        `_BATCH_SEARCH_SQL`). Batches are scored concurrently on the connection pool."""
+        spec = _METRICS.get(metric.lower())
+        if spec is None:
+            raise ValueError(f"unknown metric {metric!r}")
+        if direction not in _DIRECTION_COMBINERS:
+            raise ValueError(f"unknown direction {direction!r}")
+        if not self.has_search:
+            raise RuntimeError("search needs associations; pass associations= to from_duckdb")
+        profiles = [_dedupe(profile) for profile in profiles]
+        if not profiles:
+            return
+        self._ensure_search_tables()
+        ancestry = self._ancestry({term for profile in profiles for term in profile})
+        sql = _batch_search_sql(spec.sql_rank, direction)
+
+        def rank(batch):
+            params = {
+                "qid": [qid for qid, profile in enumerate(batch) for _ in profile],
+                "qterm": [term for profile in batch for term in profile],
+                "prefix": prefix,
+                "limit": limit,
+                **self._ancestry_params({term for profile in batch for term in profile}, ancestry),
+            }
+            ranked = [[] for _ in batch]
+            for qid, entity, score in self._read(sql, params):
+                ranked[qid].append((entity, score))
+            return ranked
+
+        with ThreadPoolExecutor(self.pool.size) as executor:
+            # keep every pooled connection busy, without holding more results than that in memory
+            pending = deque()
+            for start in range(0, len(profiles), batch_size):
+                pending.append(executor.submit(rank, profiles[start : start + batch_size]))
+                if len(pending) > self.pool.size:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
@@ -0,0 +1,249 @@
+"""Upper bounds on ducksim termset scores, for exact top-k search without scoring every entity.
+
+A (phenotype p, query term q) pair shares the ancestors anc(p) ∩ anc(q), so it scores at most
+  resnik    the highest IC among the shared ancestors
+  jaccard   m / (|p| + |q| - m), for m the number of shared ancestors
+  phenodigm sqrt(resnik bound * jaccard bound)
+where `|t|` is a term's number of ancestors (with IC, on the query side, as in
+`_TERMSET_SEARCH_SQL`). `ScoreBounds` holds what these need that only depends on the KG build, as
+arrays built once per worker: every annotated phenotype's ancestor count and highest ancestor IC,
+each entity's phenotypes and each phenotype's entities, and, for every ancestor, the phenotypes
+below it.
+
+Per query, ancestors are expanded to the phenotypes below them in decreasing IC order, so the most
+specific (and rarest) come first, until a budget of visited phenotypes is spent. The phenotypes
+reached get their exact best IC and shared-ancestor count over the expanded ancestors; the
+ancestors left over can only add the IC of the first of them and one shared ancestor each, which
+also bounds every phenotype not reached. The cost is bounded by the budget rather than by the size
+of the join the real score needs.
+
+The entity->query bound expands the union of the query terms' ancestors once, and averages the
+entity's phenotypes' bounds as the real score averages their best matches. The query->entity bound
+expands each query term's ancestors, and averages per term the best bound among the entity's
+phenotypes, capped by its best entity->query phenotype bound.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from monarch_py.service.ducksim_index import _csr_indptr
+
+
+def _jaccard(size, shared, query_size):
+    """The jaccard of `shared` ancestors (capped at both sizes) between terms of these sizes"""
+    common = np.minimum(np.minimum(shared, query_size), size)
+    return common / (size + query_size - common)
+
+
+def _best_jaccard(size: np.ndarray, shared: np.ndarray, query_sizes: np.ndarray) -> np.ndarray:
+    """Best `_jaccard` over `query_sizes` (sorted ascending). It grows with the query size up to
+    `shared` and shrinks beyond it, so only the sizes either side count."""
+    pos = np.searchsorted(query_sizes, shared)
+    best = np.zeros(len(size))
+    for near in (query_sizes[np.maximum(pos - 1, 0)], query_sizes[np.minimum(pos, len(query_sizes) - 1)]):
+        best = np.maximum(best, _jaccard(size, shared, near))
+    return best
+
+
+def _pair_bound(score: str, resnik, jaccard):
+    """Bound on a pair's `score` (a `_Metric.detail_key`) from bounds on its resnik and jaccard"""
+    if score == "resnik":
+        return resnik
+    if score == "jaccard":
+        return jaccard
+    return np.sqrt(resnik * jaccard)
+
+
+class ScoreBounds:
+    """Per-phenotype ancestor counts and best IC, the entity <-> phenotype annotations both ways and
+    each ancestor's phenotypes, as flat arrays."""
+
+    def __init__(
+        self,
+        entities,
+        prefixes,
+        indptr,
+        phenotypes,
+        annotated_indptr,
+        annotated,
+        top,
+        size,
+        ancestors,
+        below_indptr,
+        below,
+    ):
+        self.entities = entities  # entity CURIEs (bytes), by `_entities.id`
+        self.prefixes = prefixes  # their CURIE prefixes (bytes)
+        self.indptr = indptr  # CSR row pointers of each entity's slice of `phenotypes`
+        self.phenotypes = phenotypes  # positions in `top` / `size`
+        self.annotated_indptr = annotated_indptr  # CSR row pointers of each phenotype's slice of `annotated`
+        self.annotated = annotated  # entity ids annotated to each phenotype
+        self.top = top  # highest IC among the phenotype's ancestors; -1 if none has one
+        self.size = size  # number of ancestors of the phenotype
+        self.ancestors = ancestors  # term ids of every phenotype ancestor, sorted
+        self.below_indptr = below_indptr  # CSR row pointers of each ancestor's slice of `below`
+        self.below = below  # positions in `top` / `size` of the phenotypes below each ancestor
+
+    @classmethod
+    def from_ducksim(cls, con) -> "ScoreBounds":
+        """Read the bounds' inputs from ducksim's search tables (`_ent_ph` / `_ph_anc` / `_psize`,
+        which `Ducksim._ensure_search_tables` must have created), in dictionary-encoded ids."""
+        entities = con.execute("SELECT entity, prefix FROM _entities ORDER BY id").fetchall()
+        stats = con.execute("""
+            SELECT ps.p, ps.sz, coalesce(max(ic.ic), -1) AS top
+            FROM _psize ps JOIN _ph_anc pa ON pa.p = ps.p LEFT JOIN _ic_i ic ON ic.id = pa.a
+            GROUP BY ps.p, ps.sz ORDER BY ps.p""").fetchnumpy()
+        ent_ph = con.execute("SELECT entity, phenotype FROM _ent_ph ORDER BY entity, phenotype").fetchnumpy()
+        ph_anc = con.execute("SELECT a, p FROM _ph_anc ORDER BY a, p").fetchnumpy()
+        # a phenotype outside the closure has no ancestors, so no pairs: point it at a trailing
+        # entry that never scores
+        pos = np.searchsorted(stats["p"], ent_ph["phenotype"])
+        known = pos < len(stats["p"])
+        known[known] = stats["p"][pos[known]] == ent_ph["phenotype"][known]
+        phenotypes = np.where(known, pos, len(stats["p"]))
+        by_phenotype = np.argsort(phenotypes, kind="stable")
+        ancestors, first = np.unique(ph_anc["a"], return_index=True)
+        return cls(
+            np.array([e.encode() for e, _ in entities], dtype=bytes),
+            np.array([p.encode() for _, p in entities], dtype=bytes),
+            _csr_indptr(ent_ph["entity"], len(entities)),
+            phenotypes,
+            _csr_indptr(phenotypes[by_phenotype], len(stats["p"]) + 1),
+            ent_ph["entity"][by_phenotype],
+            np.append(stats["top"].astype(np.float64), -1.0),
+            np.append(stats["sz"].astype(np.float64), 1.0),
+            ancestors,
+            np.append(first, len(ph_anc["a"])),
+            np.searchsorted(stats["p"], ph_anc["p"]),
+        )
+
+    @staticmethod
+    def _gather(indptr, values, rows):
+        """The concatenated CSR slices of `rows`, and how long each one is"""
+        counts = indptr[rows + 1] - indptr[rows]
+        offsets = np.repeat(indptr[rows] - np.concatenate([[0], np.cumsum(counts)[:-1]]), counts)
+        return values[np.arange(counts.sum()) + offsets], counts
+
+    def _expand(self, ancestor_ids, ancestor_ics, budget):
+        """Expand query ancestors, highest IC first, until `budget` phenotypes were visited:
+        (the phenotypes reached, their best IC and shared ancestor count), and the best IC and
+        count of the ancestors left, which bound the phenotypes not reached."""
+        order = np.argsort(-ancestor_ics, kind="stable")
+        ancestor_ids, ancestor_ics = ancestor_ids[order], ancestor_ics[order]
+        pos = np.minimum(np.searchsorted(self.ancestors, ancestor_ids), len(self.ancestors) - 1)
+        found = self.ancestors[pos] == ancestor_ids
+        sizes = np.where(found, self.below_indptr[pos + 1] - self.below_indptr[pos], 0)
+        expanded = max(1, int(np.searchsorted(np.cumsum(sizes), budget, side="right")))
+        below, counts = self._gather(self.below_indptr, self.below, pos[:expanded][found[:expanded]])
+        reached, inverse = np.unique(below, return_inverse=True)
+        best = np.full(len(reached), -1.0)
+        np.maximum.at(best, inverse, np.repeat(ancestor_ics[:expanded][found[:expanded]], counts))
+        shared = np.bincount(inverse, minlength=len(reached)).astype(np.float64)
+        left = len(ancestor_ids) - expanded
+        rest = ancestor_ics[expanded] if left else -1.0
+        best = np.minimum(np.maximum(best, rest), self.top[reached])
+        shared += np.minimum(left, self.size[reached] - shared)
+        return reached, best, shared, rest, left
+
+    def rank(self, query: dict, score: str, direction: str, n_query: int, prefix=None, budget=None):
+        """(entity CURIEs, their bounds), best bound first (ties in entity order), for the query
+        terms' `query` = {term: (ancestor ids, their IC or None)} of `n_query` distinct terms.
+        `budget` caps the phenotypes visited per expansion (default: 4x as many as there are)."""
+        terms = []
+        for ids, ics in query.values():
+            with_ic = [(a, ic) for a, ic in zip(ids, ics) if ic is not None]
+            if with_ic:
+                terms.append(
+                    (
+                        np.fromiter((a for a, _ in with_ic), dtype=np.int64, count=len(with_ic)),
+                        np.fromiter((ic for _, ic in with_ic), dtype=np.float64, count=len(with_ic)),
+                    )
+                )
+        entities = np.arange(len(self.entities))
+        if prefix is not None:
+            entities = entities[self.prefixes == prefix.encode()]
+        if not terms or not len(entities):
+            return self.entities[:0], np.zeros(0)
+        budget = 4 * len(self.top) if budget is None else budget
+        query_sizes = np.unique([len(ids) for ids, _ in terms]).astype(np.float64)
+
+        # each term expanded on its own: the phenotypes it reached, their bounds against it, and the
+        # floor every other phenotype is bounded by
+        expansions = []
+        for ids, ics in terms:
+            reached, best, shared, rest, left = self._expand(ids, ics, max(1, budget // len(terms)))
+            floor = _pair_bound(score, max(rest, 0.0), min(left, len(ids)) / len(ids)) if left else 0.0
+            value = np.where(
+                (best >= 0) & (shared > 0),
+                _pair_bound(score, np.maximum(best, 0.0), _jaccard(self.size[reached], shared, len(ids))),
+                0.0,
+            )
+            expansions.append((reached, value, floor))
+        floors = np.asarray([floor for _, _, floor in expansions])
+
+        # entity -> query: each phenotype's best over the terms, from their own expansions, and
+        # against the union of their ancestors (which leaves fewer ancestors over)
+        per_term = np.full(len(self.top), floors.max())
+        for reached, value, _ in expansions:
+            np.maximum.at(per_term, reached, value)
+        union = {}
+        for ids, ics in terms:
+            union.update(zip(ids.tolist(), ics.tolist()))
+        reached, best, shared, rest, left = self._expand(
+            np.fromiter(union.keys(), dtype=np.int64, count=len(union)),
+            np.fromiter(union.values(), dtype=np.float64, count=len(union)),
+            budget,
+        )
+        best_ic = np.minimum(rest, self.top)
+        best_ic[reached] = best
+        shared_all = np.minimum(left, self.size)
+        shared_all[reached] = shared
+        phenotype = np.where(
+            (best_ic >= 0) & (shared_all > 0),
+            _pair_bound(score, np.maximum(best_ic, 0.0), _best_jaccard(self.size, shared_all, query_sizes)),
+            0.0,
+        )
+        phenotype = np.minimum(phenotype, per_term)
+        annotated = phenotype[self.phenotypes]
+        counts = np.diff(self.indptr)
+        nonempty = np.flatnonzero(counts)
+        entity_best, avg1 = np.zeros(len(self.entities)), np.zeros(len(self.entities))
+        if len(nonempty):
+            entity_best[nonempty] = np.maximum.reduceat(annotated, self.indptr[nonempty])
+            avg1[nonempty] = np.add.reduceat(annotated, self.indptr[nonempty]) / counts[nonempty]
+
+        # query -> entity: per term, its floor, raised for the entities of the phenotypes it reached
+        raised_entity, raised_term, raised = [], [], []
+        for index, (reached, value, floor) in enumerate(expansions):
+            above = value > floor
+            entity, fanout = self._gather(self.annotated_indptr, self.annotated, reached[above])
+            raised_entity.append(entity)
+            raised_term.append(np.full(len(entity), index))
+            raised.append(np.repeat(value[above], fanout))
+        # sum over terms of min(floor, entity's best), by prefix sums over the sorted floors
+        sorted_floors = np.sort(floors)
+        under = np.searchsorted(sorted_floors, entity_best)
+        avg2 = np.concatenate([[0.0], np.cumsum(sorted_floors)])[under] + (len(floors) - under) * entity_best
+        # plus, per (entity, term) raised above its floor, the best raise (capped the same way)
+        entity, term, value = np.concatenate(raised_entity), np.concatenate(raised_term), np.concatenate(raised)
+        if len(entity):
+            order = np.lexsort((-value, term, entity))
+            entity, term, value = entity[order], term[order], value[order]
+            first = np.ones(len(entity), dtype=bool)
+            first[1:] = (entity[1:] != entity[:-1]) | (term[1:] != term[:-1])
+            entity, term, value = entity[first], term[first], value[first]
+            cap = entity_best[entity]
+            raise_by = np.minimum(value, cap) - np.minimum(floors[term], cap)
+            avg2 += np.bincount(entity, weights=raise_by, minlength=len(self.entities))
+        avg2 /= n_query
+
+        avg1, avg2 = avg1[entities], avg2[entities]
+        if direction == "subject_to_object":
+            bound = avg1
+        elif direction == "object_to_subject":
+            bound = avg2
+        else:
+            bound = (avg1 + avg2) / 2.0
+        order = np.lexsort((entities, -bound))
+        return self.entities[entities[order]], bound[order]
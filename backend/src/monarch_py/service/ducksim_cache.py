@@ -0,0 +1,124 @@
+"""Bounded per-worker caches for ducksim, keyed by the identity of the attached artifact.
+
+Phenotype profiles recur: the same HPO termsets are compared and searched again and again (with the
+same group, metric and direction) from the Phenomizer-style UI. `Ducksim` keeps two `LRUCache`s:
+one from a term to its ancestors and their IC, shared by compare, search and Flat, so the closure
+is read once per term rather than once per query; and one from a search request to its ranked,
+enriched page, so a repeated search is a dictionary lookup. Deep (paginated or streamed) searches
+keep their ranking in an `ExpiringCache` for a few minutes, so later pages are enriched from it
+instead of ranking again.
+
+Entries are keyed by `artifact_identity` of the attached monarch-kg.duckdb, so entries computed
+against one KG build are never served for another.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Tuple
+
+
+def artifact_identity(path) -> Tuple:
+    """(path, size, mtime) of the attached database file: changes whenever the artifact is replaced."""
+    try:
+        stat = os.stat(path)
+    except OSError:  # e.g. ":memory:"; such an artifact can't change under us
+        return (str(path), None, None)
+    return (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+
+
+class LRUCache:
+    """Thread-safe LRU mapping bounded by entry count, with hit/miss/eviction counters."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """The cached entries among `keys`, counting a hit or miss for each key."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return found
+
+    def put(self, key: Hashable, value: Any):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+            }
+
+
+_MISSING = object()
+
+
+class ExpiringCache(LRUCache):
+    """`LRUCache` whose entries also expire `ttl` seconds after they were stored."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        super().__init__(max_entries)
+        self.ttl = ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._entries:
+                expires, value = self._entries[key]
+                if time.monotonic() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        found = {}
+        for key in keys:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                found[key] = value
+        return found
+
+    def put(self, key: Hashable, value: Any):
+        super().put(key, (time.monotonic() + self.ttl, value))
+
+    def stats(self) -> Dict:
+        return {**super().stats(), "ttl": self.ttl}
@@ -0,0 +1,139 @@
+"""IC-weighted ancestor embeddings of ducksim entities' profiles, for nearest-neighbour candidates.
+
+Each annotated entity's profile becomes one fixed-length vector. Its input is the union of the
+entity's phenotypes' ancestors, each weighted by the square of its information content. Signed
+feature hashing folds that into `dim` dimensions: every term id gets one dimension and a random
+sign. The result is a sparse random projection of the IC-weighted ancestor indicator vector.
+Vectors are L2-normalised, so the inner product of two embeddings estimates the IC-weighted cosine
+of the two ancestor sets. Like simGIC, this rewards sharing specific (high-IC) ancestors and
+barely counts sharing the root. Squaring the IC leans further towards the specific ancestors that
+decide a best-match average; it found more of the exact top results than plain IC weighting.
+
+`EmbeddingIndex.nearest` embeds a query the same way. It scores the query against the entities of
+one CURIE prefix with a single matrix-vector product; entity ids follow CURIE order, so a prefix is
+a contiguous block of rows. Hybrid search then reranks the nearest entities exactly, as it does for
+the Jaccard prefilters.
+
+The index is built once per KG build from the closure and IC tables the rest of ducksim reads. Like
+`AncestorIndex`, it is built per worker (`Ducksim.from_duckdb(..., embedding=True)`), or once into
+the shared index directory and then memory-mapped by every worker. `monarch semsim-recall` reports
+its recall against the exact ranking.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from monarch_py.service.ducksim_index import _curies, build_shared, load_arrays, save_arrays
+
+_FORMAT_VERSION = 1
+_ARRAYS = ("entities", "vectors", "prefixes", "prefix_bounds", "buckets", "signs")
+
+
+def _embed(rows: np.ndarray, term_ids: np.ndarray, weights: np.ndarray, n_rows: int, buckets, signs, dim: int):
+    """(n_rows x dim) L2-normalised embeddings; row `rows[i]` gets `weights[i]` in term `term_ids[i]`'s
+    dimension, with its sign"""
+    cells = rows.astype(np.int64) * dim + buckets[term_ids]
+    values = np.bincount(cells, weights=signs[term_ids] * weights, minlength=n_rows * dim).reshape(n_rows, dim)
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    return (values / np.where(norms > 0, norms, 1)).astype(np.float32)
+
+
+class EmbeddingIndex:
+    """Per-entity IC-weighted ancestor embeddings, searched by inner product within a CURIE prefix."""
+
+    def __init__(self, entities, vectors, prefixes, prefix_bounds, buckets, signs):
+        self.entities = entities  # entity CURIEs (bytes), by `_entities.id`
+        self.vectors = vectors  # (entities x dim) float32, L2-normalised
+        self.prefixes = prefixes  # CURIE prefixes (bytes), sorted
+        self.prefix_bounds = prefix_bounds  # (prefixes x 2): first and past-the-last entity id of each
+        self.buckets = buckets  # dimension of every term id
+        self.signs = signs  # +1 / -1 of every term id
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1]
+
+    def __len__(self):
+        return len(self.entities)
+
+    @classmethod
+    def from_ducksim(cls, con, *, dim=256, seed=0) -> "EmbeddingIndex":
+        """Embed every entity's ancestor set from ducksim's search tables (`_ent_ph` / `_ph_anc`, which
+        `Ducksim._ensure_search_tables` must have created), weighting ancestors by `_ic_i`."""
+        entities = con.execute("SELECT entity, prefix FROM _entities ORDER BY id").fetchnumpy()
+        (n_terms,) = con.execute("SELECT count(*) FROM _terms").fetchone()
+        pairs = con.execute("""
+            SELECT DISTINCT ep.entity AS e, pa.a, coalesce(ic.ic, 0) ** 2 AS weight
+            FROM _ent_ph ep JOIN _ph_anc pa ON pa.p = ep.phenotype LEFT JOIN _ic_i ic ON ic.id = pa.a""").fetchnumpy()
+        rng = np.random.default_rng(seed)
+        buckets = rng.integers(0, dim, n_terms, dtype=np.int32)
+        signs = rng.choice(np.array([-1, 1], dtype=np.int8), n_terms)
+        n = len(entities["entity"])
+        vectors = _embed(pairs["e"], pairs["a"], pairs["weight"], n, buckets, signs, dim)
+        entity_prefixes = _curies(list(entities["prefix"]))
+        prefixes, starts, counts = np.unique(entity_prefixes, return_index=True, return_counts=True)
+        if len(prefixes) != np.count_nonzero(entity_prefixes[1:] != entity_prefixes[:-1]) + (n > 0):
+            raise ValueError("entity CURIE prefixes don't form contiguous blocks of ids")
+        bounds = np.stack([starts, starts + counts], axis=1).astype(np.int64)
+        return cls(_curies(list(entities["entity"])), vectors, prefixes, bounds, buckets, signs)
+
+    def save(self, directory):
+        """Write the arrays as `.npy` files under `directory` (which must not exist yet)"""
+        save_arrays(directory, {name: getattr(self, name) for name in _ARRAYS}, _FORMAT_VERSION)
+
+    @classmethod
+    def load(cls, directory, *, mmap=True) -> "EmbeddingIndex":
+        """An index saved by `save`; with `mmap` its arrays are read-only maps of the files"""
+        return cls(**load_arrays(directory, _ARRAYS, mmap=mmap))
+
+    @classmethod
+    def shared(cls, con, directory, key: str, *, dim=256, stale_after=24 * 3600) -> "EmbeddingIndex":
+        """The index for `key` (as for `AncestorIndex.shared`) under `directory`, built once by the
+        first worker and memory-mapped by all of them."""
+        return build_shared(
+            directory,
+            f"{key}.embedding-{dim}",
+            lambda tmp: cls.from_ducksim(con, dim=dim).save(tmp),
+            cls.load,
+            version=_FORMAT_VERSION,
+            artifact_key=key,
+            stale_after=stale_after,
+        )
+
+    def size(self, prefix=None) -> int:
+        """How many entities have CURIE `prefix` (all of them for None)"""
+        start, end = self._bounds(prefix)
+        return end - start
+
+    def _bounds(self, prefix):
+        """First and past-the-last entity id with CURIE `prefix`"""
+        if prefix is None:
+            return 0, len(self.entities)
+        found = np.searchsorted(self.prefixes, prefix.encode())
+        if found == len(self.prefixes) or self.prefixes[found] != prefix.encode():
+            return 0, 0
+        return tuple(int(b) for b in self.prefix_bounds[found])
+
+    def embed(self, ancestor_ids, ics) -> np.ndarray:
+        """The embedding of a set of term ids with their IC (None counts as 0; repeats count once)"""
+        ids, first = np.unique(np.asarray(ancestor_ids, dtype=np.int64), return_index=True)
+        weights = np.array([(ics[i] or 0.0) ** 2 for i in first], dtype=float)
+        rows = np.zeros(len(ids), dtype=np.int64)
+        return _embed(rows, ids, weights, 1, self.buckets, self.signs, self.dim)[0]
+
+    def nearest(self, ancestor_ids, ics, prefix=None, k=10):
+        """[(entity, similarity)] for the `k` entities (with CURIE `prefix`) whose embeddings are most
+        similar to the ancestor set's, most similar first (ties by entity id). Entities sharing no
+        embedding weight with the query (similarity <= 0) are left out."""
+        start, end = self._bounds(prefix)
+        if not len(ancestor_ids) or k <= 0 or start == end:
+            return []
+        scores = self.vectors[start:end] @ self.embed(ancestor_ids, ics)
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[scores[top] > 0]
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(self.entities[start + i].decode(), float(scores[i])) for i in top]
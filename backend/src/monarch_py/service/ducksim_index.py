@@ -0,0 +1,279 @@
+"""Resident, integer-encoded ancestor index for ducksim.
+
+`Ducksim` normally re-derives every term's ancestors per request by joining its `_clo` view against
+the closure on disk. For the pairwise paths (`compare`, `multicompare`, search-page enrichment) that
+join dominates the latency of small termsets. `AncestorIndex` instead loads the closure once per
+worker into a CSR layout — `indptr`/`ancestors` arrays of dense term ids, plus IC aligned by term id —
+and scores term pairs with NumPy set operations, so a typical compare never touches DuckDB. With
+associations it also carries every entity's phenotype profile, in the same CSR layout.
+
+The index costs roughly 8 bytes per closure row of resident memory in every worker, so it's opt-in
+(`Ducksim.from_duckdb(..., resident_index=True)`, `DUCKSIM_RESIDENT_INDEX` in the api settings).
+Alternatively `AncestorIndex.shared` saves it once as plain `.npy` arrays under a directory that every
+worker memory-maps read-only (`DUCKSIM_SHARED_INDEX_DIR`), so the OS keeps a single copy in its page
+cache however many workers there are. Term and entity CURIEs are kept as sorted byte-string arrays
+and looked up by binary search, so no per-worker dictionary grows with the ontology either.
+
+Scores match the SQL path exactly; only the choice between equally informative MICAs is pinned here
+(lowest CURIE wins) where DuckDB's `arg_max` leaves it unspecified.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+# cap on the (subjects x objects x shared ancestors) boolean block scored at once, ~16MB
+_BLOCK_CELLS = 1 << 24
+
+# bump when the saved layout changes, so workers rebuild rather than map an incompatible index
+_FORMAT_VERSION = 1
+_ARRAYS = ("terms", "indptr", "ancestors", "ic", "entities", "profile_indptr", "profiles")
+
+
+def _curies(values) -> np.ndarray:
+    """CURIEs as a byte-string array, which sorts (and searches) in the same byte order as DuckDB"""
+    return np.array([v.encode() for v in values], dtype=bytes) if len(values) else np.array([], dtype="S1")
+
+
+def _lookup(sorted_curies: np.ndarray, curies) -> np.ndarray:
+    """Position of each CURIE in `sorted_curies`, -1 where it is absent"""
+    if not len(curies) or not len(sorted_curies):
+        return np.full(len(curies), -1, dtype=np.int64)
+    keys = _curies(curies)
+    pos = np.minimum(np.searchsorted(sorted_curies, keys), len(sorted_curies) - 1)
+    return np.where(sorted_curies[pos] == keys, pos, -1)
+
+
+class AncestorIndex:
+    """CSR ancestor sets of every closure term, with information content aligned by term id."""
+
+    def __init__(self, terms, indptr, ancestors, ic, entities=None, profile_indptr=None, profiles=None):
+        self.terms = terms  # sorted CURIE bytes; term id = position
+        self.indptr = indptr  # ancestors of term i: ancestors[indptr[i]:indptr[i+1]]
+        self.ancestors = ancestors  # sorted within each term's slice
+        self.ic = ic  # NaN where the term has no information_content row
+        self.entities = entities  # sorted entity CURIE bytes, None without associations
+        self.profile_indptr = profile_indptr  # phenotypes of entity i: profiles[profile_indptr[i]:...]
+        self.profiles = profiles  # term ids, sorted within each entity's slice
+
+    @classmethod
+    def from_ducksim(cls, con, *, profiles=False) -> "AncestorIndex":
+        """Load the index from a connection carrying ducksim's `_clo` view and its `_terms` / `_ic_i`
+        dictionary encoding, so term ids here are the same integers the SQL paths use. `profiles`
+        adds the entity phenotype profiles (needs the `_assoc` / `_entities` objects)."""
+        terms = [t for (t,) in con.execute("SELECT term FROM _terms ORDER BY id").fetchall()]
+        pairs = con.execute("""
+            SELECT ts.id AS s, tob.id AS o
+            FROM (SELECT DISTINCT s, o FROM _clo) c
+            JOIN _terms ts ON ts.term = c.s JOIN _terms tob ON tob.term = c.o
+            ORDER BY s, o""").fetchnumpy()
+        ic_rows = con.execute("SELECT id, ic FROM _ic_i").fetchnumpy()
+        ic = np.full(len(terms), np.nan)
+        ic[ic_rows["id"]] = ic_rows["ic"]
+        index = cls(_curies(terms), _csr_indptr(pairs["s"], len(terms)), pairs["o"].astype(np.int32), ic)
+        if profiles:
+            entities = [e for (e,) in con.execute("SELECT entity FROM _entities ORDER BY id").fetchall()]
+            rows = con.execute("""
+                SELECT DISTINCT en.id AS e, t.id AS p
+                FROM _assoc a JOIN _entities en ON en.entity = a.entity JOIN _terms t ON t.term = a.phenotype
+                ORDER BY e, p""").fetchnumpy()
+            index.entities = _curies(entities)
+            index.profile_indptr = _csr_indptr(rows["e"], len(entities))
+            index.profiles = rows["p"].astype(np.int32)
+        return index
+
+    def save(self, directory):
+        """Write the arrays as `.npy` files under `directory` (which must not exist yet)"""
+        save_arrays(directory, {name: getattr(self, name) for name in _ARRAYS}, _FORMAT_VERSION)
+
+    @classmethod
+    def load(cls, directory, *, mmap=True) -> "AncestorIndex":
+        """An index saved by `save`; with `mmap` its arrays are read-only maps of the files"""
+        return cls(**load_arrays(directory, _ARRAYS, mmap=mmap))
+
+    @classmethod
+    def shared(cls, con, directory, key: str, *, profiles=False, stale_after=24 * 3600) -> "AncestorIndex":
+        """The index for `key` (identifying the artifact and closure/association definitions) under
+        `directory`, memory-mapped. The first worker to get here builds and saves it while holding a
+        lock on the directory; the others wait and then map the same files. Indexes left by other
+        keys (previous KG builds) are removed once no worker has mapped them for `stale_after` seconds."""
+        index = build_shared(
+            directory,
+            key,
+            lambda tmp: cls.from_ducksim(con, profiles=profiles).save(tmp),
+            cls.load,
+            version=_FORMAT_VERSION,
+            stale_after=stale_after,
+        )
+        if profiles and index.entities is None:
+            raise RuntimeError(f"shared ducksim index {directory}/{key} was built without entity profiles")
+        return index
+
+    def __len__(self):
+        return len(self.terms)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the index arrays (shared between workers when memory-mapped)"""
+        return sum(getattr(self, name).nbytes for name in _ARRAYS if getattr(self, name) is not None)
+
+    @property
+    def has_profiles(self) -> bool:
+        return self.entities is not None
+
+    def term(self, term_id: int) -> str:
+        return self.terms[term_id].decode()
+
+    def ancestors_of(self, term_id: int) -> np.ndarray:
+        """Sorted ancestor ids of a term (reflexive, as the closure is)"""
+        return self.ancestors[self.indptr[term_id] : self.indptr[term_id + 1]]
+
+    def encode(self, curies) -> list:
+        """(curie, term id) for each CURIE in the dictionary; terms outside it have no ancestors"""
+        curies = list(curies)
+        return [(c, int(i)) for c, i in zip(curies, _lookup(self.terms, curies)) if i >= 0]
+
+    def entity_phenotypes(self, entity_ids) -> dict:
+        """`Ducksim.entity_phenotypes_batch` from the stored profiles: {entity -> [phenotype, ...]}"""
+        entity_ids = list(entity_ids)
+        out = {}
+        for entity, i in zip(entity_ids, _lookup(self.entities, entity_ids)):
+            if i >= 0:
+                phenotypes = self.profiles[self.profile_indptr[i] : self.profile_indptr[i + 1]]
+                out[entity] = [self.term(p) for p in phenotypes.tolist()]
+        return out
+
+    def _membership(self, term_ids, universe) -> np.ndarray:
+        """Boolean (term x universe) matrix: which of `universe`'s ancestors each term has"""
+        matrix = np.zeros((len(term_ids), len(universe)), dtype=bool)
+        position = {a: col for col, a in enumerate(universe.tolist())}
+        for row, term_id in enumerate(term_ids):
+            cols = [position[a] for a in self.ancestors_of(term_id).tolist() if a in position]
+            matrix[row, cols] = True
+        return matrix
+
+    def pair_matrices(self, subjects, objects):
+        """`Ducksim._all_pairs_detail` computed from the resident index: dense (subject x object)
+        jaccard and resnik matrices, a MICA matrix (-1 where a pair shares no ancestor with IC, or
+        either term is outside the index) and the MICA CURIEs its entries index."""
+        shape = (len(subjects), len(objects))
+        jaccard, resnik = np.zeros(shape), np.zeros(shape)
+        mica = np.full(shape, -1, dtype=np.int64)
+        s_pos, o_pos = _lookup(self.terms, subjects), _lookup(self.terms, objects)
+        rows, cols = np.flatnonzero(s_pos >= 0), np.flatnonzero(o_pos >= 0)
+        if not len(rows) or not len(cols):
+            return jaccard, resnik, mica, []
+        s_ids, o_ids = s_pos[rows], o_pos[cols]
+        s_anc = np.unique(np.concatenate([self.ancestors_of(i) for i in s_ids]))
+        o_anc = np.unique(np.concatenate([self.ancestors_of(i) for i in o_ids]))
+        shared = np.intersect1d(s_anc, o_anc, assume_unique=True)
+        shared = shared[~np.isnan(self.ic[shared])]
+        if not len(shared):
+            return jaccard, resnik, mica, []
+        # most informative first (ties to the lowest term id), so a pair's MICA is its first shared column
+        shared = shared[np.lexsort((shared, -self.ic[shared]))]
+        ms, mo = self._membership(s_ids, shared), self._membership(o_ids, shared)
+        inter = ms.astype(np.float32) @ mo.T.astype(np.float32)  # exact: counts are far below 2**24
+        first = np.zeros(inter.shape, dtype=np.int64)
+        step = max(1, _BLOCK_CELLS // (len(o_ids) * len(shared)))
+        for start in range(0, len(s_ids), step):
+            block = ms[start : start + step, None, :] & mo[None, :, :]
+            first[start : start + step] = block.argmax(axis=2)
+        sz_s = self.indptr[s_ids + 1] - self.indptr[s_ids]
+        sz_o = self.indptr[o_ids + 1] - self.indptr[o_ids]
+        n = inter.astype(np.float64)
+        union = sz_s[:, None] + sz_o[None, :] - n
+        found = n > 0
+        # scatter the encoded rows/columns back to their positions in `subjects` / `objects`
+        block_mica = np.where(found, shared[first], -1)
+        jaccard[np.ix_(rows, cols)] = np.where(found, n / np.where(found, union, 1), 0.0)
+        resnik[np.ix_(rows, cols)] = np.where(found, self.ic[np.maximum(block_mica, 0)], 0.0)
+        # renumber the MICAs densely so only the CURIEs actually used are decoded
+        micas = np.unique(block_mica[found])
+        mica[np.ix_(rows, cols)] = np.where(found, np.searchsorted(micas, block_mica), -1)
+        return jaccard, resnik, mica, [self.term(i) for i in micas.tolist()]
+
+
+def build_shared(directory, name: str, build, load, *, version: int, artifact_key: str = None, stale_after=24 * 3600):
+    """`load(directory / name)`, built by `build(path)` first unless it already holds arrays saved in
+    layout `version` (see `save_arrays`). The first worker to get here builds into a temporary
+    directory while holding a lock on `directory` and then moves it into place; the others wait and
+    then use the same files. Loading (memory-mapping) happens under the lock too, so another worker
+    can't remove the files in between, and marks the directory as used.
+
+    Workers on another artifact may share `directory` during a rolling deploy, so directories for
+    other artifacts (names not starting with `artifact_key`, by default `name`) are only removed once
+    none has been loaded for `stale_after` seconds. A mapped file that is removed stays readable."""
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    target = root / name
+    artifact_key = artifact_key or name
+    with open(root / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not is_complete(target, version):
+            logger.info(f"Building shared ducksim index {target}")
+            shutil.rmtree(target, ignore_errors=True)  # left incomplete by a crashed build
+            tmp = root / f".{name}.{os.getpid()}.tmp"
+            shutil.rmtree(tmp, ignore_errors=True)
+            build(tmp)
+            os.replace(tmp, target)
+        loaded = load(target)
+        os.utime(target)
+        _remove_stale(root, artifact_key, stale_after)
+    return loaded
+
+
+def _remove_stale(root: Path, artifact_key: str, stale_after: float):
+    """Remove other artifacts' index directories that no worker has loaded for `stale_after` seconds"""
+    cutoff = time.time() - stale_after
+    for stale in root.iterdir():
+        if stale.is_dir() and not stale.name.startswith(artifact_key) and stale.stat().st_mtime < cutoff:
+            logger.info(f"Removing shared ducksim index for another artifact, unused since {cutoff:.0f}: {stale}")
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def save_arrays(directory, arrays: dict, version: int):
+    """Write `arrays` (name -> array; None is skipped) as `.npy` files under `directory`, which must
+    not exist yet, and then a meta.json recording their layout `version`"""
+    directory = Path(directory)
+    directory.mkdir(parents=True)
+    for name, array in arrays.items():
+        if array is not None:
+            np.save(directory / f"{name}.npy", array)
+    # written last: a directory with meta.json holds a complete set of arrays
+    (directory / "meta.json").write_text(json.dumps({"format": version}))
+
+
+def load_arrays(directory, names, *, mmap=True) -> dict:
+    """The arrays among `names` that `save_arrays` wrote under `directory`; with `mmap` they are
+    read-only maps of the files"""
+    directory = Path(directory)
+    mode = "r" if mmap else None
+    return {
+        name: np.load(directory / f"{name}.npy", mmap_mode=mode)
+        for name in names
+        if (directory / f"{name}.npy").exists()
+    }
+
+
+def is_complete(directory, version: int) -> bool:
+    """Whether `directory` holds arrays saved by `save_arrays` in layout `version`"""
+    try:
+        return json.loads((Path(directory) / "meta.json").read_text()).get("format") == version
+    except (OSError, ValueError):
+        return False
+
+
+def _csr_indptr(row_ids, n_rows) -> np.ndarray:
+    """CSR row pointers for `row_ids` sorted ascending"""
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row_ids, minlength=n_rows), out=indptr[1:])
+    return indptr
@@ -0,0 +1,98 @@
+"""Connection pool for ducksim's per-request queries.
+
+The semsim endpoints are sync, so FastAPI runs them on its threadpool, and a worker can have many
+ducksim queries in flight at once. Each query needs a DuckDB connection of its own: one connection
+runs one query at a time. `ConnectionPool` holds a fixed set of connections to the engine's database
+(created with `cursor()`, so they share the attached artifact, the views and the in-memory search
+tables) and hands them out first come, first served. A connection given back goes straight to the
+longest-waiting thread, so a burst of new requests can't starve one that is already queued. Time
+spent waiting for a connection is counted in `stats()`.
+
+DuckDB runs queries from different connections in parallel (the GIL is released while a query
+executes), and each query also fans out over the database's `threads`. Sizing the pool at about
+cores / threads keeps concurrent requests from oversubscribing the worker's CPUs.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import duckdb
+
+
+class _Waiter:
+    """A thread queued for a connection, woken with the connection it was handed"""
+
+    __slots__ = ("event", "connection")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.connection: Optional[duckdb.DuckDBPyConnection] = None
+
+
+class ConnectionPool:
+    """Fixed-size, FIFO-fair pool of connections to one DuckDB database, with queue-wait counters."""
+
+    def __init__(self, con: duckdb.DuckDBPyConnection, size: int):
+        self.size = max(1, size)
+        self._idle = deque(con.cursor() for _ in range(self.size))
+        self._waiters: "deque[_Waiter]" = deque()
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._waited = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._peak_waiting = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Check out a connection for the duration of the block, waiting in line if none is idle."""
+        start = time.perf_counter()
+        waiter = None
+        with self._lock:
+            if self._idle and not self._waiters:
+                connection = self._idle.popleft()
+            else:
+                waiter = _Waiter()
+                self._waiters.append(waiter)
+                self._peak_waiting = max(self._peak_waiting, len(self._waiters))
+        if waiter is not None:
+            waiter.event.wait()
+            connection = waiter.connection
+        waited = time.perf_counter() - start
+        with self._lock:
+            self._checkouts += 1
+            if waiter is not None:
+                self._waited += 1
+                self._wait_seconds += waited
+                self._max_wait_seconds = max(self._max_wait_seconds, waited)
+        try:
+            yield connection
+        finally:
+            self._release(connection)
+
+    def _release(self, connection: duckdb.DuckDBPyConnection):
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.connection = connection
+                waiter.event.set()
+            else:
+                self._idle.append(connection)
+
+    def stats(self) -> Dict:
+        """Checkouts, how many had to queue and for how long (seconds), and current/peak queue depth."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "in_use": self.size - len(self._idle),
+                "waiting": len(self._waiters),
+                "peak_waiting": self._peak_waiting,
+                "checkouts": self._checkouts,
+                "waited": self._waited,
+                "wait_seconds_total": round(self._wait_seconds, 6),
+                "wait_seconds_max": round(self._max_wait_seconds, 6),
+                "wait_seconds_mean": round(self._wait_seconds / self._waited, 6) if self._waited else None,
+            }
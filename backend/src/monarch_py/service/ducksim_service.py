@@ -5,9 +5,21 @@ models, but computes everything against the read-only monarch-kg.duckdb instead
 semsimian HTTP server. See `monarch_py/service/ducksim.py` for the engine.
 """
 
-from typing import Any, List
+import base64
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
 
-from monarch_py.api.additional_models import SemsimDirectionality, SemsimMetric, SemsimMultiCompareRequest
+from monarch_py.api.additional_models import (
+    SemsimBatchSearchResult,
+    SemsimDirectionality,
+    SemsimMetric,
+    SemsimMultiCompareRequest,
+    SemsimProfile,
+    SemsimSearchGroup,
+    SemsimSearchPage,
+    SemsimSearchPageRequest,
+)
 from monarch_py.datamodels.model import (
     BestMatch,
     Entity,
@@ -23,8 +35,9 @@ from monarch_py.service.ducksim import Ducksim
 class DucksimService:
     """Semantic-similarity service computed in DuckDB (semsimian-equivalent)."""
 
-    def __init__(self, engine: Ducksim, entity_implementation: Any = None):
+    def __init__(self, engine: Ducksim, entity_implementation: Any = None, search_mode: str = "hybrid"):
         self.engine = engine
+        self.search_mode = search_mode  # see `Ducksim.search`
         # Retained for interface parity with SemsimianService; the DuckDB backend hydrates result
         # entities from the KG `nodes` table itself (see `_hydrate`), so it needs no external store.
         self.entity_implementation = entity_implementation
@@ -42,14 +55,22 @@ class DucksimService:
         return self._to_model(result, lab)
 
     def multi_compare(self, request: SemsimMultiCompareRequest) -> List[SemsimSearchResult]:
+        # every object set is scored from one shared pair-detail query, then labelled with one lookup
+        comparisons = self.engine.termset_multi_compare(
+            request.subjects, [object_set.phenotypes for object_set in request.object_sets], str(request.metric)
+        )
+        ids = set()
+        for comparison in comparisons:
+            ids |= self._referenced_ids(comparison)
+        lab = self.engine.labels(ids)
         results = []
-        for object_set in request.object_sets:
-            comparison = self.compare(request.subjects, object_set.phenotypes, request.metric)
+        for object_set, comparison in zip(request.object_sets, comparisons):
+            similarity = self._to_model(comparison, lab)
             results.append(
                 SemsimSearchResult(
                     subject=Entity(id=object_set.id, name=object_set.label),
-                    score=comparison.average_score,
-                    similarity=comparison,
+                    score=similarity.average_score,
+                    similarity=similarity,
                 )
             )
         return results
@@ -64,11 +85,110 @@ class DucksimService:
         directionality: SemsimDirectionality = SemsimDirectionality.BIDIRECTIONAL,
         limit: int = 10,
     ) -> List[SemsimSearchResult]:
-        # Hybrid mode matches the semsimian server; full_search would be more accurate (see engine).
-        # The engine ranks and enriches the whole page in a constant number of DuckDB queries (no
-        # per-result round-trips); the loop below is pure in-memory model shaping.
-        direction = directionality.value if hasattr(directionality, "value") else str(directionality)
-        page = self.engine.search(termset, limit=limit, metric=str(metric), prefix=prefix, direction=direction)
+        # Hybrid mode (the default) matches the semsimian server; "full" ranks exactly (see engine).
+        page = self.engine.search(
+            termset,
+            limit=limit,
+            metric=str(metric),
+            prefix=prefix,
+            direction=self._direction(directionality),
+            mode=self.search_mode,
+        )
+        return self._results(page)
+
+    def search_page(
+        self,
+        termset: List[str],
+        prefix: str,
+        metric: SemsimMetric = SemsimMetric.ANCESTOR_INFORMATION_CONTENT,
+        directionality: SemsimDirectionality = SemsimDirectionality.BIDIRECTIONAL,
+        depth: int = 1000,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> SemsimSearchPage:
+        """One page of the top-`depth` results. The ranking is computed once and held by the engine
+        for a few minutes, so each further page only enriches its own results. `next_cursor` encodes
+        the whole request, so any worker can serve the next page (ranking again if it must)."""
+        direction = self._direction(directionality)
+        ranked = self.engine.ranking(
+            termset, depth=depth, metric=str(metric), prefix=prefix, direction=direction, mode=self.search_mode
+        )
+        page = self.engine.enrich(ranked[offset : offset + limit], termset, metric=str(metric), direction=direction)
+        next_cursor = None
+        if offset + limit < len(ranked):
+            next_cursor = _encode_cursor([termset, prefix, str(metric), direction, depth, offset + limit, limit])
+        return SemsimSearchPage(
+            items=self._results(page), offset=offset, limit=limit, total=len(ranked), next_cursor=next_cursor
+        )
+
+    def search_page_at(self, cursor: str) -> SemsimSearchPage:
+        """The page a `next_cursor` points at. Raises ValueError for a malformed cursor."""
+        termset, prefix, metric, direction, depth, offset, limit = _decode_cursor(cursor)
+        return self.search_page(termset, prefix, metric, direction, depth=depth, offset=offset, limit=limit)
+
+    def search_stream(
+        self,
+        termset: List[str],
+        prefix: str,
+        metric: SemsimMetric = SemsimMetric.ANCESTOR_INFORMATION_CONTENT,
+        directionality: SemsimDirectionality = SemsimDirectionality.BIDIRECTIONAL,
+        depth: int = 1000,
+        offset: int = 0,
+        chunk: int = 50,
+    ) -> Iterator[List[SemsimSearchResult]]:
+        """The top-`depth` results from `offset` on, enriched and yielded `chunk` at a time. Ranks
+        before returning, so a bad request fails here rather than part-way through a response."""
+        direction = self._direction(directionality)
+        ranked = self.engine.ranking(
+            termset, depth=depth, metric=str(metric), prefix=prefix, direction=direction, mode=self.search_mode
+        )
+
+        def chunks():
+            for start in range(offset, len(ranked), chunk):
+                page = self.engine.enrich(
+                    ranked[start : start + chunk], termset, metric=str(metric), direction=direction
+                )
+                yield self._results(page)
+
+        return chunks()
+
+    def batch_search(
+        self,
+        profiles: Iterable[SemsimProfile],
+        prefix: str,
+        metric: SemsimMetric = SemsimMetric.ANCESTOR_INFORMATION_CONTENT,
+        directionality: SemsimDirectionality = SemsimDirectionality.BIDIRECTIONAL,
+        limit: int = 10,
+    ) -> Iterator[SemsimBatchSearchResult]:
+        """Top-`limit` entities for each of many profiles, yielded in input order as they are ranked.
+        Profiles are ranked exactly (as in "full" mode) by `Ducksim.batch_search`, and results carry
+        scores and hydrated entities but no per-result similarity detail."""
+        profiles = list(profiles)
+        ranked = zip(
+            profiles,
+            self.engine.batch_search(
+                [profile.termset for profile in profiles],
+                limit=limit,
+                metric=str(metric),
+                prefix=prefix,
+                direction=self._direction(directionality),
+            ),
+        )
+        # hydrate the entities of a run of profiles at a time: one `nodes` lookup per run
+        while chunk := list(islice(ranked, 64)):
+            entities = self.engine.entities({entity_id for _, rows in chunk for entity_id, _ in rows})
+            for profile, rows in chunk:
+                yield SemsimBatchSearchResult(
+                    id=profile.id,
+                    results=[
+                        SemsimSearchResult(subject=self._hydrate(entities.get(entity_id), entity_id), score=score)
+                        for entity_id, score in rows
+                    ],
+                )
+
+    def _results(self, page) -> List[SemsimSearchResult]:
+        """Engine search rows -> result models. The engine ranks and enriches the whole page in a
+        constant number of DuckDB queries (no per-result round-trips); this is pure in-memory shaping."""
         if not page:
             return []
         # all-DuckDB hydration of result entities from the KG `nodes` table — no external entity store
@@ -87,6 +207,10 @@ class DucksimService:
             for entity_id, score, comparison in page
         ]
 
+    @staticmethod
+    def _direction(directionality) -> str:
+        return directionality.value if hasattr(directionality, "value") else str(directionality)
+
     # ---- model shaping --------------------------------------------------
 
     def _hydrate(self, row: dict, entity_id: str) -> Entity:
@@ -150,3 +274,33 @@ class DucksimService:
             best_score=r["best_score"],
             metric=r["metric"],
         )
+
+
+def _encode_cursor(request: list) -> str:
+    return base64.urlsafe_b64encode(json.dumps(request, separators=(",", ":")).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> list:
+    """A cursor's request, held to the same bounds as a POST /semsim/search/pages body"""
+    try:
+        termset, prefix, metric, direction, depth, offset, limit = json.loads(base64.urlsafe_b64decode(cursor))
+        request = SemsimSearchPageRequest(
+            termset=termset,
+            group=SemsimSearchGroup[prefix],
+            metric=metric,
+            directionality=direction,
+            depth=depth,
+            offset=offset,
+            limit=limit,
+        )
+    except (ValueError, TypeError, KeyError) as e:  # pydantic's ValidationError is a ValueError
+        raise ValueError(f"invalid search cursor: {cursor!r}") from e
+    return [
+        request.termset,
+        request.group.name,
+        request.metric,
+        request.directionality,
+        request.depth,
+        request.offset,
+        request.limit,
+    ]
@@ -0,0 +1,375 @@
+"""Response cache for entity `Node`s, keyed by `(kg_version, entity_id)`.
+
+Building a `Node` costs a dozen Solr lookups (hierarchy, association counts, mappings, cross-species
+clique, ...), yet its content only changes when a new KG is released and loaded. `NodeCache` keeps
+built nodes in an LRU in-process tier, optionally backed by an on-disk tier that survives restarts,
+and drops everything as soon as it is asked about a different KG version.
+
+The KG version is not `MONARCH_KG_VERSION`, which is fixed when the worker starts: a new KG loaded
+into Solr under a running worker would never invalidate anything. `KGVersion` reads the version off
+Solr (see `AsyncSolrImplementation.get_index_version`) every `refresh_after` seconds instead, so a
+reload is noticed within that time.
+
+Tiers are pluggable: anything implementing `NodeCacheTier` can be stacked behind the memory tier.
+A hit in a slower tier is promoted into the faster ones. Tiers that do I/O are marked `blocking`;
+async callers use `aget` / `aput`, which run those tiers in a worker thread so the event loop only
+ever touches the memory tier.
+
+The disk tier is only used when the KG version is known: while Solr's version cannot be read
+(reported as "unknown") there is no way to tell a restart on the same KG from a restart on a new one.
+Nor can a reload be noticed, so memory entries for the unknown version expire after `unknown_ttl`
+seconds. Workers on different KG versions may share the disk tier's directory during a rolling
+deploy, so another version's entries are only removed once none of them has been used for
+`stale_after` seconds.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol
+
+from loguru import logger
+
+from monarch_py.datamodels.model import Node
+
+UNKNOWN_VERSION = "unknown"
+
+
+class NodeCacheTier(Protocol):
+    """One storage layer of a `NodeCache`. Implementations must be thread-safe."""
+
+    name: str
+    blocking: bool  # does file or network I/O, so async callers must not run it on the event loop
+
+    def get(self, kg_version: str, entity_id: str) -> Optional[Node]: ...
+
+    def put(self, kg_version: str, entity_id: str, node: Node): ...
+
+    def invalidate(self, kg_version: str):
+        """Drop every entry that does not belong to `kg_version`."""
+        ...
+
+    def stats(self) -> Dict[str, int]: ...
+
+
+class MemoryTier:
+    """In-process LRU of built nodes, bounded by entry count. Nodes stored under the unknown KG
+    version expire after `unknown_ttl` seconds, since a KG reload would go unnoticed."""
+
+    name = "memory"
+    blocking = False
+
+    def __init__(self, max_entries: int, unknown_ttl: float = 60):
+        self.max_entries = max_entries
+        self.unknown_ttl = unknown_ttl
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (node, stored at)
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, kg_version: str, entity_id: str) -> Optional[Node]:
+        with self._lock:
+            entry = self._entries.get((kg_version, entity_id))
+            if entry is None:
+                return None
+            node, stored_at = entry
+            if kg_version == UNKNOWN_VERSION and time.monotonic() - stored_at >= self.unknown_ttl:
+                del self._entries[(kg_version, entity_id)]
+                return None
+            self._entries.move_to_end((kg_version, entity_id))
+            return node
+
+    def put(self, kg_version: str, entity_id: str, node: Node):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(kg_version, entity_id)] = (node, time.monotonic())
+            self._entries.move_to_end((kg_version, entity_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, kg_version: str):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] != kg_version]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, "evictions": self.evictions}
+
+
+class DiskTier:
+    """Nodes serialized as JSON under `<root>/<kg_version>/`, LRU by file mtime, bounded by entry count.
+
+    Writes go through a temp file and `os.replace`, so concurrent workers sharing the directory never
+    read a half-written node. Another KG version's directory is removed once it has gone unused for
+    `stale_after` seconds, not while workers still on that version may be reading it.
+    """
+
+    name = "disk"
+    blocking = True
+
+    def __init__(self, root: str, max_entries: int, stale_after: float = 24 * 3600):
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+        self._entries: Dict[str, int] = {}  # kg_version -> file count, counted lazily
+        self.evictions = 0
+        self.errors = 0
+
+    @staticmethod
+    def _version_dir_name(kg_version: str) -> str:
+        return re.sub(r"[^A-Za-z0-9._-]", "_", kg_version)
+
+    def _path(self, kg_version: str, entity_id: str) -> Path:
+        digest = hashlib.sha1(entity_id.encode()).hexdigest()
+        return self.root / self._version_dir_name(kg_version) / f"{digest}.json"
+
+    def get(self, kg_version: str, entity_id: str) -> Optional[Node]:
+        path = self._path(kg_version, entity_id)
+        try:
+            node = Node.model_validate_json(path.read_bytes())
+            os.utime(path)  # mark as recently used
+            return node
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.opt(exception=True).warning(f"Discarding unreadable cached node {path}")
+            self.errors += 1
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, kg_version: str, entity_id: str, node: Node):
+        if self.max_entries <= 0:
+            return
+        path = self._path(kg_version, entity_id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existed = path.exists()
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(node.model_dump_json())
+            os.replace(tmp, path)
+        except OSError:
+            logger.opt(exception=True).warning(f"Could not write cached node {path}")
+            self.errors += 1
+            return
+        with self._lock:
+            count = self._count(kg_version) + (0 if existed else 1)
+            self._entries[kg_version] = count
+            if count > self.max_entries:
+                self._evict(kg_version)
+
+    def _count(self, kg_version: str) -> int:
+        if kg_version not in self._entries:
+            self._entries[kg_version] = len(self._files(kg_version))
+        return self._entries[kg_version]
+
+    def _files(self, kg_version: str) -> List[Path]:
+        return list((self.root / self._version_dir_name(kg_version)).glob("*.json"))
+
+    def _evict(self, kg_version: str):
+        """Remove the least recently used tenth of the entries (evicting in batches keeps the
+        directory scan off the per-request path)."""
+        files = []
+        for path in self._files(kg_version):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except FileNotFoundError:  # evicted concurrently by another worker
+                pass
+        files.sort()
+        excess = len(files) - self.max_entries + max(1, self.max_entries // 10)
+        for _, path in files[: max(excess, 0)]:
+            path.unlink(missing_ok=True)
+            self.evictions += 1
+        self._entries[kg_version] = len(files) - max(excess, 0)
+        self._remove_stale(kg_version)
+
+    @staticmethod
+    def _last_used(version_dir: Path) -> float:
+        """mtime of the most recently written or read entry (reads `utime` their file)"""
+        last = version_dir.stat().st_mtime
+        for path in version_dir.glob("*.json"):
+            try:
+                last = max(last, path.stat().st_mtime)
+            except FileNotFoundError:
+                pass
+        return last
+
+    def _remove_stale(self, kg_version: str):
+        """Remove other KG versions' directories that nobody has used for `stale_after` seconds"""
+        keep = self._version_dir_name(kg_version)
+        if not self.root.is_dir():
+            return
+        cutoff = time.time() - self.stale_after
+        for version_dir in self.root.iterdir():
+            try:
+                stale = version_dir.is_dir() and version_dir.name != keep and self._last_used(version_dir) < cutoff
+            except FileNotFoundError:  # removed concurrently by another worker
+                continue
+            if stale:
+                logger.info(f"Removing node cache for a KG version unused since {cutoff:.0f}: {version_dir}")
+                shutil.rmtree(version_dir, ignore_errors=True)
+
+    def invalidate(self, kg_version: str):
+        with self._lock:
+            self._remove_stale(kg_version)
+            self._entries = {v: n for v, n in self._entries.items() if v == kg_version}
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": sum(self._entries.values()),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "errors": self.errors,
+            }
+
+
+class NodeCache:
+    """Tiered `(kg_version, entity_id) -> Node` cache with hit/miss/eviction counters."""
+
+    def __init__(self, tiers: List[NodeCacheTier]):
+        self.tiers = tiers
+        self._lock = threading.Lock()
+        self._kg_version: Optional[str] = None
+        self._hits = {tier.name: 0 for tier in tiers}
+        self._misses = 0
+        self._invalidations = 0
+
+    @classmethod
+    def from_settings(
+        cls,
+        max_entries: int,
+        disk_dir: Optional[str],
+        disk_max_entries: int,
+        disk_stale_after: float = 24 * 3600,
+        unknown_ttl: float = 60,
+    ) -> "NodeCache":
+        tiers: List[NodeCacheTier] = [MemoryTier(max_entries, unknown_ttl)]
+        if disk_dir:
+            tiers.append(DiskTier(disk_dir, disk_max_entries, disk_stale_after))
+        return cls(tiers)
+
+    def _tiers_for(self, kg_version: str) -> List[NodeCacheTier]:
+        """The tiers usable for `kg_version`, invalidating every tier if the KG version changed."""
+        if kg_version != self._kg_version:
+            with self._lock:
+                if kg_version != self._kg_version:
+                    if self._kg_version is not None:
+                        self._invalidations += 1
+                    logger.info(f"Node cache bound to KG version {kg_version}")
+                    for tier in self.tiers:
+                        tier.invalidate(kg_version)
+                    self._kg_version = kg_version
+        if kg_version == UNKNOWN_VERSION:
+            return [tier for tier in self.tiers if not isinstance(tier, DiskTier)]
+        return self.tiers
+
+    async def _atiers_for(self, kg_version: str) -> List[NodeCacheTier]:
+        """`_tiers_for`, binding a new KG version (which invalidates the blocking tiers) in a thread"""
+        if kg_version != self._kg_version:
+            return await asyncio.to_thread(self._tiers_for, kg_version)
+        return self._tiers_for(kg_version)
+
+    @staticmethod
+    def _find(tiers: List[NodeCacheTier], kg_version: str, entity_id: str):
+        """(the first of `tiers` holding the node, the node), promoting a hit into the tiers before it;
+        (None, None) on a miss"""
+        for index, tier in enumerate(tiers):
+            node = tier.get(kg_version, entity_id)
+            if node is not None:
+                for faster in tiers[:index]:
+                    faster.put(kg_version, entity_id, node)
+                return tier, node
+        return None, None
+
+    def _count(self, tier: Optional[NodeCacheTier]):
+        with self._lock:
+            if tier is None:
+                self._misses += 1
+            else:
+                self._hits[tier.name] += 1
+
+    def get(self, kg_version: str, entity_id: str) -> Optional[Node]:
+        tier, node = self._find(self._tiers_for(kg_version), kg_version, entity_id)
+        self._count(tier)
+        return node
+
+    async def aget(self, kg_version: str, entity_id: str) -> Optional[Node]:
+        """`get` for the event loop: the non-blocking tiers in front are read in place, the rest in a
+        worker thread; a hit there is promoted into the tiers in front back on the loop."""
+        tiers = await self._atiers_for(kg_version)
+        inline = next((i for i, tier in enumerate(tiers) if tier.blocking), len(tiers))
+        tier, node = self._find(tiers[:inline], kg_version, entity_id)
+        if node is None and inline < len(tiers):
+            tier, node = await asyncio.to_thread(self._find, tiers[inline:], kg_version, entity_id)
+            if node is not None:
+                for faster in tiers[:inline]:
+                    faster.put(kg_version, entity_id, node)
+        self._count(tier)
+        return node
+
+    def put(self, kg_version: str, entity_id: str, node: Node):
+        for tier in self._tiers_for(kg_version):
+            tier.put(kg_version, entity_id, node)
+
+    async def aput(self, kg_version: str, entity_id: str, node: Node):
+        """`put` for the event loop, writing to the blocking tiers in a worker thread"""
+        tiers = await self._atiers_for(kg_version)
+        for tier in tiers:
+            if not tier.blocking:
+                tier.put(kg_version, entity_id, node)
+        blocking = [tier for tier in tiers if tier.blocking]
+        if blocking:
+            await asyncio.to_thread(lambda: [tier.put(kg_version, entity_id, node) for tier in blocking])
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hits = sum(self._hits.values())
+            lookups = hits + self._misses
+            counters = {
+                "kg_version": self._kg_version,
+                "hits": dict(self._hits),
+                "misses": self._misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else None,
+                "invalidations": self._invalidations,
+            }
+        counters["tiers"] = {tier.name: tier.stats() for tier in self.tiers}
+        return counters
+
+
+class KGVersion:
+    """The KG version to key a `NodeCache` on, re-read from Solr every `refresh_after` seconds.
+
+    `fetch` returns the loaded index's version; `pinned` (MONARCH_KG_VERSION) is prefixed to it when
+    set, for readable cache keys. If `fetch` fails the version is reported as unknown until the next
+    successful refresh.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[str]], pinned: str = UNKNOWN_VERSION, refresh_after: float = 60):
+        self._fetch = fetch
+        self.pinned = pinned
+        self.refresh_after = refresh_after
+        self._version = UNKNOWN_VERSION
+        self._checked_at: Optional[float] = None
+
+    async def get(self) -> str:
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self.refresh_after:
+            # set before awaiting, so requests arriving meanwhile don't start refreshes of their own
+            self._checked_at = now
+            try:
+                index_version = await self._fetch()
+            except Exception:
+                logger.opt(exception=True).warning("Could not read the KG version from Solr")
+                self._version = UNKNOWN_VERSION
+            else:
+                self._version = index_version if self.pinned == UNKNOWN_VERSION else f"{self.pinned}+{index_version}"
+        return self._version
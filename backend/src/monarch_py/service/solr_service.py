@@ -1,37 +1,59 @@
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-import requests
 from loguru import logger
 from monarch_py.datamodels.solr import SolrQuery, SolrQueryResult, core
+from monarch_py.service.solr_transport import AsyncSolrTransport, SolrTransport, get_async_transport, get_transport
 from monarch_py.utils.utils import escape
 from pydantic import BaseModel
 
 FIELD_TYPE_SUFFIXES = ["_t", "_ac", "_grounding", "_sortable_float"]
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
 
 
 class SolrService(BaseModel):
     base_url: str
     core: core
 
-    def get(self, id):
+    @property
+    def transport(self) -> SolrTransport:
+        """The shared keep-alive connection pool for this core"""
+        return get_transport(self.base_url, self.core.value)
+
+    def get(self, id, fields: Optional[str] = None):
+        """Real-time get of one document, restricted to the comma-separated `fields` if given"""
+        response = self.transport.get(self._get_url(id, fields))
+        return self._parse_get_response(response)
+
+    def query(self, q: SolrQuery) -> SolrQueryResult:
+        url = self._select_url()
+        response = self.transport.post(url, data=q.query_string(), headers=FORM_HEADERS)
+        logger.debug(f"SolrService.query: {url}")
+        return self._parse_query_response(response)
+
+    def _get_url(self, id, fields: Optional[str] = None) -> str:
         url = f"{self.base_url}/{self.core.value}/get?id={id}"
-        response = requests.get(url)
+        return f"{url}&fl={fields}" if fields else url
+
+    def _select_url(self) -> str:
+        return f"{self.base_url}/{self.core.value}/select"
+
+    @staticmethod
+    def _parse_get_response(response) -> Optional[dict]:
+        """Shared by the sync and async services: works on a requests or an httpx response."""
         response.raise_for_status()
         entity = response.json()["doc"]
         try:
-            self._strip_json(entity, "_version_", "iri")
+            SolrService._strip_json(entity, "_version_", "iri")
         except TypeError:  # if entity is None
             return None
         return entity
 
-    def query(self, q: SolrQuery) -> SolrQueryResult:
-        url = f"{self.base_url}/{self.core.value}/select"
-        response = requests.post(
-            url, data=q.query_string(), headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
-        logger.debug(f"SolrService.query: {url}")
-        data = json.loads(response.text)
+    @staticmethod
+    def _parse_query_response(response) -> SolrQueryResult:
+        """Shared by the sync and async services: works on a requests or an httpx response.
+        The body is decoded straight from bytes, skipping an intermediate copy as text."""
+        data = json.loads(response.content)
         if "error" in data:
             logger.error("Solr error message: " + data["error"]["msg"])
         response.raise_for_status()
@@ -115,3 +137,37 @@ class SolrService(BaseModel):
         facet_fields = result.facet_counts.facet_fields[facet_field]
 
         return self._facets_to_dict(facet_fields)
+
+
+class AsyncSolrService(SolrService):
+    """asyncio variant of SolrService: the same requests and parsing, awaited over a shared
+    `httpx.AsyncClient` so the `async def` API routes never block the event loop on Solr."""
+
+    @property
+    def transport(self) -> AsyncSolrTransport:
+        """The shared asyncio keep-alive connection pool for this core"""
+        return get_async_transport(self.base_url, self.core.value)
+
+    async def get(self, id, fields: Optional[str] = None):
+        response = await self.transport.get(self._get_url(id, fields))
+        return self._parse_get_response(response)
+
+    async def query(self, q: SolrQuery) -> SolrQueryResult:
+        url = self._select_url()
+        response = await self.transport.post(url, content=q.query_string(), headers=FORM_HEADERS)
+        logger.debug(f"AsyncSolrService.query: {url}")
+        return self._parse_query_response(response)
+
+    async def get_filtered_facet(self, id, filter_field, facet_field):
+        query = SolrQuery(
+            rows=0,
+            facet=True,
+            facet_fields=[facet_field],
+            filter_queries=[f"{filter_field}:{escape(id)}"],
+        )
+
+        result = await self.query(query)
+
+        facet_fields = result.facet_counts.facet_fields[facet_field]
+
+        return self._facets_to_dict(facet_fields)
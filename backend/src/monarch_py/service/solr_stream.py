@@ -0,0 +1,110 @@
+"""Incremental decoding of large Solr `/select` responses.
+
+Decoding a 50,000-row case-phenotype or grid response with `response.json()` holds the raw body,
+the decoded text and the whole document tree in memory at once. These helpers decode
+`response.docs` one document at a time straight off the socket with ijson, so only the
+document currently being folded into a result is ever materialised.
+
+Solr writes `facet_counts` after the documents, so the facets of a streamed response are only
+known once its documents have been consumed. The body reader keeps the bytes read since the last
+document was decoded; once the documents run out, that tail holds the rest of the response, and
+the facet counts are decoded from it, so one request serves both the documents and the facets.
+"""
+
+import json
+import re
+from typing import AsyncIterator, Iterator, Optional
+
+import httpx
+import ijson
+import requests
+
+DOCS_PREFIX = "response.docs.item"
+CHUNK_SIZE = 64 * 1024
+
+# the top-level key, after the `response` object; nothing inside a JSON string can match it
+_FACET_COUNTS = re.compile(rb'[}\]]\s*,\s*"facet_counts"\s*:\s*')
+
+
+def stream_params(params: dict) -> dict:
+    """`params` for streaming a raw query: no echoed header ahead of the documents"""
+    return {**params, "omitHeader": True}
+
+
+class _TailReader:
+    """Keeps the chunks read since the last `mark`, for decoding what follows the documents"""
+
+    def __init__(self):
+        self._tail = []
+
+    def keep(self, chunk: bytes) -> bytes:
+        self._tail.append(chunk)
+        return chunk
+
+    def mark(self):
+        """A document was just decoded: its end is in the latest chunk, so drop the ones before it"""
+        del self._tail[:-1]
+
+    def facet_counts(self) -> dict:
+        """The `facet_counts` object after the documents, or {} if the response has none"""
+        tail = b"".join(self._tail)
+        found = None
+        for found in _FACET_COUNTS.finditer(tail):
+            pass
+        if found is None:
+            return {}
+        facet_counts, _ = json.JSONDecoder().raw_decode(tail[found.end() :].decode())
+        return facet_counts
+
+
+class _BodyReader(_TailReader):
+    """The `read` ijson expects, over the body of a `stream=True` requests response"""
+
+    def __init__(self, response: requests.Response):
+        super().__init__()
+        response.raw.decode_content = True
+        self._raw = response.raw
+
+    def read(self, size: int = -1) -> bytes:
+        return self.keep(self._raw.read(size))
+
+
+def iter_docs(response: requests.Response, facet_counts: Optional[dict] = None) -> Iterator[dict]:
+    """Yield the documents of a `stream=True` requests response, closing it once done (or abandoned).
+    Once they are exhausted, `facet_counts` (if given) is filled with the response's facet counts."""
+    try:
+        response.raise_for_status()
+        reader = _BodyReader(response)
+        for doc in ijson.items(reader, DOCS_PREFIX, use_float=True):
+            reader.mark()
+            yield doc
+        if facet_counts is not None:
+            facet_counts.update(reader.facet_counts())
+    finally:
+        response.close()
+
+
+class _AsyncBodyReader(_TailReader):
+    """The async `read` ijson expects, over the body of a streamed httpx response"""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__()
+        self._chunks = response.aiter_bytes(CHUNK_SIZE)
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to tell bytes from text; don't spend a chunk on it
+        if size == 0:
+            return b""
+        return self.keep(await anext(self._chunks, b""))
+
+
+async def aiter_docs(response: httpx.Response, facet_counts: Optional[dict] = None) -> AsyncIterator[dict]:
+    """Yield the documents of a streamed httpx response (see `AsyncSolrTransport.stream`), then fill
+    `facet_counts` (if given) as `iter_docs` does"""
+    response.raise_for_status()
+    reader = _AsyncBodyReader(response)
+    async for doc in ijson.items(reader, DOCS_PREFIX, use_float=True):
+        reader.mark()
+        yield doc
+    if facet_counts is not None:
+        facet_counts.update(reader.facet_counts())
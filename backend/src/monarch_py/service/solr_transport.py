@@ -0,0 +1,300 @@
+"""Pooled, keep-alive HTTP transport shared by every Solr round-trip.
+
+A bare `requests.get`/`requests.post` opens (and tears down) a fresh TCP connection per call, and a
+single entity page makes a dozen or more Solr calls — so connection setup, not Solr, dominated the
+latency of small queries. Every Solr call now goes through a `SolrTransport`: one urllib3 connection
+pool per (Solr base url, core), kept alive across requests and shared by every thread in the worker.
+
+`requests.Session` itself is not documented as thread-safe (cookie jar, adapter mounting), so each
+thread gets its own lightweight session, all mounted on the transport's single `HTTPAdapter` — the
+adapter's pool manager *is* thread-safe, which is the part that actually holds the sockets.
+
+`AsyncSolrTransport` is the asyncio counterpart for the `async def` API routes: a shared
+`httpx.AsyncClient` per event loop (an httpx pool is bound to the loop that opened its connections),
+with the same pool size, timeouts and retry-with-backoff policy.
+
+Tunables (env vars, read once at import):
+    SOLR_POOL_SIZE          max keep-alive connections per core (default 20)
+    SOLR_CONNECT_TIMEOUT    seconds to establish a connection (default 3.05)
+    SOLR_READ_TIMEOUT       seconds to wait for a response (default 60)
+    SOLR_RETRIES            retries for failed reads, with exponential backoff (default 2)
+    SOLR_RETRY_BACKOFF      backoff factor in seconds (default 0.2 -> 0.2s, 0.4s, ...)
+"""
+
+import asyncio
+import contextlib
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _env_number(name: str, default, cast):
+    """Parse a numeric env var, falling back to `default` on missing/unparseable values."""
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(frozen=True)
+class SolrTransportConfig:
+    """Connection pool, timeout and retry settings for a `SolrTransport`."""
+
+    pool_size: int = _env_number("SOLR_POOL_SIZE", 20, int)
+    connect_timeout: float = _env_number("SOLR_CONNECT_TIMEOUT", 3.05, float)
+    read_timeout: float = _env_number("SOLR_READ_TIMEOUT", 60.0, float)
+    retries: int = _env_number("SOLR_RETRIES", 2, int)
+    backoff_factor: float = _env_number("SOLR_RETRY_BACKOFF", 0.2, float)
+    # Statuses worth retrying: Solr restarting or a proxy in front of it briefly unavailable.
+    retry_statuses: Tuple[int, ...] = (502, 503, 504)
+
+
+class SolrTransport:
+    """Thread-safe keep-alive connection pool for one Solr core (or the Solr root)."""
+
+    def __init__(self, config: Optional[SolrTransportConfig] = None):
+        self.config = config or SolrTransportConfig()
+        # Every request we send Solr is a read (`/get`, or `/select` via GET or form POST), so POST is
+        # as safe to retry as GET here — urllib3 only retries GET-family methods by default.
+        retry = Retry(
+            total=self.config.retries,
+            backoff_factor=self.config.backoff_factor,
+            status_forcelist=self.config.retry_statuses,
+            allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+            raise_on_status=False,
+        )
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.config.pool_size, max_retries=retry)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        return (self.config.connect_timeout, self.config.read_timeout)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            return self._session().request(method, url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """Pool-utilisation counters. `connections_opened` vs `requests` shows how often a kept-alive
+        connection was reused; `in_flight`/`peak_in_flight` against `pool_size` shows saturation."""
+        connections_opened = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                connections_opened += pool.num_connections
+        with self._lock:
+            return {
+                "pool_size": self.config.pool_size,
+                "requests": self._requests,
+                "errors": self._errors,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "connections_opened": connections_opened,
+            }
+
+    def close(self):
+        self.adapter.close()
+
+
+class AsyncSolrTransport:
+    """asyncio keep-alive connection pool for one Solr core, on a shared `httpx.AsyncClient`."""
+
+    def __init__(self, config: Optional[SolrTransportConfig] = None):
+        self.config = config or SolrTransportConfig()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors = 0
+        self._retries = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def _client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_size, max_keepalive_connections=self.config.pool_size
+                ),
+                timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout),
+            )
+            self._clients[loop] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send one request, retrying transport errors and `retry_statuses` with exponential backoff.
+        As with `SolrTransport`, every request we send Solr is a read, so POST is retried too."""
+        self._start()
+        try:
+            return await self._send(method, url, stream=False, **kwargs)
+        finally:
+            self._finish()
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Like `request`, but the body is left unread for the caller to consume incrementally.
+        Only opening the response is retried; the response is closed on leaving the context."""
+        self._start()
+        try:
+            response = await self._send(method, url, stream=True, **kwargs)
+            try:
+                yield response
+            finally:
+                await response.aclose()
+        finally:
+            self._finish()
+
+    async def _send(self, method: str, url: str, stream: bool, **kwargs) -> httpx.Response:
+        client = self._client()
+        for attempt in range(self.config.retries + 1):
+            last_attempt = attempt == self.config.retries
+            try:
+                response = await client.send(client.build_request(method, url, **kwargs), stream=stream)
+            except httpx.TransportError:
+                if last_attempt:
+                    with self._lock:
+                        self._errors += 1
+                    raise
+            else:
+                if last_attempt or response.status_code not in self.config.retry_statuses:
+                    return response
+                await response.aclose()
+            with self._lock:
+                self._retries += 1
+            await asyncio.sleep(self.config.backoff_factor * (2**attempt))
+
+    def _start(self):
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def _finish(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pool_size": self.config.pool_size,
+                "requests": self._requests,
+                "errors": self._errors,
+                "retries": self._retries,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "clients": len(self._clients),
+            }
+
+    async def aclose(self):
+        """Close the client bound to the running loop (clients on other loops die with their loop)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_transports: Dict[Tuple[str, Optional[str]], SolrTransport] = {}
+_async_transports: Dict[Tuple[str, Optional[str]], AsyncSolrTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(base_url: str, core: Optional[str] = None) -> SolrTransport:
+    """The process-wide transport for `base_url`'s `core` (the Solr root when `core` is None).
+
+    One pool per core keeps a slow or saturated core (e.g. a burst of association-table queries) from
+    starving the connections used by another (e.g. entity lookups)."""
+    key = (base_url.rstrip("/"), core)
+    transport = _transports.get(key)
+    if transport is None:
+        with _transports_lock:
+            transport = _transports.get(key)
+            if transport is None:
+                transport = _transports[key] = SolrTransport()
+    return transport
+
+
+def get_async_transport(base_url: str, core: Optional[str] = None) -> AsyncSolrTransport:
+    """The process-wide asyncio transport for `base_url`'s `core` (see `get_transport`)."""
+    key = (base_url.rstrip("/"), core)
+    transport = _async_transports.get(key)
+    if transport is None:
+        with _transports_lock:
+            transport = _async_transports.get(key)
+            if transport is None:
+                transport = _async_transports[key] = AsyncSolrTransport()
+    return transport
+
+
+def transport_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Pool-utilisation counters for every transport created so far, keyed by `<base_url>/<core>`."""
+    with _transports_lock:
+        items = {"sync": list(_transports.items()), "async": list(_async_transports.items())}
+    return {
+        kind: {f"{base_url}/{core}" if core else base_url: t.stats() for (base_url, core), t in transports}
+        for kind, transports in items.items()
+    }
+
+
+def close_transports():
+    """Close every pooled sync connection (e.g. on API shutdown); transports are recreated on next use."""
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
+
+
+async def aclose_transports():
+    """Close the async clients bound to the running loop (the API's shutdown hook)."""
+    with _transports_lock:
+        transports = list(_async_transports.values())
+        _async_transports.clear()
+    for transport in transports:
+        await transport.aclose()
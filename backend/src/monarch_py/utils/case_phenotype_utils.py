@@ -1,6 +1,6 @@
 """Utilities for building case-phenotype matrices."""
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 from monarch_py.datamodels.model import (
     CasePhenotypeMatrixResponse,
     CaseEntity,
@@ -15,8 +15,8 @@ from monarch_py.utils.entity_grid_utils import make_cell_key
 def build_matrix(
     disease_id: str,
     disease_name: str,
-    case_docs: List[dict],
-    phenotype_docs: List[dict],
+    case_docs: Iterable[dict],
+    phenotype_docs: Iterable[dict],
     facet_counts: Dict[str, int],
 ) -> CasePhenotypeMatrixResponse:
     """Build case-phenotype matrix from Solr documents.
@@ -24,32 +24,83 @@ def build_matrix(
     Args:
         disease_id: The MONDO ID of the disease being queried
         disease_name: Human-readable name of the disease
-        case_docs: List of CaseToDiseaseAssociation Solr documents
-        phenotype_docs: List of CaseToPhenotypicFeatureAssociation Solr documents
+        case_docs: CaseToDiseaseAssociation Solr documents
+        phenotype_docs: CaseToPhenotypicFeatureAssociation Solr documents, iterated once
         facet_counts: Dict of facet query results (e.g. 'object_closure:"UPHENO:xxx"': count)
 
     Returns:
         CasePhenotypeMatrixResponse with cases, phenotypes, bins, and cells
     """
-    cases = _build_cases(case_docs, disease_id)
-    case_map = {c.id: c for c in cases}
-    phenotypes, phenotype_to_bin = _build_phenotypes(phenotype_docs)
-    cells = _build_cells(phenotype_docs, case_map)
-    bins = _build_bins(phenotype_docs, facet_counts)
-
-    return CasePhenotypeMatrixResponse(
-        disease_id=disease_id,
-        disease_name=disease_name,
-        total_cases=len(cases),
-        total_phenotypes=len(phenotypes),
-        cases=cases,
-        phenotypes=phenotypes,
-        bins=bins,
-        cells=cells,
-    )
-
-
-def _build_cases(case_docs: List[dict], query_disease_id: str) -> List[CaseEntity]:
+    builder = CasePhenotypeMatrixBuilder(disease_id, case_docs)
+    for doc in phenotype_docs:
+        builder.add(doc)
+    return builder.build(disease_name, facet_counts)
+
+
+class CasePhenotypeMatrixBuilder:
+    """Builds a case-phenotype matrix from phenotype documents fed one at a time.
+
+    Each document is folded into the phenotype, cell and bin tables as it arrives, so the
+    documents can come straight off a streamed Solr response without ever being held together.
+    """
+
+    def __init__(self, disease_id: str, case_docs: Iterable[dict]):
+        self.disease_id = disease_id
+        self.cases = _build_cases(case_docs, disease_id)
+        self._case_map = {c.id: c for c in self.cases}
+        self._bin_ids = {key.value for key in HistoPhenoKeys}
+        self._phenotypes: Dict[str, CasePhenotype] = {}
+        self._cells: Dict[str, CasePhenotypeCellData] = {}
+        self._bin_phenotypes: Dict[str, Set[str]] = {key.value: set() for key in HistoPhenoKeys}
+
+    def add(self, doc: dict):
+        """Fold one CaseToPhenotypicFeatureAssociation document into the matrix"""
+        phenotype_id = doc.get("object")
+        if not phenotype_id:
+            return
+        closure = set(doc.get("object_closure", []))
+
+        if phenotype_id not in self._phenotypes:
+            bin_id = _find_bin_for_phenotype(closure, self._bin_ids)
+            if bin_id is not None:
+                self._phenotypes[phenotype_id] = CasePhenotype(
+                    id=phenotype_id,
+                    label=doc.get("object_label"),
+                    bin_id=bin_id,
+                )
+
+        case_id = doc.get("subject")
+        if case_id and case_id in self._case_map:
+            cell_key = make_cell_key(case_id, phenotype_id)
+            self._cells[cell_key] = CasePhenotypeCellData(
+                id=cell_key,
+                present=True,
+                negated=doc.get("negated"),
+                onset_qualifier=doc.get("onset_qualifier"),
+                onset_qualifier_label=doc.get("onset_qualifier_label"),
+                publications=doc.get("publications"),
+            )
+
+        # Add phenotype to ALL matching bins (not just first)
+        for key in HistoPhenoKeys:
+            if key.value in closure:
+                self._bin_phenotypes[key.value].add(phenotype_id)
+
+    def build(self, disease_name: str, facet_counts: Dict[str, int]) -> CasePhenotypeMatrixResponse:
+        phenotypes = list(self._phenotypes.values())
+        return CasePhenotypeMatrixResponse(
+            disease_id=self.disease_id,
+            disease_name=disease_name,
+            total_cases=len(self.cases),
+            total_phenotypes=len(phenotypes),
+            cases=self.cases,
+            phenotypes=phenotypes,
+            bins=_build_bins(self._bin_phenotypes, facet_counts),
+            cells=self._cells,
+        )
+
+
+def _build_cases(case_docs: Iterable[dict], query_disease_id: str) -> List[CaseEntity]:
     """Extract unique cases and determine direct/indirect status.
 
     Args:
@@ -81,42 +132,7 @@ def _build_cases(case_docs: List[dict], query_disease_id: str) -> List[CaseEntit
     return list(seen_cases.values())
 
 
-def _build_phenotypes(phenotype_docs: List[dict]) -> tuple[List[CasePhenotype], Dict[str, str]]:
-    """Extract unique phenotypes and assign to HistoPheno bins.
-
-    Args:
-        phenotype_docs: List of CaseToPhenotypicFeatureAssociation Solr documents
-
-    Returns:
-        Tuple of (list of CasePhenotype objects, mapping of phenotype_id to bin_id)
-    """
-    seen_phenotypes: Dict[str, CasePhenotype] = {}
-    phenotype_to_bin: Dict[str, str] = {}
-    bin_ids = {key.value for key in HistoPhenoKeys}
-
-    for doc in phenotype_docs:
-        phenotype_id = doc.get("object")
-        if not phenotype_id or phenotype_id in seen_phenotypes:
-            continue
-
-        object_closure = doc.get("object_closure", [])
-        bin_id = _find_bin_for_phenotype(object_closure, bin_ids)
-
-        if bin_id is None:
-            continue
-
-        phenotype = CasePhenotype(
-            id=phenotype_id,
-            label=doc.get("object_label"),
-            bin_id=bin_id,
-        )
-        seen_phenotypes[phenotype_id] = phenotype
-        phenotype_to_bin[phenotype_id] = bin_id
-
-    return list(seen_phenotypes.values()), phenotype_to_bin
-
-
-def _find_bin_for_phenotype(object_closure: List[str], bin_ids: Set[str]) -> Optional[str]:
+def _find_bin_for_phenotype(object_closure: Iterable[str], bin_ids: Set[str]) -> Optional[str]:
     """Find the HistoPheno bin for a phenotype based on its closure.
 
     Uses the HistoPhenoKeys enum order to ensure consistent assignment
@@ -143,65 +159,16 @@ def _find_bin_for_phenotype(object_closure: List[str], bin_ids: Set[str]) -> Opt
     return intersection.pop()
 
 
-def _build_cells(phenotype_docs: List[dict], case_map: Dict[str, CaseEntity]) -> Dict[str, CasePhenotypeCellData]:
-    """Build cell data for each case-phenotype pair.
-
-    Args:
-        phenotype_docs: List of CaseToPhenotypicFeatureAssociation Solr documents
-        case_map: Dict mapping case IDs to CaseEntity objects
-
-    Returns:
-        Dict mapping cell keys (case_id:phenotype_id) to CasePhenotypeCellData
-    """
-    cells: Dict[str, CasePhenotypeCellData] = {}
-
-    for doc in phenotype_docs:
-        case_id = doc.get("subject")
-        phenotype_id = doc.get("object")
-
-        if not case_id or not phenotype_id:
-            continue
-        if case_id not in case_map:
-            continue
-
-        cell_key = make_cell_key(case_id, phenotype_id)
-        cell = CasePhenotypeCellData(
-            id=cell_key,
-            present=True,
-            negated=doc.get("negated"),
-            onset_qualifier=doc.get("onset_qualifier"),
-            onset_qualifier_label=doc.get("onset_qualifier_label"),
-            publications=doc.get("publications"),
-        )
-        cells[cell_key] = cell
-
-    return cells
-
-
-def _build_bins(phenotype_docs: List[dict], facet_counts: Dict[str, int]) -> List[HistoPhenoBin]:
-    """Build bin list with phenotype IDs from Solr documents.
+def _build_bins(bin_phenotypes: Dict[str, Set[str]], facet_counts: Dict[str, int]) -> List[HistoPhenoBin]:
+    """Build bin list with the phenotype IDs collected for each bin.
 
     Args:
-        phenotype_docs: List of CaseToPhenotypicFeatureAssociation Solr documents
+        bin_phenotypes: Dict mapping bin IDs to the phenotype IDs whose closure includes them
         facet_counts: Dict of facet query results
 
     Returns:
         List of HistoPhenoBin objects with phenotype_ids populated
     """
-    # Collect phenotypes per bin by checking closures
-    bin_phenotypes: Dict[str, Set[str]] = {key.value: set() for key in HistoPhenoKeys}
-
-    for doc in phenotype_docs:
-        phenotype_id = doc.get("object")
-        if not phenotype_id:
-            continue
-        closure = set(doc.get("object_closure", []))
-
-        # Add phenotype to ALL matching bins (not just first)
-        for key in HistoPhenoKeys:
-            if key.value in closure:
-                bin_phenotypes[key.value].add(phenotype_id)
-
     bins = []
 
     for key in HistoPhenoKeys:
@@ -1,6 +1,6 @@
 """Utilities for building generic entity grids."""
 
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from monarch_py.datamodels.model import (
     EntityGridResponse,
@@ -20,8 +20,8 @@ def build_entity_grid(
     context_category: str,
     config: GridTypeConfig,
     grouping: RowGroupingConfig,
-    column_docs: List[dict],
-    row_docs: List[dict],
+    column_docs: Iterable[dict],
+    row_docs: Iterable[dict],
     facet_counts: Dict[str, int],
 ) -> EntityGridResponse:
     """Build entity grid from Solr documents.
@@ -32,34 +32,66 @@ def build_entity_grid(
         context_category: Biolink category of the context entity
         config: Grid type configuration
         grouping: Row grouping configuration
-        column_docs: List of column association Solr documents
-        row_docs: List of row association Solr documents
+        column_docs: Column association Solr documents
+        row_docs: Row association Solr documents, iterated once
         facet_counts: Dict of facet query results for bin counts
 
     Returns:
         EntityGridResponse with columns, rows, bins, and cells
     """
-    columns = _build_columns(column_docs, context_id, config)
-    column_map = {c.id: c for c in columns}
-    rows = _build_rows(row_docs, config, grouping)
-    cells = _build_cells(row_docs, column_map, config)
-    bins = _build_bins(facet_counts, grouping, config)
-
-    return EntityGridResponse(
-        context_id=context_id,
-        context_name=context_name,
-        context_category=context_category,
-        total_columns=len(columns),
-        total_rows=len(rows),
-        columns=columns,
-        rows=rows,
-        bins=bins,
-        cells=cells,
-    )
+    builder = EntityGridBuilder(context_id, config, grouping, column_docs)
+    for doc in row_docs:
+        builder.add(doc)
+    return builder.build(context_name, context_category, facet_counts)
+
+
+class EntityGridBuilder:
+    """Builds an entity grid from row documents fed one at a time.
+
+    Each row document is folded into the row and cell tables as it arrives, so the documents can
+    come straight off a streamed Solr response without ever being held together.
+    """
+
+    def __init__(
+        self,
+        context_id: str,
+        config: GridTypeConfig,
+        grouping: RowGroupingConfig,
+        column_docs: Iterable[dict],
+    ):
+        self.context_id = context_id
+        self.config = config
+        self.grouping = grouping
+        self.columns = _build_columns(column_docs, context_id, config)
+        self._column_map = {c.id: c for c in self.columns}
+        self._bin_ids = set(grouping.bin_ids)
+        self._rows: Dict[str, GridRowEntity] = {}
+        self._cells: Dict[str, GridCellData] = {}
+
+    def add(self, doc: dict):
+        """Fold one row association document into the grid"""
+        _add_row(self._rows, doc, self.config, self.grouping, self._bin_ids)
+        _add_cell(self._cells, doc, self._column_map, self.config)
+
+    def build(
+        self, context_name: Optional[str], context_category: str, facet_counts: Dict[str, int]
+    ) -> EntityGridResponse:
+        rows = list(self._rows.values())
+        return EntityGridResponse(
+            context_id=self.context_id,
+            context_name=context_name,
+            context_category=context_category,
+            total_columns=len(self.columns),
+            total_rows=len(rows),
+            columns=self.columns,
+            rows=rows,
+            bins=_build_bins(facet_counts, self.grouping, self.config),
+            cells=self._cells,
+        )
 
 
 def _build_columns(
-    column_docs: List[dict],
+    column_docs: Iterable[dict],
     context_id: str,
     config: GridTypeConfig,
 ) -> List[GridColumnEntity]:
@@ -155,7 +187,7 @@ def sort_columns_by_category(
 
 
 def _build_rows(
-    row_docs: List[dict],
+    row_docs: Iterable[dict],
     config: GridTypeConfig,
     grouping: RowGroupingConfig,
 ) -> List[GridRowEntity]:
@@ -173,25 +205,35 @@ def _build_rows(
     bin_ids = set(grouping.bin_ids)
 
     for doc in row_docs:
-        row_id = doc.get(config.row_entity_field)
-        if not row_id or row_id in seen_rows:
-            continue
+        _add_row(seen_rows, doc, config, grouping, bin_ids)
 
-        row_closure = doc.get(f"{config.row_entity_field}_closure", [])
-        bin_id = _find_bin_for_entity(row_closure, bin_ids, grouping.bin_ids)
-
-        if bin_id is None:
-            continue
+    return list(seen_rows.values())
 
-        row = GridRowEntity(
-            id=row_id,
-            label=doc.get(f"{config.row_entity_field}_label"),
-            category=config.row_entity_category.value,
-            bin_id=bin_id,
-        )
-        seen_rows[row_id] = row
 
-    return list(seen_rows.values())
+def _add_row(
+    seen_rows: Dict[str, GridRowEntity],
+    doc: dict,
+    config: GridTypeConfig,
+    grouping: RowGroupingConfig,
+    bin_ids: Set[str],
+):
+    """Add the row entity of one row association document, unless already seen or unbinned"""
+    row_id = doc.get(config.row_entity_field)
+    if not row_id or row_id in seen_rows:
+        return
+
+    row_closure = doc.get(f"{config.row_entity_field}_closure", [])
+    bin_id = _find_bin_for_entity(row_closure, bin_ids, grouping.bin_ids)
+
+    if bin_id is None:
+        return
+
+    seen_rows[row_id] = GridRowEntity(
+        id=row_id,
+        label=doc.get(f"{config.row_entity_field}_label"),
+        category=config.row_entity_category.value,
+        bin_id=bin_id,
+    )
 
 
 def _find_bin_for_entity(
@@ -227,7 +269,7 @@ def _find_bin_for_entity(
 
 
 def _build_cells(
-    row_docs: List[dict],
+    row_docs: Iterable[dict],
     column_map: Dict[str, GridColumnEntity],
     config: GridTypeConfig,
 ) -> Dict[str, GridCellData]:
@@ -244,35 +286,44 @@ def _build_cells(
     cells: Dict[str, GridCellData] = {}
 
     for doc in row_docs:
-        column_id = doc.get(config.row_context_field)
-        row_id = doc.get(config.row_entity_field)
+        _add_cell(cells, doc, column_map, config)
 
-        if not column_id or not row_id:
-            continue
-        if column_id not in column_map:
-            continue
+    return cells
 
-        cell_key = make_cell_key(column_id, row_id)
-
-        # Build qualifiers dict from available qualifier fields
-        qualifiers = {}
-        if doc.get("onset_qualifier"):
-            qualifiers["onset_qualifier"] = Qualifier(
-                id="onset_qualifier",
-                value=doc.get("onset_qualifier"),
-                label=doc.get("onset_qualifier_label"),
-            )
-
-        cell = GridCellData(
-            id=cell_key,
-            present=True,
-            negated=doc.get("negated"),
-            qualifiers=qualifiers if qualifiers else None,
-            publications=doc.get("publications"),
+
+def _add_cell(
+    cells: Dict[str, GridCellData],
+    doc: dict,
+    column_map: Dict[str, GridColumnEntity],
+    config: GridTypeConfig,
+):
+    """Add the cell of one row association document, if its column is in the grid"""
+    column_id = doc.get(config.row_context_field)
+    row_id = doc.get(config.row_entity_field)
+
+    if not column_id or not row_id:
+        return
+    if column_id not in column_map:
+        return
+
+    cell_key = make_cell_key(column_id, row_id)
+
+    # Build qualifiers dict from available qualifier fields
+    qualifiers = {}
+    if doc.get("onset_qualifier"):
+        qualifiers["onset_qualifier"] = Qualifier(
+            id="onset_qualifier",
+            value=doc.get("onset_qualifier"),
+            label=doc.get("onset_qualifier_label"),
         )
-        cells[cell_key] = cell
 
-    return cells
+    cells[cell_key] = GridCellData(
+        id=cell_key,
+        present=True,
+        negated=doc.get("negated"),
+        qualifiers=qualifiers if qualifiers else None,
+        publications=doc.get("publications"),
+    )
 
 
 def _build_bins(
@@ -0,0 +1,64 @@
+"""Reading patient-profile files and writing batch semsim search results, for `monarch semsim-batch`.
+
+Profiles are read from JSON Lines (`{"id": "patient-1", "termset": ["HP:0002104", ...]}` per line) or
+TSV (a profile id, then its terms comma separated: `patient-1<TAB>HP:0002104,HP:0012378`). Results
+are written as they are produced, one line per profile (JSON Lines) or per matched entity (TSV).
+"""
+
+import json
+from enum import Enum
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+
+from monarch_py.api.additional_models import SemsimBatchSearchResult, SemsimProfile
+
+
+class ProfileFormat(str, Enum):
+    jsonl = "jsonl"
+    tsv = "tsv"
+
+
+TSV_HEADER = ["profile_id", "rank", "subject_id", "subject_name", "score"]
+
+
+def profile_format(path: Path, fmt: Optional[ProfileFormat] = None) -> ProfileFormat:
+    """`fmt`, or else the format `path`'s extension implies (.tsv / .txt are TSV, anything else JSON Lines)"""
+    if fmt is not None:
+        return fmt
+    return ProfileFormat.tsv if Path(path).suffix.lower() in (".tsv", ".txt") else ProfileFormat.jsonl
+
+
+def read_profiles(lines: Iterable[str], fmt: ProfileFormat) -> Iterator[SemsimProfile]:
+    """Profiles from the lines of a JSON Lines or TSV file. Blank lines, `#` comments and a TSV
+    header row (`id` / `profile_id` in the first column) are skipped."""
+    first = True
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if fmt == ProfileFormat.jsonl:
+            yield SemsimProfile(**json.loads(line))
+            continue
+        profile_id, _, terms = line.partition("\t")
+        header, first = first and profile_id.lower() in ("id", "profile_id"), False
+        if header:
+            continue
+        if not terms:
+            raise ValueError(f"line {number}: expected a profile id and its terms, tab separated")
+        yield SemsimProfile(id=profile_id, termset=[term.strip() for term in terms.split(",") if term.strip()])
+
+
+def write_results(results: Iterable[SemsimBatchSearchResult], out: IO[str], fmt: ProfileFormat) -> int:
+    """Write each profile's results to `out` as soon as they arrive; returns the number of profiles"""
+    count = 0
+    if fmt == ProfileFormat.tsv:
+        out.write("\t".join(TSV_HEADER) + "\n")
+    for result in results:
+        if fmt == ProfileFormat.jsonl:
+            out.write(result.model_dump_json() + "\n")
+        else:
+            for rank, match in enumerate(result.results, start=1):
+                row = [result.id, str(rank), match.subject.id, match.subject.name or "", str(match.score)]
+                out.write("\t".join(row) + "\n")
+        count += 1
+    return count
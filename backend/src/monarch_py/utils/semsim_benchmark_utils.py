@@ -0,0 +1,284 @@
+"""Measuring ducksim's latency and the recall of its approximate search, for `monarch semsim-recall`
+and `monarch semsim-benchmark`.
+
+Hybrid search reranks only the candidates its prefilter keeps, so an entity the prefilter drops can
+never reach the results. `candidate_recall` runs each profile through the exact `full_search`, the
+pruned `topk_search` and `hybrid_search` with every prefilter the engine has, and reports for each
+how much of the exact top `k` it found (recall@k) and how long it took. Top-k search is exact, so its
+recall is 1 unless near-tied scores land on either side of the cut.
+
+`synthetic_kg` writes a DuckDB file in the shape of monarch-kg.duckdb (closure, information_content,
+closure_size, edges, nodes) from a random ontology of chosen size and depth, annotated to random
+entities. `run_benchmark` times compare, multi-compare, full, top-k and hybrid search over profiles of
+several sizes, and records peak memory and recall. Its JSON report can be checked against one
+from an earlier commit with `regressions`.
+"""
+
+import platform
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import duckdb
+import numpy as np
+
+from monarch_py.service.ducksim import Ducksim
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+
+def latency_summary(seconds: List[float]) -> Dict:
+    """Mean, median, 95th percentile and max of `seconds`, in milliseconds"""
+    ms = np.asarray(seconds, dtype=float) * 1000
+    if not len(ms):
+        return {"mean": None, "p50": None, "p95": None, "max": None}
+    return {
+        "mean": round(float(ms.mean()), 3),
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p95": round(float(np.percentile(ms, 95)), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+def _timed(search, *args, **kwargs):
+    start = perf_counter()
+    result = search(*args, **kwargs)
+    return result, perf_counter() - start
+
+
+def candidate_recall(
+    engine: Ducksim,
+    termsets: Iterable[List[str]],
+    *,
+    k: int = 10,
+    prefix: Optional[str] = None,
+    metric: str = "ancestor_information_content",
+    direction: str = "bidirectional",
+) -> Dict:
+    """Recall@`k` and latency of top-k search, and of hybrid search per prefilter, against full
+    search over `termsets`"""
+    prefilters = ["flat"] + [name for name in ("minhash", "embedding") if getattr(engine, name) is not None]
+    options = {"limit": k, "metric": metric, "prefix": prefix, "direction": direction}
+    searches = {"topk": lambda termset: engine.topk_search(termset, **options)}
+    for name in prefilters:
+        searches[name] = lambda termset, name=name: engine.hybrid_search(termset, prefilter=name, **options)
+    full_seconds = []
+    recalls = {name: [] for name in searches}
+    seconds = {name: [] for name in searches}
+    for termset in termsets:
+        exact, elapsed = _timed(engine.full_search, termset, **options)
+        full_seconds.append(elapsed)
+        expected = {entity for entity, _ in exact}
+        for name, search in searches.items():
+            found, elapsed = _timed(search, termset)
+            seconds[name].append(elapsed)
+            recalls[name].append(len(expected & {entity for entity, _ in found}) / len(expected) if expected else 1.0)
+
+    def measured(name):
+        return {
+            "recall_at_k": {
+                "mean": round(float(np.mean(recalls[name])), 4) if recalls[name] else None,
+                "min": round(float(np.min(recalls[name])), 4) if recalls[name] else None,
+            },
+            "latency_ms": latency_summary(seconds[name]),
+        }
+
+    return {
+        "profiles": len(full_seconds),
+        "k": k,
+        "full_search": {"latency_ms": latency_summary(full_seconds)},
+        "topk_search": measured("topk"),
+        "hybrid_search": {name: measured(name) for name in prefilters},
+    }
+
+
+def synthetic_kg(
+    path,
+    *,
+    terms: int = 5000,
+    depth: int = 8,
+    entities: int = 1000,
+    phenotypes: int = 10,
+    multi_parent: float = 0.2,
+    seed: int = 0,
+) -> Dict:
+    """Write a monarch-kg.duckdb-shaped file to `path` and return its shape.
+
+    The ontology has `terms` HP terms on `depth` levels under one root, each level twice as wide
+    as the one above. Every term has a parent on the level above, and with probability
+    `multi_parent` a second one on any level above. `entities` MONDO entities are annotated to
+    about `phenotypes` terms each from the deeper half of the levels, with Zipf-like popularity.
+    The precompute tables are derived as koza's information-content operation does.
+    """
+    if depth < 2 or terms < depth:
+        raise ValueError("a synthetic ontology needs depth >= 2 and at least one term per level")
+    rng = np.random.default_rng(seed)
+    widths = 2.0 ** np.arange(1, depth)
+    sizes = np.maximum(1, np.floor(widths / widths.sum() * (terms - 1))).astype(np.int64)
+    sizes[-1] += terms - 1 - sizes.sum()
+    if sizes[-1] < 1:
+        raise ValueError(f"{terms} terms can't fill {depth} levels")
+    starts = np.concatenate([[0], np.cumsum(np.concatenate([[1], sizes]))])  # first term id of each level
+    children, parents = [], []
+    for level in range(1, depth):
+        ids = np.arange(starts[level], starts[level + 1])
+        children += [ids, ids[rng.random(len(ids)) < multi_parent]]
+        parents += [
+            rng.integers(starts[level - 1], starts[level], len(ids)),
+            rng.integers(0, starts[level], len(children[-1])),
+        ]
+    pool = rng.permutation(np.arange(starts[depth // 2], terms))
+    popularity = 1.0 / np.arange(1, len(pool) + 1)
+    counts = 1 + rng.poisson(max(phenotypes - 1, 0), entities)
+    annotated = rng.choice(pool, counts.sum(), p=popularity / popularity.sum())
+    subjects = np.repeat(np.arange(entities), counts)
+
+    Path(path).unlink(missing_ok=True)
+    con = duckdb.connect(str(path))
+    try:
+        con.execute(
+            "CREATE TEMP TABLE parents AS SELECT unnest($child::INTEGER[]) AS child, unnest($parent::INTEGER[]) AS parent",
+            {"child": np.concatenate(children).tolist(), "parent": np.concatenate(parents).tolist()},
+        )
+        con.execute(
+            """CREATE TABLE closure AS
+            WITH RECURSIVE anc(s, o) AS (
+                SELECT range::INTEGER, range::INTEGER FROM range($terms)
+                UNION SELECT anc.s, parents.parent FROM anc JOIN parents ON parents.child = anc.o)
+            SELECT printf('HP:%07d', s) AS subject_id, 'rdfs:subClassOf' AS predicate_id,
+                   printf('HP:%07d', o) AS object_id
+            FROM anc""",
+            {"terms": terms},
+        )
+        con.execute(
+            """CREATE TABLE edges AS
+            SELECT printf('MONDO:%07d', unnest($subject::INTEGER[])) AS subject,
+                   printf('HP:%07d', unnest($object::INTEGER[])) AS object,
+                   'biolink:DiseaseToPhenotypicFeatureAssociation' AS category,
+                   'biolink:has_phenotype' AS predicate, NULL::VARCHAR AS negated""",
+            {"subject": subjects.tolist(), "object": annotated.tolist()},
+        )
+        con.execute(
+            """CREATE TABLE nodes AS
+            SELECT DISTINCT subject_id AS id, 'synthetic phenotype ' || subject_id AS name FROM closure
+            UNION ALL SELECT DISTINCT subject, 'synthetic disease ' || subject FROM edges"""
+        )
+        con.execute(
+            """CREATE TABLE information_content AS
+            WITH n AS (SELECT count(DISTINCT object_id) AS nn FROM closure)
+            SELECT object_id AS term, -log2(count(*)::DOUBLE / (SELECT nn FROM n)) AS ic
+            FROM closure GROUP BY object_id"""
+        )
+        con.execute(
+            """CREATE TABLE closure_size AS
+            SELECT e.subject AS entity, count(DISTINCT c.object_id) AS size
+            FROM edges e JOIN closure c ON c.subject_id = e.object GROUP BY e.subject"""
+        )
+        (closure_rows,) = con.execute("SELECT count(*) FROM closure").fetchone()
+    finally:
+        con.close()
+    return {
+        "terms": terms,
+        "depth": depth,
+        "closure_rows": closure_rows,
+        "entities": entities,
+        "associations": int(counts.sum()),
+        "multi_parent": multi_parent,
+        "seed": seed,
+    }
+
+
+def sample_profiles(engine: Ducksim, count: int, size: int, *, seed: int = 0) -> List[List[str]]:
+    """`count` random profiles of `size` distinct annotated phenotypes (fewer if the KG has fewer)"""
+    phenotypes = [p for (p,) in engine.con.execute("SELECT DISTINCT phenotype FROM _assoc ORDER BY 1").fetchall()]
+    rng = np.random.default_rng(seed)
+    size = min(size, len(phenotypes))
+    return [sorted(rng.choice(phenotypes, size, replace=False).tolist()) for _ in range(count)]
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Peak resident set size of this process so far (DuckDB's native memory included), in MiB"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)  # bytes on macOS, KiB elsewhere
+
+
+def run_benchmark(
+    engine: Ducksim,
+    *,
+    sizes: Sequence[int] = (1, 5, 10, 20),
+    queries: int = 20,
+    object_sets: int = 10,
+    k: int = 10,
+    prefix: Optional[str] = None,
+    metric: str = "ancestor_information_content",
+    seed: int = 0,
+) -> Dict:
+    """Latency of compare, multi-compare, full, top-k and hybrid search, and top-k and hybrid
+    recall@`k`, for `queries` random profiles of each size in `sizes`. Multi-compare scores each
+    profile against `object_sets` others of the same size."""
+    report = {"sizes": {}}
+    for size in sizes:
+        profiles = sample_profiles(engine, queries * (object_sets + 1), size, seed=seed + size)
+        subjects, others = profiles[:queries], profiles[queries:]
+        compare, multi_compare = [], []
+        for i, subject in enumerate(subjects):
+            objects = others[i * object_sets : (i + 1) * object_sets]
+            compare.append(_timed(engine.termset_pairwise_similarity, subject, objects[0], metric)[1])
+            multi_compare.append(_timed(engine.termset_multi_compare, subject, objects, metric)[1])
+        search = candidate_recall(engine, subjects, k=k, prefix=prefix, metric=metric)
+        report["sizes"][str(size)] = {
+            "compare": {"latency_ms": latency_summary(compare)},
+            "multi_compare": {"latency_ms": latency_summary(multi_compare), "object_sets": object_sets},
+            "full_search": search["full_search"],
+            "topk_search": search["topk_search"],
+            "hybrid_search": search["hybrid_search"],
+        }
+    report["peak_memory_mb"] = peak_memory_mb()
+    return report
+
+
+def environment() -> Dict:
+    """Versions a benchmark report depends on"""
+    return {
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+    }
+
+
+def regressions(baseline: Dict, current: Dict, *, latency_tolerance: float = 0.25, recall_tolerance: float = 0.05):
+    """What got worse from `baseline` to `current` (two `run_benchmark` reports): median latencies
+    more than `latency_tolerance` (a fraction) slower, or mean recalls more than `recall_tolerance`
+    lower. Only measurements present in both reports are compared."""
+    found = []
+    for size, before in baseline.get("sizes", {}).items():
+        after = current.get("sizes", {}).get(size)
+        if after is None:
+            continue
+        timed = [
+            (name, before[name], after[name])
+            for name in ("compare", "multi_compare", "full_search", "topk_search")
+            if name in before and name in after
+        ]
+        timed += [
+            (f"hybrid_search[{name}]", before["hybrid_search"][name], after["hybrid_search"][name])
+            for name in before.get("hybrid_search", {})
+            if name in after.get("hybrid_search", {})
+        ]
+        for name, old, new in timed:
+            was, now = old["latency_ms"]["p50"], new["latency_ms"]["p50"]
+            if was is not None and now is not None and now > was * (1 + latency_tolerance):
+                found.append(f"size {size} {name}: p50 {was:.1f} ms -> {now:.1f} ms")
+            if "recall_at_k" in old:
+                was, now = old["recall_at_k"]["mean"], new["recall_at_k"]["mean"]
+                if was is not None and now is not None and now < was - recall_tolerance:
+                    found.append(f"size {size} {name}: recall@k {was:.3f} -> {now:.3f}")
+    return found
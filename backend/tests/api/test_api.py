@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from fastapi.testclient import TestClient
 from httpx import URL
 from monarch_py.api.main import app
@@ -41,3 +43,21 @@ def test_release_metadata():
     assert response.status_code == 200
     assert response.json()["version"] == "latest"
     assert response.json()["url"] == "https://data.monarchinitiative.org/monarch-kg/latest/index.html"
+
+
+def test_startup_prefetches_relation_labels():
+    with patch(
+        "monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.prefetch_relation_labels"
+    ) as mock_prefetch:
+        with TestClient(app):
+            pass
+    assert mock_prefetch.await_count == 1
+
+
+def test_startup_survives_prefetch_failure():
+    with patch(
+        "monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.prefetch_relation_labels",
+        side_effect=ConnectionError("solr down"),
+    ):
+        with TestClient(app) as started:
+            assert started.get("/v3/docs").status_code == 200
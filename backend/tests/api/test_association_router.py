@@ -22,7 +22,7 @@ def test_associations(associations):
     assert response.json() == associations
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_associations")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_associations")
 def test_associations_params(mock_get_assoc):
     """Test that the correct parameters are passed to the monarch api"""
     mock_get_assoc.return_value = MagicMock()
@@ -1,7 +1,10 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from monarch_py.api.config import node_cache, node_cache_version
 from monarch_py.api.entity import router
 from monarch_py.datamodels.model import Node
 from monarch_py.datamodels.category_enums import AssociationCategory
@@ -9,11 +12,68 @@ from monarch_py.datamodels.category_enums import AssociationCategory
 client = TestClient(router)
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@pytest.fixture(autouse=True)
+def _fresh_node_cache(monkeypatch):
+    node_cache.cache_clear()
+    node_cache_version.cache_clear()
+    index_versions = ["solr-1"]
+
+    async def get_index_version(self):
+        return index_versions[0]
+
+    monkeypatch.setattr(
+        "monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_index_version",
+        get_index_version,
+    )
+    yield index_versions
+    node_cache.cache_clear()
+    node_cache_version.cache_clear()
+
+
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_entity(mock_get_entity, node):
+    async def fake_get_entity(id, extra, timings):
+        timings.update({"entity": 1.5, "node_hierarchy": 12.0})
+        return Node(**node)
+
+    mock_get_entity.side_effect = fake_get_entity
+    response = client.get("/MONDO:0019391")
+    assert mock_get_entity.call_args.args == ("MONDO:0019391",)
+    assert mock_get_entity.call_args.kwargs["extra"] is True
+    assert response.headers["Server-Timing"] == "entity;dur=1.5, node_hierarchy;dur=12.0"
+
+
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
+def test_entity_served_from_node_cache(mock_get_entity, node):
+    mock_get_entity.return_value = Node(**node)
+    first = client.get("/MONDO:0019391")
+    second = client.get("/MONDO:0019391")
+    assert mock_get_entity.call_count == 1
+    assert second.json() == first.json()
+    assert second.headers["Server-Timing"] == "node_cache;desc=hit"
+    assert node_cache().stats()["hits"]["memory"] == 1
+
+
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
+def test_entity_rebuilt_once_solr_loads_a_new_kg(mock_get_entity, node, _fresh_node_cache):
     mock_get_entity.return_value = Node(**node)
     client.get("/MONDO:0019391")
-    mock_get_entity.assert_called_with("MONDO:0019391", extra=True)
+    _fresh_node_cache[0] = "solr-2"
+    node_cache_version().refresh_after = 0
+    response = client.get("/MONDO:0019391")
+    assert mock_get_entity.call_count == 2
+    assert response.headers["Server-Timing"] != "node_cache;desc=hit"
+    assert node_cache().stats()["kg_version"].endswith("solr-2")
+
+
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
+def test_entity_not_found_is_not_cached(mock_get_entity):
+    mock_get_entity.return_value = None
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            client.get("/MONDO:0000000")
+        assert exc_info.value.status_code == 404
+    assert mock_get_entity.call_count == 2
 
 
 @patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_association_table")
@@ -21,7 +21,7 @@ def test_histopheno(histopheno):
     assert response.json() == histopheno
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_histopheno")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_histopheno")
 def test_histopheno_params(mock_get_histopheno, histopheno):
     mock_get_histopheno.return_value = HistoPheno(**histopheno)
     client.get("/HP:0000001")
@@ -21,7 +21,7 @@ def test_mappings(search):
     assert response.json() == search
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_mappings")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_mappings")
 def test_mappings_params(mock_get_mappings, mappings):
     mock_get_mappings.return_value = MagicMock()
     params = {
@@ -47,7 +47,7 @@ def test_mappings_params(mock_get_mappings, mappings):
     )
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_mappings")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_mappings")
 def test_empty_response(mock_get_mappings):
     empty_mapping_result = MappingResults(items=[], offset=0, limit=20, total=0)
     mock_get_mappings.return_value = empty_mapping_result
@@ -59,7 +59,7 @@ def test_empty_response(mock_get_mappings):
     mock_get_mappings.assert_called_once()
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_mappings")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_mappings")
 def test_tsv_format(mock_get_mappings, mappings):
     mapping_res = MappingResults(**mappings)
     mock_get_mappings.return_value = mapping_res
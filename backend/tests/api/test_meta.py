@@ -14,7 +14,7 @@ def client():
     return TestClient(app)
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_returns_html_with_og_tags(mock_get_entity, client, node):
     """Test that /meta/{entity_id} returns HTML with entity-specific OG tags."""
     mock_get_entity.return_value = Node(**node)
@@ -32,7 +32,7 @@ def test_meta_endpoint_returns_html_with_og_tags(mock_get_entity, client, node):
     assert "testserver/MONDO:0020121" in html
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_returns_404_for_unknown_entity(mock_get_entity, client):
     """Test that /meta/{entity_id} returns 404 for non-existent entities."""
     mock_get_entity.return_value = None
@@ -41,7 +41,7 @@ def test_meta_endpoint_returns_404_for_unknown_entity(mock_get_entity, client):
     assert response.status_code == 404
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_escapes_html_in_content(mock_get_entity, client):
     """Test that entity content is properly HTML-escaped to prevent XSS."""
     mock_get_entity.return_value = Node(
@@ -61,7 +61,7 @@ def test_meta_endpoint_escapes_html_in_content(mock_get_entity, client):
     assert "&lt;script&gt;" in html
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_truncates_long_description(mock_get_entity, client):
     """Test that very long descriptions are truncated at a word boundary."""
     long_description = "word " * 200  # 1000 chars, well over the 300 limit
@@ -82,7 +82,7 @@ def test_meta_endpoint_truncates_long_description(mock_get_entity, client):
     assert long_description.strip() not in html
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_entity_with_no_name(mock_get_entity, client):
     """Test that entities without a name use the entity ID instead."""
     mock_get_entity.return_value = Node(
@@ -101,7 +101,7 @@ def test_meta_endpoint_entity_with_no_name(mock_get_entity, client):
     assert "A test description" in html
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_entity_with_no_description(mock_get_entity, client):
     """Test that entities without a description still produce valid OG tags."""
     mock_get_entity.return_value = Node(
@@ -120,7 +120,7 @@ def test_meta_endpoint_entity_with_no_description(mock_get_entity, client):
     assert "og:description" in html
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_entity_with_no_name_or_description(mock_get_entity, client):
     """Test that entities with neither name nor description use fallback text."""
     mock_get_entity.return_value = Node(
@@ -139,7 +139,7 @@ def test_meta_endpoint_entity_with_no_name_or_description(mock_get_entity, clien
     assert "View TEST:005 on Monarch Initiative" in html
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.get_entity")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.get_entity")
 def test_meta_endpoint_returns_cache_control_header(mock_get_entity, client, node):
     """Test that the response includes a Cache-Control header."""
     mock_get_entity.return_value = Node(**node)
@@ -21,7 +21,7 @@ def test_search(search):
     assert response.json() == search
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.search")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.search")
 def test_search_params(mock_search, search):
     mock_search.return_value = SearchResults(**search)
     params = {
@@ -40,7 +40,7 @@ def test_search_params(mock_search, search):
     mock_search.assert_called_with(**search_params)
 
 
-@patch("monarch_py.implementations.solr.solr_implementation.SolrImplementation.autocomplete")
+@patch("monarch_py.implementations.solr.async_solr_implementation.AsyncSolrImplementation.autocomplete")
 def test_autocomplete_params(mock_autocomplete, autocomplete):
     mock_autocomplete.return_value = autocomplete
     client.get(f"/autocomplete?q=heart")
@@ -6,15 +6,17 @@ inf/nan score turns into a 500 (starlette's json.dumps uses allow_nan=False), so
 of failure the engine-only tests can miss.
 """
 
+import json
+
 import duckdb
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
 from monarch_py.api import semsim as semsim_module
 from monarch_py.api.semsim import router
 from monarch_py.service.ducksim import Ducksim
-from monarch_py.service.ducksim_service import DucksimService
+from monarch_py.service.ducksim_service import DucksimService, _encode_cursor
 
 METRICS = ["ancestor_information_content", "jaccard_similarity", "phenodigm_score"]
 DIRECTIONS = ["bidirectional", "subject_to_object", "object_to_subject"]
@@ -97,3 +99,82 @@ def test_get_search_serializes_all_metrics(ducksim_client, metric):
     response = ducksim_client.get(f"/search/A1/Human Diseases?metric={metric}&limit=5")
     assert response.status_code == status.HTTP_200_OK, response.text
     assert isinstance(response.json(), list)
+
+
+def test_search_pages_follow_cursors_through_the_ranking(ducksim_client):
+    request = {"termset": ["A1", "B1"], "group": "Human Diseases", "depth": 3, "limit": 2}
+    everything = ducksim_client.post("/search/", json={**request, "limit": 3}).json()
+    first = ducksim_client.post("/search/pages", json=request).json()
+    assert (first["offset"], first["limit"], first["total"]) == (0, 2, 3)
+    second = ducksim_client.get("/search/pages", params={"cursor": first["next_cursor"]}).json()
+    assert second["offset"] == 2 and second["next_cursor"] is None
+    assert first["items"] + second["items"] == everything
+    assert ducksim_client.post("/search/pages", json={**request, "offset": 2}).json() == second
+
+
+def _app_client():
+    """Client over an app around the router, so HTTPExceptions become error responses."""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_search_pages_rejects_a_malformed_cursor(ducksim_client):
+    response = _app_client().get("/search/pages", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        [["A1"], "MONDO", "ancestor_information_content", "bidirectional", 10**9, 0, 10**6],  # over the limits
+        [["A1", 1], "MONDO", "ancestor_information_content", "bidirectional", 10, 0, 5],  # termset not all str
+        [["A1"], "NOT_A_GROUP", "ancestor_information_content", "bidirectional", 10, 0, 5],
+    ],
+)
+def test_search_pages_holds_a_cursor_to_the_request_bounds(ducksim_client, request_):
+    response = _app_client().get("/search/pages", params={"cursor": _encode_cursor(request_)})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_search_stream_writes_one_result_per_line(ducksim_client):
+    request = {"termset": ["A1", "B1"], "group": "Human Diseases", "depth": 3, "limit": 1}
+    response = ducksim_client.post("/search/stream", json=request)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == ducksim_client.post("/search/", json={**request, "limit": 3}).json()
+
+
+def test_deep_search_needs_ducksim(monkeypatch):
+    monkeypatch.setattr(semsim_module, "semsim_service", lambda engine=None: object())
+    response = _app_client().post("/search/stream", json={"termset": ["A1"], "group": "Human Diseases"})
+    assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
+
+
+def test_search_batch_streams_one_line_per_profile(ducksim_client):
+    request = {
+        "profiles": [{"id": "p1", "termset": ["A1"]}, {"id": "p2", "termset": ["B1", "A1"]}],
+        "group": "Human Diseases",
+        "limit": 2,
+    }
+    response = ducksim_client.post("/search/batch", json=request)
+    assert response.status_code == status.HTTP_200_OK
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["id"] for line in lines] == ["p1", "p2"]
+    for line in lines:
+        assert len(line["results"]) == 2
+        assert line["results"][0]["subject"]["name"]  # hydrated from `nodes`
+        assert line["results"][0]["similarity"] is None
+
+
+@pytest.mark.parametrize(
+    "profiles",
+    [
+        [{"id": f"p{i}", "termset": ["A1"]} for i in range(101)],
+        [{"id": "p1", "termset": [f"HP:{i:07d}" for i in range(501)]}],
+    ],
+)
+def test_search_batch_rejects_oversized_requests(ducksim_client, profiles):
+    response = _app_client().post("/search/batch", json={"profiles": profiles, "group": "Human Diseases"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -3,4 +3,4 @@ import pytest
 
 @pytest.fixture
 def association_counts_query():
-    return {'q': '*:*', 'rows': 20, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': ['(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:PairwiseGeneToGeneInteraction") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToPathwayAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToExpressionSiteAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToGeneHomologyAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:ChemicalToPathwayAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CausalGeneToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:VariantToGeneAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:VariantToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToGeneAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToVariantAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CaseToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CaseToGeneAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:PairwiseGeneToGeneInteraction") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToPathwayAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToExpressionSiteAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToGeneHomologyAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:ChemicalToPathwayAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CausalGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:VariantToGeneAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:VariantToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToGeneAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToVariantAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CaseToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CaseToGeneAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:PairwiseGeneToGeneInteraction") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToPathwayAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToExpressionSiteAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToGeneHomologyAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:ChemicalToPathwayAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CausalGeneToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:VariantToGeneAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:VariantToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToGeneAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToVariantAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CaseToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CaseToGeneAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:PairwiseGeneToGeneInteraction") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToPathwayAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToExpressionSiteAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToGeneHomologyAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:ChemicalToPathwayAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CausalGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:VariantToGeneAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:VariantToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToGeneAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToVariantAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CaseToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CaseToGeneAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")'], 'filter_queries': ['subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121" OR object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121"'], 'facet_mincount': 1, 'query_fields': None, 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': False}
+    return {'q': '*:*', 'rows': 20, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': ['(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:PairwiseGeneToGeneInteraction") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToPathwayAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToExpressionSiteAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GeneToGeneHomologyAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:ChemicalToPathwayAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CausalGeneToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:VariantToGeneAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:VariantToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToGeneAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:GenotypeToVariantAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CaseToDiseaseAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:CaseToGeneAssociation") AND subject:"MONDO:0020121"', '(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:PairwiseGeneToGeneInteraction") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToPathwayAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToExpressionSiteAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GeneToGeneHomologyAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:ChemicalToPathwayAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CausalGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:VariantToGeneAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:VariantToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToGeneAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:GenotypeToVariantAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CaseToDiseaseAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:CaseToGeneAssociation") AND (object:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121")', '(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:PairwiseGeneToGeneInteraction") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToPathwayAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToExpressionSiteAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GeneToGeneHomologyAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:ChemicalToPathwayAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CausalGeneToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:VariantToGeneAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:VariantToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToGeneAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToVariantAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CaseToDiseaseAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:CaseToGeneAssociation") AND (subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121")', '(category:"biolink:DiseaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:PairwiseGeneToGeneInteraction") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToPathwayAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToExpressionSiteAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GeneToGeneHomologyAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:ChemicalToPathwayAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToMolecularActivityAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToCellularComponentAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:MacromolecularMachineToBiologicalProcessAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CausalGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CorrelatedGeneToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:VariantToGeneAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:VariantToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:ChemicalOrDrugOrTreatmentToDiseaseOrPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:VariantToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToGeneAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:GenotypeToVariantAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CaseToPhenotypicFeatureAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CaseToDiseaseAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")', '(category:"biolink:CaseToGeneAssociation") AND (object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121")'], 'filter_queries': ['subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121" OR object:"MONDO:0020121" OR object_closure:"MONDO:0020121" OR disease_context_qualifier:"MONDO:0020121" OR disease_context_qualifier_closure:"MONDO:0020121"'], 'facet_mincount': 1, 'query_fields': None, 'field_list': 'id,predicate,category,agent_type,has_attribute,knowledge_level,negated,object_aspect_qualifier,onset_qualifier,primary_knowledge_source,publications,file_source,provided_by,aggregator_knowledge_source,qualifiers,has_evidence,object_specialization_qualifier,FDA_adverse_event_level,disease_context_qualifier,original_predicate,frequency_qualifier,has_count,has_percentage,has_quotient,has_total,sex_qualifier,sources,supporting_text,species_context_qualifier,stage_qualifier,qualifier,subject,object,original_subject,original_object,evidence_count,grouping_key,subject_label,subject_category,subject_namespace,subject_closure,subject_closure_label,subject_taxon,subject_taxon_label,object_label,object_category,object_namespace,object_closure,object_closure_label,object_taxon,object_taxon_label,disease_context_qualifier_label,disease_context_qualifier_category,disease_context_qualifier_namespace,disease_context_qualifier_closure,disease_context_qualifier_closure_label,species_context_qualifier_label,species_context_qualifier_category,species_context_qualifier_namespace,stage_qualifier_label,stage_qualifier_category,stage_qualifier_namespace,sex_qualifier_label,sex_qualifier_category,sex_qualifier_namespace,onset_qualifier_label,onset_qualifier_category,onset_qualifier_namespace,frequency_qualifier_label,frequency_qualifier_category,frequency_qualifier_namespace', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': False}
@@ -3,4 +3,4 @@ import pytest
 
 @pytest.fixture
 def association_query_direct():
-    return {'q': 'test:q', 'rows': 100, 'start': 100, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': [], 'filter_queries': ['category:biolink\\:DiseaseToPhenotypicFeatureAssociation', 'predicate:biolink\\:causes', 'subject_closure:TEST\\:0000003', 'subject_category:biolink\\:Gene', 'subject_namespace:TEST', 'subject_taxon:NCBITaxon\\:1111', 'object_closure:TEST\\:0000004', 'object_category:biolink\\:Disease', 'object_namespace:TEST', 'object_taxon:NCBITaxon\\:2222', 'subject:TEST\\:0000001', 'object:TEST\\:0000002', 'subject:"TEST:0000005" OR object:"TEST:0000005" OR disease_context_qualifier:"TEST:0000005"'], 'facet_mincount': 1, 'query_fields': 'subject subject_label^2 subject_label_t subject_closure subject_closure_label subject_closure_label_t predicate predicate_t object object_label^2 object_label_t object_closure object_closure_label object_closure_label_t publications has_evidence primary_knowledge_source aggregator_knowledge_source provided_by ', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': True}
+    return {'q': 'test:q', 'rows': 100, 'start': 100, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': [], 'filter_queries': ['category:biolink\\:DiseaseToPhenotypicFeatureAssociation', 'predicate:biolink\\:causes', 'subject_closure:TEST\\:0000003', 'subject_category:biolink\\:Gene', 'subject_namespace:TEST', 'subject_taxon:NCBITaxon\\:1111', 'object_closure:TEST\\:0000004', 'object_category:biolink\\:Disease', 'object_namespace:TEST', 'object_taxon:NCBITaxon\\:2222', 'subject:TEST\\:0000001', 'object:TEST\\:0000002', 'subject:"TEST:0000005" OR object:"TEST:0000005" OR disease_context_qualifier:"TEST:0000005"'], 'facet_mincount': 1, 'query_fields': 'subject subject_label^2 subject_label_t subject_closure subject_closure_label subject_closure_label_t predicate predicate_t object object_label^2 object_label_t object_closure object_closure_label object_closure_label_t publications has_evidence primary_knowledge_source aggregator_knowledge_source provided_by ', 'field_list': 'id,predicate,category,agent_type,has_attribute,knowledge_level,negated,object_aspect_qualifier,onset_qualifier,primary_knowledge_source,publications,file_source,provided_by,aggregator_knowledge_source,qualifiers,has_evidence,object_specialization_qualifier,FDA_adverse_event_level,disease_context_qualifier,original_predicate,frequency_qualifier,has_count,has_percentage,has_quotient,has_total,sex_qualifier,sources,supporting_text,species_context_qualifier,stage_qualifier,qualifier,subject,object,original_subject,original_object,evidence_count,grouping_key,subject_label,subject_category,subject_namespace,subject_closure,subject_closure_label,subject_taxon,subject_taxon_label,object_label,object_category,object_namespace,object_closure,object_closure_label,object_taxon,object_taxon_label,disease_context_qualifier_label,disease_context_qualifier_category,disease_context_qualifier_namespace,disease_context_qualifier_closure,disease_context_qualifier_closure_label,species_context_qualifier_label,species_context_qualifier_category,species_context_qualifier_namespace,stage_qualifier_label,stage_qualifier_category,stage_qualifier_namespace,sex_qualifier_label,sex_qualifier_category,sex_qualifier_namespace,onset_qualifier_label,onset_qualifier_category,onset_qualifier_namespace,frequency_qualifier_label,frequency_qualifier_category,frequency_qualifier_namespace', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': True}
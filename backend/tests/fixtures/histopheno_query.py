@@ -3,4 +3,4 @@ import pytest
 
 @pytest.fixture
 def histopheno_query():
-    return {'q': '*:*', 'rows': 0, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': ['object_closure:"UPHENO:0002964"', 'object_closure:"UPHENO:0004523"', 'object_closure:"UPHENO:0002764"', 'object_closure:"UPHENO:0002635"', 'object_closure:"UPHENO:0003020"', 'object_closure:"UPHENO:0080362"', 'object_closure:"HP:0001939"', 'object_closure:"UPHENO:0002642"', 'object_closure:"UPHENO:0002833"', 'object_closure:"HP:0002664"', 'object_closure:"UPHENO:0004459"', 'object_closure:"UPHENO:0002948"', 'object_closure:"UPHENO:0003116"', 'object_closure:"UPHENO:0002816"', 'object_closure:"UPHENO:0004536"', 'object_closure:"HP:0000598"', 'object_closure:"UPHENO:0002712"', 'object_closure:"UPHENO:0075949"', 'object_closure:"UPHENO:0049874"', 'object_closure:"UPHENO:0003013"'], 'filter_queries': ['subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121"'], 'facet_mincount': 1, 'query_fields': None, 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': False}
+    return {'q': '*:*', 'rows': 0, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': ['object_closure:"UPHENO:0002964"', 'object_closure:"UPHENO:0004523"', 'object_closure:"UPHENO:0002764"', 'object_closure:"UPHENO:0002635"', 'object_closure:"UPHENO:0003020"', 'object_closure:"UPHENO:0080362"', 'object_closure:"HP:0001939"', 'object_closure:"UPHENO:0002642"', 'object_closure:"UPHENO:0002833"', 'object_closure:"HP:0002664"', 'object_closure:"UPHENO:0004459"', 'object_closure:"UPHENO:0002948"', 'object_closure:"UPHENO:0003116"', 'object_closure:"UPHENO:0002816"', 'object_closure:"UPHENO:0004536"', 'object_closure:"HP:0000598"', 'object_closure:"UPHENO:0002712"', 'object_closure:"UPHENO:0075949"', 'object_closure:"UPHENO:0049874"', 'object_closure:"UPHENO:0003013"'], 'filter_queries': ['subject:"MONDO:0020121" OR subject_closure:"MONDO:0020121"'], 'facet_mincount': 1, 'query_fields': None, 'field_list': 'id,predicate,category,agent_type,has_attribute,knowledge_level,negated,object_aspect_qualifier,onset_qualifier,primary_knowledge_source,publications,file_source,provided_by,aggregator_knowledge_source,qualifiers,has_evidence,object_specialization_qualifier,FDA_adverse_event_level,disease_context_qualifier,original_predicate,frequency_qualifier,has_count,has_percentage,has_quotient,has_total,sex_qualifier,sources,supporting_text,species_context_qualifier,stage_qualifier,qualifier,subject,object,original_subject,original_object,evidence_count,grouping_key,subject_label,subject_category,subject_namespace,subject_closure,subject_closure_label,subject_taxon,subject_taxon_label,object_label,object_category,object_namespace,object_closure,object_closure_label,object_taxon,object_taxon_label,disease_context_qualifier_label,disease_context_qualifier_category,disease_context_qualifier_namespace,disease_context_qualifier_closure,disease_context_qualifier_closure_label,species_context_qualifier_label,species_context_qualifier_category,species_context_qualifier_namespace,stage_qualifier_label,stage_qualifier_category,stage_qualifier_namespace,sex_qualifier_label,sex_qualifier_category,sex_qualifier_namespace,onset_qualifier_label,onset_qualifier_category,onset_qualifier_namespace,frequency_qualifier_label,frequency_qualifier_category,frequency_qualifier_namespace', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': False}
@@ -3,4 +3,4 @@ import pytest
 
 @pytest.fixture
 def mapping_query():
-    return {'q': '*:*', 'rows': 20, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': [], 'filter_queries': ['subject_id:"MONDO\\:0020121" OR object_id:"MONDO\\:0020121"'], 'facet_mincount': 1, 'query_fields': None, 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': False}
+    return {'q': '*:*', 'rows': 20, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': [], 'filter_queries': ['subject_id:"MONDO\\:0020121" OR object_id:"MONDO\\:0020121"'], 'facet_mincount': 1, 'query_fields': None, 'field_list': 'subject_id,subject_label,predicate_id,object_id,object_label,mapping_justification,id,mapping_source', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': None, 'sort': None, 'hl': False}
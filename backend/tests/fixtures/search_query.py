@@ -3,4 +3,4 @@ import pytest
 
 @pytest.fixture
 def search_query():
-    return {'q': 'fanconi', 'rows': 20, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': [], 'filter_queries': ['name:*'], 'facet_mincount': 1, 'query_fields': 'id^100 name^10 name_t^5 name_ac symbol^10 symbol_t^5 symbol_ac synonym synonym_t synonym_ac in_taxon_label_t description_t xref', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': 'product(if(termfreq(category,"biolink:PhenotypicFeature"),1.1,1),if(termfreq(category,"biolink:Disease"),1.3,1),if(and(termfreq(in_taxon,"NCBITaxon:9606"),termfreq(category,"biolink:Gene")),1.1,1),if(termfreq(deprecated,"true"),0.1,1),if(query({!field f=exact_synonym v=\'fanconi\'}),5,1))', 'sort': None, 'hl': False}
+    return {'q': 'fanconi', 'rows': 20, 'start': 0, 'facet': True, 'facet_min_count': 1, 'facet_fields': [], 'facet_queries': [], 'filter_queries': ['name:*'], 'facet_mincount': 1, 'query_fields': 'id^100 name^10 name_t^5 name_ac symbol^10 symbol_t^5 symbol_ac synonym synonym_t synonym_ac in_taxon_label_t description_t xref', 'field_list': 'id,category,name,xref,synonym,full_name,in_taxon,in_taxon_label,symbol,file_source,provided_by,type,description,has_attribute,has_biological_sex,exact_synonym,broad_synonym,narrow_synonym,related_synonym,deprecated,same_as,subsets,synonyms,has_gene,namespace,has_phenotype,has_phenotype_label,has_phenotype_count,has_phenotype_closure,has_phenotype_closure_label,has_descendant,has_descendant_label,has_descendant_count', 'def_type': 'edismax', 'q_op': 'AND', 'mm': '100%', 'boost': 'product(if(termfreq(category,"biolink:PhenotypicFeature"),1.1,1),if(termfreq(category,"biolink:Disease"),1.3,1),if(and(termfreq(in_taxon,"NCBITaxon:9606"),termfreq(category,"biolink:Gene")),1.1,1),if(termfreq(deprecated,"true"),0.1,1),if(query({!field f=exact_synonym v=\'fanconi\'}),5,1))', 'sort': None, 'hl': False}
@@ -0,0 +1,174 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from monarch_py.datamodels.category_enums import AssociationPredicate
+from monarch_py.datamodels.model import AssociationCountList, AssociationResults, Entity, MappingResults, Node
+from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation, gather_timed
+from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+from monarch_py.service.solr_service import AsyncSolrService
+
+LOOKUP_SECONDS = 0.1
+
+
+@pytest.fixture(autouse=True)
+def _clear_relation_label_cache():
+    SolrImplementation._relation_label_cache.clear()
+    yield
+    SolrImplementation._relation_label_cache.clear()
+
+
+class _InFlight:
+    """Counts the slow fake lookups running at once, and the most that ever were"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def wait(self):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(LOOKUP_SECONDS)
+        finally:
+            self.running -= 1
+
+
+_in_flight = _InFlight()
+
+
+@pytest.fixture
+def in_flight():
+    _in_flight.running = _in_flight.peak = 0
+    return _in_flight
+
+
+async def _slow_associations(*args, **kwargs):
+    await _in_flight.wait()
+    return AssociationResults(items=[], limit=20, offset=0, total=0)
+
+
+async def _slow_batch(lookups):
+    await _in_flight.wait()
+    return {name: AssociationResults(items=[], limit=20, offset=0, total=0) for name in lookups}
+
+
+async def _slow_mappings(*args, **kwargs):
+    await _in_flight.wait()
+    return MappingResults(items=[], limit=20, offset=0, total=0)
+
+
+async def _slow_counts(*args, **kwargs):
+    await _in_flight.wait()
+    return AssociationCountList(items=[])
+
+
+def test_gather_timed_records_each_lookup():
+    async def _value(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    timings = {}
+    results = asyncio.run(gather_timed({"a": _value(1, 0.02), "b": _value(2, 0)}, timings))
+    assert results == {"a": 1, "b": 2}
+    assert set(timings) == {"a", "b"}
+    assert timings["a"] >= timings["b"]
+
+
+def test_get_entity_extra_runs_lookups_concurrently(in_flight):
+    disease = {
+        "id": "MONDO:0007947",
+        "name": "Marfan syndrome",
+        "category": "biolink:Disease",
+        "provided_by": "mondo_nodes",
+    }
+    timings = {}
+    with (
+        patch.object(AsyncSolrService, "get", return_value=disease),
+        patch.object(AsyncSolrImplementation, "get_associations", side_effect=_slow_associations),
+        patch.object(AsyncSolrImplementation, "get_association_batch", side_effect=_slow_batch) as mock_batch,
+        patch.object(AsyncSolrImplementation, "get_mappings", side_effect=_slow_mappings),
+        patch.object(AsyncSolrImplementation, "get_association_counts", side_effect=_slow_counts),
+    ):
+        node = asyncio.run(AsyncSolrImplementation().get_entity("MONDO:0007947", extra=True, timings=timings))
+
+    assert isinstance(node, Node)
+    assert node.causal_gene == []
+    assert node.node_relationships == []
+    assert set(timings) == {
+        "entity",
+        "header_associations",
+        "cross_species_term_clique",
+        "association_counts",
+        "mappings",
+        "relation_labels",
+    }
+    # The header's small association lookups share one batched request
+    assert mock_batch.call_count == 1
+    assert set(mock_batch.call_args.args[0]) == {
+        "super_classes",
+        "sub_classes",
+        "mode_of_inheritance",
+        "causal_gene",
+        "node_relationships",
+    }
+    # The batched header lookup, the mappings and the association counts are all awaited at once
+    assert in_flight.peak == 3
+
+
+def test_get_association_batch_demultiplexes_grouped_response():
+    def _doc(id, subject, object):
+        return {
+            "id": id,
+            "_version_": 1,
+            "subject": subject,
+            "predicate": "biolink:subclass_of",
+            "object": object,
+            "agent_type": "not_provided",
+            "knowledge_level": "knowledge_assertion",
+            "primary_knowledge_source": "infores:mondo",
+            "provided_by": "mondo_edges",
+        }
+
+    async def _fake_raw_query(self, params):
+        super_query, sub_query = params["group.query"]
+        return {
+            "grouped": {
+                super_query: {"matches": 1, "doclist": {"numFound": 1, "start": 0, "docs": [_doc("a", "X:1", "X:0")]}},
+                sub_query: {
+                    "matches": 2,
+                    "doclist": {"numFound": 2, "start": 0, "docs": [_doc("b", "X:2", "X:1"), _doc("c", "X:3", "X:1")]},
+                },
+            }
+        }
+
+    lookups = {
+        "super_classes": dict(subject="X:1", predicate=[AssociationPredicate.SUBCLASS_OF], direct=True, limit=10),
+        "sub_classes": dict(object="X:1", predicate=[AssociationPredicate.SUBCLASS_OF], direct=True, limit=1),
+    }
+    with patch.object(AsyncSolrImplementation, "_raw_solr_query", _fake_raw_query):
+        results = asyncio.run(AsyncSolrImplementation().get_association_batch(lookups))
+
+    assert [a.id for a in results["super_classes"].items] == ["a"]
+    # trimmed to the lookup's own limit, with the full count preserved
+    assert [a.id for a in results["sub_classes"].items] == ["b"]
+    assert results["sub_classes"].total == 2
+    assert "_version_" not in results["super_classes"].items[0].model_dump()
+
+
+def test_concurrent_async_relation_label_misses_are_coalesced():
+    async def _slow_get_entity(id, extra):
+        await asyncio.sleep(LOOKUP_SECONDS)
+        return Entity(id=id, name="disease has location", category="biolink:NamedThing")
+
+    async def _resolve():
+        impl = AsyncSolrImplementation()
+        return await asyncio.gather(*(impl._get_relation_label("RO:0004026") for _ in range(5)))
+
+    with patch.object(AsyncSolrImplementation, "get_entity", side_effect=_slow_get_entity) as mock_get_entity:
+        labels = asyncio.run(_resolve())
+
+    assert labels == ["disease has location"] * 5
+    assert mock_get_entity.call_count == 1
+    assert AsyncSolrImplementation._relation_label_lookups == {}
@@ -79,7 +79,7 @@ def client():
 
 
 def test_case_phenotype_matrix_valid_disease(client):
-    from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+    from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
     from monarch_py.datamodels.model import CasePhenotypeMatrixResponse
 
     mock_entity = MagicMock()
@@ -97,8 +97,8 @@ def test_case_phenotype_matrix_valid_disease(client):
     )
 
     with (
-        patch.object(SolrImplementation, "get_entity", return_value=mock_entity),
-        patch.object(SolrImplementation, "get_case_phenotype_matrix", return_value=mock_response),
+        patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity),
+        patch.object(AsyncSolrImplementation, "get_case_phenotype_matrix", return_value=mock_response),
     ):
         response = client.get("/v3/api/case-phenotype-matrix/MONDO:0007078")
         assert response.status_code == 200
@@ -112,34 +112,34 @@ def test_case_phenotype_matrix_invalid_id(client):
 
 
 def test_case_phenotype_matrix_not_found(client):
-    from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+    from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
 
-    with patch.object(SolrImplementation, "get_entity", return_value=None):
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=None):
         response = client.get("/v3/api/case-phenotype-matrix/MONDO:9999999")
         assert response.status_code == 404
 
 
 def test_case_phenotype_matrix_non_disease(client):
-    from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+    from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
 
     mock_entity = MagicMock()
     mock_entity.category = "biolink:Gene"
 
-    with patch.object(SolrImplementation, "get_entity", return_value=mock_entity):
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity):
         response = client.get("/v3/api/case-phenotype-matrix/MONDO:0007078")
         assert response.status_code == 400
         assert "not a disease" in response.json()["detail"].lower()
 
 
 def test_case_phenotype_matrix_limit_exceeded(client):
-    from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+    from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
 
     mock_entity = MagicMock()
     mock_entity.category = "biolink:Disease"
 
     with (
-        patch.object(SolrImplementation, "get_entity", return_value=mock_entity),
-        patch.object(SolrImplementation, "get_case_phenotype_matrix", side_effect=ValueError("exceeds limit")),
+        patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity),
+        patch.object(AsyncSolrImplementation, "get_case_phenotype_matrix", side_effect=ValueError("exceeds limit")),
     ):
         response = client.get("/v3/api/case-phenotype-matrix/MONDO:0007078")
         assert response.status_code == 400
@@ -73,6 +73,14 @@ class TestBuildMatrix:
         assert result.total_phenotypes == 0
         assert result.cells == {}
 
+    def test_phenotype_docs_are_read_in_one_pass(self, sample_case_docs, sample_phenotype_docs, sample_facet_counts):
+        """A one-shot iterator (e.g. a streamed Solr response) should give the same matrix as a list."""
+        from_list = build_matrix("MONDO:0007078", "Achondroplasia", sample_case_docs, sample_phenotype_docs, {})
+        from_stream = build_matrix("MONDO:0007078", "Achondroplasia", sample_case_docs, iter(sample_phenotype_docs), {})
+        assert from_stream == from_list
+        assert from_stream.total_phenotypes == 2
+        assert len(from_stream.cells) == 3
+
     def test_case_extraction(self, sample_case_docs, sample_phenotype_docs, sample_facet_counts):
         """Should extract unique cases from documents."""
         result = build_matrix(
@@ -4,13 +4,25 @@ Ontology (reflexive subClassOf): A1 < A < R, B1 < B < R.  IC(A1) = -log2(1/5) =
 Entities (has_phenotype): E:1->A1, E:2->B1, E:3->{A1,B1}.  E:4->A1 but negated (excluded).
 """
 
+import fcntl
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import math
+import os
+import time
 
 import duckdb
+import numpy as np
 import pytest
 
+from monarch_py.api.additional_models import SemsimMultiCompareObject, SemsimMultiCompareRequest
+from monarch_py.service import ducksim as ducksim_module
 from monarch_py.service.ducksim import Ducksim
+from monarch_py.service.ducksim_embedding import EmbeddingIndex
+from monarch_py.service.ducksim_index import AncestorIndex, build_shared
+from monarch_py.service.ducksim_minhash import MinHashIndex
 from monarch_py.service.ducksim_service import DucksimService
+from monarch_py.utils.semsim_benchmark_utils import candidate_recall
 
 
 def _mini_kg(tmp_path):
@@ -113,12 +125,50 @@ def test_service_compare_model(engine):
     assert tsps.model_dump_json()  # serializes cleanly
 
 
+def test_multi_compare_batches_queries(engine, monkeypatch):
+    """Every object set is scored from one pair-detail query and labelled by one lookup."""
+    svc = DucksimService(engine=engine, entity_implementation=None)
+    sets = [["A1"], ["B1", "A"], ["A1", "B1", "NOT:INDEXED"]]
+    expected = [svc.compare(["A1", "B1"], phenotypes) for phenotypes in sets]
+    queries = []
+    read = engine._read
+    monkeypatch.setattr(engine, "_read", lambda sql, params=None, **kw: queries.append(sql) or read(sql, params, **kw))
+    request = SemsimMultiCompareRequest(
+        subjects=["A1", "B1"],
+        object_sets=[
+            SemsimMultiCompareObject(id=f"set{i}", label=f"set {i}", phenotypes=p) for i, p in enumerate(sets)
+        ],
+    )
+    results = svc.multi_compare(request)
+    assert len(queries) == 2
+    assert [r.subject.id for r in results] == ["set0", "set1", "set2"]
+    assert [r.similarity for r in results] == expected
+    assert [r.score for r in results] == [c.average_score for c in expected]
+
+
 def test_search_ranking(engine):
     # query A1 over prefix "E": E:1 (exact) > E:3 (half) > E:2 (root-only)
     ranked = engine.hybrid_search(["A1"], limit=3, prefix="E")
     assert [e for e, _ in ranked][:2] == ["E:1", "E:3"]
 
 
+@pytest.mark.parametrize("direction", ["bidirectional", "subject_to_object", "object_to_subject"])
+@pytest.mark.parametrize("metric", ["ancestor_information_content", "jaccard_similarity", "phenodigm_score"])
+def test_topk_search_matches_full_search(engine, monkeypatch, metric, direction):
+    """The score bounds never undercut a real score, so pruned top-k ranks exactly like full search."""
+    query = ["A1", "B"]
+    full = engine.full_search(query, limit=None, metric=metric, direction=direction)
+    entities, bounds = engine._score_bounds().rank(
+        engine._ancestry(query), ducksim_module._METRICS[metric].detail_key, direction, len(query)
+    )
+    bounds = dict(zip((e.decode() for e in entities), bounds))
+    for entity, score in full:
+        assert bounds[entity] >= score - 1e-9, entity
+    monkeypatch.setattr(ducksim_module, "_TOPK_FIRST_BATCH", 1)  # prune after the first entity
+    for limit in (1, 2, 10):
+        assert engine.topk_search(query, limit=limit, metric=metric, direction=direction) == pytest.approx(full[:limit])
+
+
 def test_duplicate_associations_dont_inflate_jaccard(tmp_path):
     """An entity annotated to the same phenotype via multiple association rows (different evidence)
     must not double-count that phenotype's ancestors: the count(*) intersection would exceed the
@@ -210,3 +260,267 @@ def test_termset_direction_matches_search(engine):
     assert o2s["average_score"] == pytest.approx(
         dict(engine.full_search(["A1"], prefix="E", direction="object_to_subject"))["E:3"]
     )
+
+
+def test_resident_index_matches_sql_pair_detail(tmp_path):
+    """The resident AncestorIndex scores every pair exactly as the per-query closure join does."""
+    path = _bake(_mini_kg(tmp_path))
+    sql, resident = Ducksim.from_duckdb(path), Ducksim.from_duckdb(path, resident_index=True)
+    assert sql.index is None and len(resident.index) == 5
+    terms = ["A1", "B1", "A", "B", "R", "NOT:INDEXED"]
+    expected, actual = sql._all_pairs_detail(terms, terms), resident._all_pairs_detail(terms, terms)
+    for pair in itertools.product(terms, terms):
+        detail = expected.get(*pair)
+        if detail is None:
+            assert actual.get(*pair) is None, pair
+            continue
+        assert actual.get(*pair)["mica"] == detail["mica"], pair
+        for key in ("jaccard", "resnik", "phenodigm"):
+            assert actual.get(*pair)[key] == pytest.approx(detail[key]), (pair, key)
+    assert resident.termset_pairwise_similarity(["A1", "B1"], ["A"]) == sql.termset_pairwise_similarity(
+        ["A1", "B1"], ["A"]
+    )
+
+
+def test_shared_index_is_built_once_and_memory_mapped(tmp_path, monkeypatch):
+    """Workers map the index the first one built; results match the SQL path, entity profiles included."""
+    path = _bake(_mini_kg(tmp_path))
+    first = Ducksim.from_duckdb(path, shared_index_dir=tmp_path / "index")
+    assert isinstance(first.index.ancestors, np.memmap) and first.index.has_profiles
+    monkeypatch.setattr(AncestorIndex, "from_ducksim", lambda *args, **kwargs: pytest.fail("index rebuilt"))
+    worker = Ducksim.from_duckdb(path, shared_index_dir=tmp_path / "index")
+    sql = Ducksim.from_duckdb(path)
+    assert worker.entity_phenotypes_batch(["E:3", "E:1", "E:9"]) == sql.entity_phenotypes_batch(["E:3", "E:1", "E:9"])
+    assert worker.termset_pairwise_similarity(["A1", "B1"], ["A", "X"]) == sql.termset_pairwise_similarity(
+        ["A1", "B1"], ["A", "X"]
+    )
+    assert worker.search(["A1"], prefix="E") == sql.search(["A1"], prefix="E")
+
+
+def _add_association(path, entity, phenotype):
+    con = duckdb.connect(path)
+    con.execute(
+        "INSERT INTO edges VALUES (?, ?, 'biolink:DiseaseToPhenotypicFeatureAssociation', 'biolink:has_phenotype', NULL)",
+        [entity, phenotype],
+    )
+    con.close()
+
+
+def test_shared_index_rebuilt_for_a_new_artifact(tmp_path):
+    path = _bake(_mini_kg(tmp_path))
+    Ducksim.from_duckdb(path, shared_index_dir=tmp_path / "index")
+    _add_association(path, "E:5", "B1")
+    rebuilt = Ducksim.from_duckdb(path, shared_index_dir=tmp_path / "index", shared_index_stale_after=0)
+    assert rebuilt.entity_phenotypes_batch(["E:5"]) == {"E:5": ["B1"]}
+    assert len([d for d in (tmp_path / "index").iterdir() if d.is_dir()]) == 1  # the previous build is removed
+
+
+def test_shared_index_of_another_artifact_kept_until_unused(tmp_path, monkeypatch):
+    """Workers on the old and new artifact share the directory during a rolling deploy"""
+    for side in ("old", "new"):
+        (tmp_path / side).mkdir()
+    old_path = _bake(_mini_kg(tmp_path / "old"))
+    new_path = _bake(_mini_kg(tmp_path / "new"))
+    _add_association(new_path, "E:5", "B1")
+    index_dir = tmp_path / "index"
+    Ducksim.from_duckdb(old_path, shared_index_dir=index_dir)
+    Ducksim.from_duckdb(new_path, shared_index_dir=index_dir)
+    monkeypatch.setattr(AncestorIndex, "from_ducksim", lambda *args, **kwargs: pytest.fail("index rebuilt"))
+    assert Ducksim.from_duckdb(old_path, shared_index_dir=index_dir).entity_phenotypes_batch(["E:5"]) == {}
+    assert len([d for d in index_dir.iterdir() if d.is_dir()]) == 2
+
+    day_ago = time.time() - 25 * 3600
+    for directory in index_dir.iterdir():
+        os.utime(directory, (day_ago, day_ago))
+    Ducksim.from_duckdb(new_path, shared_index_dir=index_dir)
+    assert len([d for d in index_dir.iterdir() if d.is_dir()]) == 1
+
+
+def test_shared_index_is_mapped_while_the_directory_is_locked(tmp_path):
+    def load(target):
+        with open(tmp_path / ".lock") as other:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return AncestorIndex.load(target)
+
+    con = Ducksim.from_duckdb(_bake(_mini_kg(tmp_path))).con
+    index = build_shared(tmp_path, "key", lambda tmp: AncestorIndex.from_ducksim(con).save(tmp), load, version=1)
+    assert isinstance(index.ancestors, np.memmap)
+
+
+def test_minhash_prefilter_estimates_jaccard_of_ancestor_sets(tmp_path):
+    engine = Ducksim.from_duckdb(_bake(_mini_kg(tmp_path)), minhash=True)
+    assert len(engine.minhash) == 3 and engine.minhash.bands == 32 and engine.minhash.rows == 2
+    # A1's ancestors {A1, A, R}: E:1's exactly, 3 of E:3's 5
+    candidates = dict(engine.minhash.candidates(engine._ancestry_params({"A1"})["anc_id"], "E"))
+    assert candidates["E:1"] == 1.0 and 0 < candidates["E:3"] < 1
+    assert engine.minhash.candidates(engine._ancestry_params({"A1"})["anc_id"], "X") == []
+    assert engine.minhash.candidates([], "E") == []
+    assert [e for e, _ in engine.hybrid_search(["A1"], limit=2, prefix="E")] == ["E:1", "E:3"]
+    assert engine.hybrid_search(["A1"], prefix="E", prefilter="minhash") == engine.hybrid_search(["A1"], prefix="E")
+
+
+def test_embedding_prefilter_ranks_profiles_by_ic_weighted_cosine(tmp_path):
+    engine = Ducksim.from_duckdb(_bake(_mini_kg(tmp_path)), embedding=True)
+    assert len(engine.embedding) == 3 and engine.embedding.size("E") == 3 and engine.embedding.size("X") == 0
+    params = engine._ancestry_params({"A1"})
+    nearest = engine.embedding.nearest(params["anc_id"], params["anc_ic"], "E", k=3)
+    # E:1 has A1's ancestors exactly; E:2 shares only the root, whose IC is 0
+    assert [e for e, _ in nearest] == ["E:1", "E:3"] and nearest[0][1] == pytest.approx(1.0)
+    assert engine.embedding.nearest(params["anc_id"], params["anc_ic"], "E", k=1) == nearest[:1]
+    assert engine.embedding.nearest(params["anc_id"], params["anc_ic"], "X") == []
+    assert engine.hybrid_search(["A1"], limit=2, prefix="E") == engine.full_search(["A1"], limit=2, prefix="E")
+
+
+def test_hybrid_prefilter_must_be_known_and_available(engine):
+    with pytest.raises(ValueError):
+        engine.hybrid_search(["A1"], prefix="E", prefilter="exhaustive")
+    for prefilter in ("minhash", "embedding"):
+        with pytest.raises(RuntimeError):
+            engine.hybrid_search(["A1"], prefix="E", prefilter=prefilter)
+
+
+def test_shared_candidate_indexes_are_built_once_beside_the_ancestor_index(tmp_path, monkeypatch):
+    path = _bake(_mini_kg(tmp_path))
+    first = Ducksim.from_duckdb(path, shared_index_dir=tmp_path / "index", minhash=True, embedding=True)
+    assert isinstance(first.minhash.signatures, np.memmap) and isinstance(first.embedding.vectors, np.memmap)
+    assert len([d for d in (tmp_path / "index").iterdir() if d.is_dir()]) == 3
+    for index in (MinHashIndex, EmbeddingIndex):
+        monkeypatch.setattr(index, "from_ducksim", lambda *args, **kwargs: pytest.fail("index rebuilt"))
+    worker = Ducksim.from_duckdb(path, shared_index_dir=tmp_path / "index", minhash=True, embedding=True)
+    for prefilter in ("minhash", "embedding"):
+        assert worker.hybrid_search(["A1"], prefix="E", prefilter=prefilter) == first.hybrid_search(
+            ["A1"], prefix="E", prefilter=prefilter
+        )
+
+
+def test_candidate_recall_reports_each_prefilter(tmp_path):
+    engine = Ducksim.from_duckdb(_bake(_mini_kg(tmp_path)), minhash=True, embedding=True)
+    report = candidate_recall(engine, [["A1"], ["B1"], ["A1", "B1"]], k=2, prefix="E")
+    assert report["profiles"] == 3 and set(report["hybrid_search"]) == {"flat", "minhash", "embedding"}
+    for prefilter in report["hybrid_search"].values():
+        assert prefilter["recall_at_k"] == {"mean": 1.0, "min": 1.0}
+        assert prefilter["latency_ms"]["p50"] <= prefilter["latency_ms"]["max"]
+    assert report["full_search"]["latency_ms"]["mean"] > 0
+
+
+def test_best_matches_take_first_maximum(engine):
+    """Vectorised best matches agree with a first-wins scan over the pair detail, unknown terms included."""
+    subj, obj = ["A1", "NOT:INDEXED", "B1"], ["R", "A", "B", "A1"]
+    pairs = engine._all_pairs_detail(subj, obj)
+    r = engine.termset_pairwise_similarity(subj, obj)
+    for s in subj:
+        scores = [(pairs.get(s, o) or {"resnik": 0.0})["resnik"] for o in obj]
+        best = scores.index(max(scores))
+        assert r["subject_best_matches"][s]["match_target"] == obj[best], s
+        assert r["subject_best_matches"][s]["score"] == scores[best]
+    assert r["subject_best_matches"]["NOT:INDEXED"]["match_subsumer"] is None
+    page = engine._all_pairs_detail(["B1", "X:1", "A1"], obj + ["Y:1"])  # a wider search-page matrix
+    assert engine._shape_comparison(subj, obj, page, "resnik", "ancestor_information_content", "bidirectional") == r
+
+
+def _counting_reads(engine, monkeypatch):
+    queries = []
+    read = engine._read
+    monkeypatch.setattr(engine, "_read", lambda sql, params=None, **kw: queries.append(sql) or read(sql, params, **kw))
+    return queries
+
+
+def test_term_ancestry_cached_across_compare_and_search(engine, monkeypatch):
+    engine.termset_pairwise_similarity(["A1"], ["B1"])
+    queries = _counting_reads(engine, monkeypatch)
+    engine.full_search(["B1", "A1"], prefix="E")
+    assert ducksim_module._ANCESTRY_SQL not in queries  # both terms' ancestors came from the compare
+    assert engine._ancestry(["A1", "NOT:INDEXED"])["NOT:INDEXED"] == ((), ())
+    engine._ancestry(["NOT:INDEXED"])
+    assert queries.count(ducksim_module._ANCESTRY_SQL) == 1  # terms outside the closure are cached too
+    assert engine.cache_stats()["terms"]["hits"] > 0
+
+
+def test_repeated_search_is_served_from_page_cache(engine, monkeypatch):
+    first = engine.search(["A1", "B1"], limit=3, prefix="E")
+    queries = _counting_reads(engine, monkeypatch)
+    assert engine.search(["B1", "A1"], limit=3, prefix="E") == first  # same termset, any order
+    assert queries == []
+    engine.search(["A1", "B1"], limit=3, prefix="E", metric="jaccard_similarity")
+    assert queries  # a different metric is a different page
+    assert engine.cache_stats()["pages"]["hits"] == 1
+
+
+def test_search_results_use_canonical_term_order(engine):
+    """A cached page is shared by every order of its terms, so results never keep the caller's order"""
+    (reversed_first,) = engine.search(["B1", "A1"], limit=1, prefix="E")
+    in_order = engine.search(["A1", "B1"], limit=2, prefix="E")[0]  # a different page, ranked afresh
+    assert reversed_first == in_order
+    _, _, comparison = reversed_first
+    assert comparison["object_termset"] == list(comparison["object_best_matches"]) == ["A1", "B1"]
+
+
+def test_search_tables_built_once_on_first_search(engine):
+    """The entity-side search aggregates are materialized lazily, once, and then reused."""
+    assert not engine._search_tables_ready
+    first = engine.full_search(["A1", "B1"], prefix="E")
+    assert engine._search_tables_ready
+    ent_ph = engine._read(
+        "SELECT en.entity, t.term FROM _ent_ph ep JOIN _entities en ON en.id = ep.entity "
+        "JOIN _terms t ON t.id = ep.phenotype ORDER BY ALL"
+    )
+    assert ent_ph == [("E:1", "A1"), ("E:2", "B1"), ("E:3", "A1"), ("E:3", "B1")]  # negated E:4 excluded
+    psize = engine._read("SELECT t.term, ps.sz FROM _psize ps JOIN _terms t ON t.id = ps.p ORDER BY 1")
+    assert psize == [("A1", 3), ("B1", 3)]
+    engine._ensure_search_tables()  # no-op: tables already exist
+    assert engine.full_search(["A1", "B1"], prefix="E") == first
+
+
+def test_term_dictionary_preserves_curie_order(engine):
+    """Dictionary ids are dense and sort like their CURIEs, so id-ordered tie-breaks are unchanged."""
+    terms = engine._read("SELECT id, term FROM _terms ORDER BY id")
+    assert [i for i, _ in terms] == list(range(len(terms)))
+    assert [t for _, t in terms] == sorted(["A", "A1", "B", "B1", "R"])
+    entities = engine._read("SELECT entity, prefix FROM _entities ORDER BY id")
+    assert entities == [("E:1", "E"), ("E:2", "E"), ("E:3", "E")]  # negated-only E:4 isn't annotated
+
+
+def test_queries_bind_ids_as_parameters(engine):
+    """Ids travel as bound list parameters, so quotes in them are data, not SQL, and the query
+    text is the same for every request."""
+    assert engine.labels(["A1", "it's not a term"]) == {"A1": "a one"}
+    assert engine.entity_phenotypes_batch(["E:1", "E:'1"]) == {"E:1": ["A1"]}
+    assert engine.full_search(["A1", "'); DROP TABLE _terms; --"], prefix="E")
+    assert engine._read("SELECT count(*) FROM _terms") == [(5,)]
+
+
+def test_concurrent_requests_share_the_connection_pool(tmp_path):
+    """Requests on FastAPI's threadpool each check out a pooled connection and get their own results."""
+    engine = Ducksim.from_duckdb(_bake(_mini_kg(tmp_path)), pool_size=2, term_cache_size=0, page_cache_size=0)
+    cases = [(["A1"], ["B1"]), (["A1", "B1"], ["A"]), (["B"], ["B1", "R"])] * 8
+    expected = [engine.termset_pairwise_similarity(s, o)["average_score"] for s, o in cases]
+    with ThreadPoolExecutor(6) as executor:
+        scores = list(executor.map(lambda c: engine.termset_pairwise_similarity(*c)["average_score"], cases))
+    assert scores == expected
+    stats = engine.pool_stats()
+    assert stats["size"] == 2 and stats["in_use"] == 0 and stats["checkouts"] >= 2 * len(cases)
+
+
+def test_deep_ranking_is_held_and_enriched_a_page_at_a_time(engine, monkeypatch):
+    query = ["A1", "B1"]
+    whole = engine.search(query, limit=3, prefix="E", mode="full")
+    ranked = engine.ranking(query, depth=3, prefix="E", mode="full")
+    assert ranked == [(e, score) for e, score, _ in whole]
+    queries = _counting_reads(engine, monkeypatch)
+    assert engine.ranking(query, depth=3, prefix="E", mode="full") == ranked  # held, not ranked again
+    assert queries == []
+    pages = engine.enrich(ranked[:2], query) + engine.enrich(ranked[2:], query)
+    assert pages == whole
+    assert engine.cache_stats()["result_sets"]["hits"] == 1
+
+
+@pytest.mark.parametrize("direction", ["bidirectional", "subject_to_object", "object_to_subject"])
+@pytest.mark.parametrize("metric", ["ancestor_information_content", "jaccard_similarity", "phenodigm_score"])
+def test_batch_search_ranks_each_profile_like_full_search(engine, metric, direction):
+    profiles = [["A1", "B"], ["B1"], ["A1", "B", "A1"], ["NOT:INDEXED"], ["A", "B1", "R"]]
+    expected = [engine.full_search(p, limit=2, metric=metric, direction=direction, prefix="E") for p in profiles]
+    batched = list(engine.batch_search(profiles, limit=2, metric=metric, direction=direction, prefix="E", batch_size=2))
+    assert [[e for e, _ in ranked] for ranked in batched] == [[e for e, _ in ranked] for ranked in expected]
+    for got, want in zip(batched, expected):
+        assert [s for _, s in got] == pytest.approx([s for _, s in want])
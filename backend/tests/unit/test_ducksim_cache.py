@@ -0,0 +1,46 @@
+from monarch_py.service import ducksim_cache
+from monarch_py.service.ducksim_cache import ExpiringCache, LRUCache, artifact_identity
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a is now more recent than b
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "c", "d"]) == {"a": 1, "c": 3}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 2, 1)
+    assert stats["hit_ratio"] == 0.6
+
+
+def test_lru_cache_disabled_when_sized_zero():
+    cache = LRUCache(max_entries=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_expiring_cache_drops_entries_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ducksim_cache.time, "monotonic", lambda: now[0])
+    cache = ExpiringCache(max_entries=4, ttl=60)
+    cache.put("a", 1)
+    now[0] += 59
+    assert cache.get("a") == 1
+    assert cache.get_many(["a", "b"]) == {"a": 1}
+    now[0] += 1
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["ttl"]) == (0, 2, 2, 60)
+
+
+def test_artifact_identity_changes_when_file_is_replaced(tmp_path):
+    path = tmp_path / "kg.duckdb"
+    path.write_bytes(b"one")
+    before = artifact_identity(path)
+    path.write_bytes(b"second build")
+    assert artifact_identity(path) != before
+    assert artifact_identity(":memory:") == (":memory:", None, None)
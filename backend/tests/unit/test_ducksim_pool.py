@@ -0,0 +1,79 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+
+from monarch_py.service.ducksim_pool import ConnectionPool
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_connections_share_the_database():
+    con = duckdb.connect()
+    pool = ConnectionPool(con, 2)
+    con.execute("CREATE TABLE t AS SELECT 42 AS x")  # created after the pool: still visible
+    with pool.connection() as a, pool.connection() as b:
+        assert a is not b
+        assert a.execute("SELECT x FROM t").fetchall() == b.execute("SELECT x FROM t").fetchall() == [(42,)]
+    assert pool.stats()["in_use"] == 0
+
+
+def test_waiters_are_served_in_arrival_order():
+    pool = ConnectionPool(duckdb.connect(), 1)
+    served = []
+
+    def take(i):
+        with pool.connection():
+            served.append(i)
+
+    with pool.connection():
+        threads = []
+        for i in range(4):
+            threads.append(threading.Thread(target=take, args=(i,)))
+            threads[-1].start()
+            _wait_for(lambda: pool.stats()["waiting"] == i + 1)  # queued before the next one arrives
+    for t in threads:
+        t.join()
+    assert served == [0, 1, 2, 3]
+    stats = pool.stats()
+    assert stats["checkouts"] == 5 and stats["waited"] == 4 and stats["peak_waiting"] == 4
+
+
+def test_queue_wait_is_measured():
+    pool = ConnectionPool(duckdb.connect(), 1)
+    assert pool.stats()["wait_seconds_mean"] is None
+    held = threading.Event()
+
+    def hold():
+        with pool.connection():
+            held.set()
+            time.sleep(0.05)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait()
+    with pool.connection():
+        pass
+    holder.join()
+    stats = pool.stats()
+    assert stats["waited"] == 1
+    assert stats["wait_seconds_max"] >= 0.03
+    assert stats["wait_seconds_total"] == stats["wait_seconds_max"] == stats["wait_seconds_mean"]
+
+
+def test_concurrent_queries_return_their_own_results():
+    pool = ConnectionPool(duckdb.connect(), 3)
+
+    def query(i):
+        with pool.connection() as cur:
+            return cur.execute("SELECT $i * 2", {"i": i}).fetchall()[0][0]
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(query, range(64))) == [i * 2 for i in range(64)]
+    assert pool.stats()["checkouts"] == 64
@@ -1,5 +1,7 @@
 """Unit tests for entity_grid API endpoints."""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock
 from fastapi import HTTPException
@@ -9,7 +11,7 @@ from monarch_py.api.main import app
 from monarch_py.api.entity_grid import _validate_entity_category, _get_grid, RowGrouping
 from monarch_py.datamodels.category_enums import EntityCategory
 from monarch_py.datamodels.model import EntityGridResponse
-from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
 
 
 @pytest.fixture
@@ -41,22 +43,22 @@ def test_validate_entity_category_valid():
     mock_entity = MagicMock()
     mock_entity.category = "biolink:Disease"
 
-    with patch.object(SolrImplementation, "get_entity", return_value=mock_entity):
-        _validate_entity_category("MONDO:0007078", EntityCategory.DISEASE)
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity):
+        asyncio.run(_validate_entity_category("MONDO:0007078", EntityCategory.DISEASE))
 
 
 def test_validate_entity_category_list():
     mock_entity = MagicMock()
     mock_entity.category = ["biolink:Disease", "biolink:NamedThing"]
 
-    with patch.object(SolrImplementation, "get_entity", return_value=mock_entity):
-        _validate_entity_category("MONDO:0007078", EntityCategory.DISEASE)
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity):
+        asyncio.run(_validate_entity_category("MONDO:0007078", EntityCategory.DISEASE))
 
 
 def test_validate_entity_category_not_found():
-    with patch.object(SolrImplementation, "get_entity", return_value=None):
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=None):
         with pytest.raises(HTTPException) as exc_info:
-            _validate_entity_category("MONDO:9999999", EntityCategory.DISEASE)
+            asyncio.run(_validate_entity_category("MONDO:9999999", EntityCategory.DISEASE))
         assert exc_info.value.status_code == 404
 
 
@@ -64,9 +66,9 @@ def test_validate_entity_category_wrong_category():
     mock_entity = MagicMock()
     mock_entity.category = "biolink:Gene"
 
-    with patch.object(SolrImplementation, "get_entity", return_value=mock_entity):
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity):
         with pytest.raises(HTTPException) as exc_info:
-            _validate_entity_category("HGNC:4851", EntityCategory.DISEASE)
+            asyncio.run(_validate_entity_category("HGNC:4851", EntityCategory.DISEASE))
         assert exc_info.value.status_code == 400
 
 
@@ -74,16 +76,16 @@ def test_validate_entity_category_no_category():
     mock_entity = MagicMock()
     mock_entity.category = None
 
-    with patch.object(SolrImplementation, "get_entity", return_value=mock_entity):
+    with patch.object(AsyncSolrImplementation, "get_entity", return_value=mock_entity):
         with pytest.raises(HTTPException) as exc_info:
-            _validate_entity_category("MONDO:0007078", EntityCategory.DISEASE)
+            asyncio.run(_validate_entity_category("MONDO:0007078", EntityCategory.DISEASE))
         assert exc_info.value.status_code == 400
 
 
 def test_validate_entity_category_exception():
-    with patch.object(SolrImplementation, "get_entity", side_effect=Exception("Solr down")):
+    with patch.object(AsyncSolrImplementation, "get_entity", side_effect=Exception("Solr down")):
         with pytest.raises(HTTPException) as exc_info:
-            _validate_entity_category("MONDO:0007078", EntityCategory.DISEASE)
+            asyncio.run(_validate_entity_category("MONDO:0007078", EntityCategory.DISEASE))
         assert exc_info.value.status_code == 404
 
 
@@ -93,15 +95,15 @@ def test_validate_entity_category_exception():
 
 
 def test_get_grid_returns_response(mock_grid_response):
-    with patch.object(SolrImplementation, "get_entity_grid", return_value=mock_grid_response):
-        result = _get_grid("MONDO:0007078", "case-phenotype", True, 1000)
+    with patch.object(AsyncSolrImplementation, "get_entity_grid", return_value=mock_grid_response):
+        result = asyncio.run(_get_grid("MONDO:0007078", "case-phenotype", True, 1000))
         assert isinstance(result, EntityGridResponse)
 
 
 def test_get_grid_raises_400_on_value_error():
-    with patch.object(SolrImplementation, "get_entity_grid", side_effect=ValueError("exceeds limit")):
+    with patch.object(AsyncSolrImplementation, "get_entity_grid", side_effect=ValueError("exceeds limit")):
         with pytest.raises(HTTPException) as exc_info:
-            _get_grid("MONDO:0007078", "case-phenotype", True, 1000)
+            asyncio.run(_get_grid("MONDO:0007078", "case-phenotype", True, 1000))
         assert exc_info.value.status_code == 400
 
 
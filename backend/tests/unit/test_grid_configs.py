@@ -74,7 +74,7 @@ class TestGenericEntityGridAPIMultiRowCategory:
 
     def test_api_accepts_multiple_row_association_category(self, client):
         """API should accept multiple row_association_category query parameters."""
-        from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+        from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
         from monarch_py.datamodels.model import EntityGridResponse
 
         # Mock the solr implementation to avoid actual Solr calls
@@ -90,7 +90,7 @@ class TestGenericEntityGridAPIMultiRowCategory:
             cells={},
         )
 
-        with patch.object(SolrImplementation, "get_generic_entity_grid") as mock_get_grid:
+        with patch.object(AsyncSolrImplementation, "get_generic_entity_grid") as mock_get_grid:
             mock_get_grid.return_value = mock_response
 
             # Call API with multiple row_association_category params
@@ -117,7 +117,7 @@ class TestGenericEntityGridAPIMultiRowCategory:
 
     def test_api_accepts_single_row_association_category(self, client):
         """API should still work with single row_association_category parameter."""
-        from monarch_py.implementations.solr.solr_implementation import SolrImplementation
+        from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
         from monarch_py.datamodels.model import EntityGridResponse
 
         mock_response = EntityGridResponse(
@@ -132,7 +132,7 @@ class TestGenericEntityGridAPIMultiRowCategory:
             cells={},
         )
 
-        with patch.object(SolrImplementation, "get_generic_entity_grid") as mock_get_grid:
+        with patch.object(AsyncSolrImplementation, "get_generic_entity_grid") as mock_get_grid:
             mock_get_grid.return_value = mock_response
 
             # Call API with single row_association_category param
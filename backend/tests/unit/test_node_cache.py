@@ -0,0 +1,144 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from monarch_py.datamodels.model import Node
+from monarch_py.service.node_cache import DiskTier, KGVersion, MemoryTier, NodeCache
+
+
+@pytest.fixture
+def make_node():
+    def _make(id="MONDO:0007947", name="Marfan syndrome"):
+        return Node(id=id, name=name, category="biolink:Disease", association_counts=[])
+
+    return _make
+
+
+def test_memory_tier_evicts_least_recently_used(make_node):
+    cache = NodeCache([MemoryTier(max_entries=2)])
+    for id in ["A:1", "A:2"]:
+        cache.put("v1", id, make_node(id=id))
+    assert cache.get("v1", "A:1") is not None  # A:1 is now more recent than A:2
+    cache.put("v1", "A:3", make_node(id="A:3"))
+
+    assert cache.get("v1", "A:2") is None
+    assert cache.get("v1", "A:1").id == "A:1"
+    stats = cache.stats()
+    assert stats["hits"] == {"memory": 2}
+    assert stats["misses"] == 1
+    assert stats["tiers"]["memory"]["evictions"] == 1
+
+
+def test_kg_version_change_invalidates(make_node, tmp_path):
+    cache = NodeCache.from_settings(max_entries=10, disk_dir=str(tmp_path), disk_max_entries=10, disk_stale_after=0)
+    cache.put("2024-01-01", "MONDO:0007947", make_node())
+    assert cache.get("2024-01-01", "MONDO:0007947") is not None
+
+    assert cache.get("2024-02-01", "MONDO:0007947") is None
+    assert cache.stats()["invalidations"] == 1
+    assert [p.name for p in tmp_path.iterdir()] == []
+
+
+def test_disk_tier_keeps_another_version_until_it_goes_unused(make_node, tmp_path):
+    """Old- and new-version workers share the directory during a rolling deploy"""
+    old = NodeCache.from_settings(10, str(tmp_path), 10)
+    old.put("2024-01-01", "MONDO:0007947", make_node())
+    new = NodeCache.from_settings(10, str(tmp_path), 10)
+    new.put("2024-02-01", "MONDO:0007947", make_node())
+    assert old.get("2024-01-01", "MONDO:0007947") is not None
+    assert old.stats()["hits"] == {"memory": 1, "disk": 0}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2024-01-01", "2024-02-01"]
+
+    day_ago = time.time() - 25 * 3600
+    old_dir = tmp_path / "2024-01-01"
+    for path in [*old_dir.iterdir(), old_dir]:
+        os.utime(path, (day_ago, day_ago))
+    NodeCache.from_settings(10, str(tmp_path), 10).get("2024-02-01", "MONDO:0007947")
+    assert [p.name for p in tmp_path.iterdir()] == ["2024-02-01"]
+
+
+def test_disk_tier_survives_restart_and_promotes(make_node, tmp_path):
+    NodeCache.from_settings(10, str(tmp_path), 10).put("2024-01-01", "MONDO:0007947", make_node())
+
+    restarted = NodeCache.from_settings(10, str(tmp_path), 10)
+    assert restarted.get("2024-01-01", "MONDO:0007947").name == "Marfan syndrome"
+    assert restarted.get("2024-01-01", "MONDO:0007947") is not None
+    assert restarted.stats()["hits"] == {"memory": 1, "disk": 1}
+
+
+def test_disk_tier_skipped_for_unknown_version(make_node, tmp_path):
+    cache = NodeCache.from_settings(10, str(tmp_path), 10)
+    cache.put("unknown", "MONDO:0007947", make_node())
+    assert cache.get("unknown", "MONDO:0007947") is not None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_entries_of_unknown_version_expire(make_node, monkeypatch):
+    tier = MemoryTier(max_entries=10, unknown_ttl=60)
+    tier.put("unknown", "MONDO:0007947", make_node())
+    tier.put("2024-01-01", "MONDO:0007947", make_node())
+    assert tier.get("unknown", "MONDO:0007947") is not None
+
+    stored = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: stored + 61)
+    assert tier.get("unknown", "MONDO:0007947") is None
+    assert tier.get("2024-01-01", "MONDO:0007947") is not None
+
+
+def test_kg_version_is_reread_from_solr():
+    versions = iter(["solr-1", "solr-2"])
+
+    async def fetch():
+        version = next(versions, None)
+        if version is None:
+            raise ConnectionError("solr is down")
+        return version
+
+    async def _read(kg_version):
+        first = [await kg_version.get(), await kg_version.get()]  # the second within `refresh_after`
+        kg_version.refresh_after = 0
+        return first + [await kg_version.get(), await kg_version.get()]
+
+    seen = asyncio.run(_read(KGVersion(fetch, pinned="2024-01-01", refresh_after=60)))
+    assert seen == ["2024-01-01+solr-1", "2024-01-01+solr-1", "2024-01-01+solr-2", "unknown"]
+
+
+def test_disk_tier_evicts_oldest_files(make_node, tmp_path):
+    tier = DiskTier(str(tmp_path), max_entries=3)
+    for index in range(4):
+        tier.put("v1", f"A:{index}", make_node(id=f"A:{index}"))
+        path = tier._path("v1", f"A:{index}")
+        os.utime(path, (index, index))
+
+    assert tier.get("v1", "A:0") is None
+    assert tier.get("v1", "A:3") is not None
+    assert tier.stats()["evictions"] >= 1
+    assert tier.stats()["entries"] <= 3
+
+
+def test_async_access_reads_and_writes_disk_off_the_event_loop(make_node, tmp_path, monkeypatch):
+    disk_threads = []
+    for method in ("get", "put", "invalidate"):
+        original = getattr(DiskTier, method)
+
+        def recorded(self, *args, _original=original):
+            disk_threads.append(threading.get_ident())
+            return _original(self, *args)
+
+        monkeypatch.setattr(DiskTier, method, recorded)
+
+    async def _access():
+        cache = NodeCache.from_settings(10, str(tmp_path), 10)
+        await cache.aput("2024-01-01", "MONDO:0007947", make_node())
+        restarted = NodeCache.from_settings(10, str(tmp_path), 10)
+        first = await restarted.aget("2024-01-01", "MONDO:0007947")
+        second = await restarted.aget("2024-01-01", "MONDO:0007947")
+        return threading.get_ident(), restarted.stats(), first, second
+
+    loop_thread, stats, first, second = asyncio.run(_access())
+    assert first.name == second.name == "Marfan syndrome"
+    assert stats["hits"] == {"memory": 1, "disk": 1}
+    assert disk_threads and loop_thread not in disk_threads
@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+from monarch_py.api.additional_models import SemsimBatchSearchResult
+from monarch_py.datamodels.model import Entity, SemsimSearchResult
+from monarch_py.utils.semsim_batch_utils import ProfileFormat, profile_format, read_profiles, write_results
+
+
+def test_profile_format_from_extension():
+    assert profile_format("profiles.tsv") == ProfileFormat.tsv
+    assert profile_format("profiles.jsonl") == ProfileFormat.jsonl
+    assert profile_format("profiles.tsv", ProfileFormat.jsonl) == ProfileFormat.jsonl
+
+
+def test_read_tsv_profiles():
+    lines = ["# nightly cohort\n", "id\ttermset\n", "p1\tHP:1, HP:2\n", "\n", "p2\tHP:3\n"]
+    profiles = list(read_profiles(lines, ProfileFormat.tsv))
+    assert [(p.id, p.termset) for p in profiles] == [("p1", ["HP:1", "HP:2"]), ("p2", ["HP:3"])]
+    with pytest.raises(ValueError, match="line 1"):
+        list(read_profiles(["p1\n"], ProfileFormat.tsv))
+
+
+def test_read_jsonl_profiles():
+    lines = ['{"id": "p1", "termset": ["HP:1", "HP:2"]}\n', "\n"]
+    assert [(p.id, p.termset) for p in read_profiles(lines, ProfileFormat.jsonl)] == [("p1", ["HP:1", "HP:2"])]
+
+
+def test_write_results_as_tsv():
+    results = [
+        SemsimBatchSearchResult(
+            id="p1",
+            results=[
+                SemsimSearchResult(subject=Entity(id="MONDO:1", name="one"), score=2.5),
+                SemsimSearchResult(subject=Entity(id="MONDO:2"), score=1.0),
+            ],
+        ),
+        SemsimBatchSearchResult(id="p2", results=[]),
+    ]
+    out = io.StringIO()
+    assert write_results(results, out, ProfileFormat.tsv) == 2
+    assert out.getvalue().splitlines() == [
+        "profile_id\trank\tsubject_id\tsubject_name\tscore",
+        "p1\t1\tMONDO:1\tone\t2.5",
+        "p1\t2\tMONDO:2\t\t1.0",
+    ]
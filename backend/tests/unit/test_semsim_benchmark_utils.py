@@ -0,0 +1,60 @@
+import copy
+import json
+
+import duckdb
+import pytest
+
+from monarch_py.service.ducksim import Ducksim
+from monarch_py.utils.semsim_benchmark_utils import regressions, run_benchmark, synthetic_kg
+
+
+@pytest.fixture
+def synthetic(tmp_path):
+    path = tmp_path / "synthetic.duckdb"
+    return path, synthetic_kg(path, terms=300, depth=5, entities=40, phenotypes=4, seed=3)
+
+
+def test_synthetic_kg_has_the_monarch_kg_shape(synthetic):
+    path, shape = synthetic
+    con = duckdb.connect(str(path), read_only=True)
+    tables = {name for (name,) in con.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+    assert tables == {"closure", "information_content", "closure_size", "edges", "nodes"}
+    assert con.execute("SELECT count(*) FROM closure").fetchone()[0] == shape["closure_rows"]
+    # reflexive, and every term descends from the root, whose IC is 0
+    assert con.execute("SELECT count(*) FROM closure WHERE subject_id = object_id").fetchone()[0] == 300
+    assert con.execute("SELECT count(*) FROM closure WHERE object_id = 'HP:0000000'").fetchone()[0] == 300
+    assert con.execute("SELECT ic FROM information_content WHERE term = 'HP:0000000'").fetchone()[0] == 0
+    assert con.execute("SELECT count(DISTINCT subject), count(*) FROM edges").fetchone() == (40, shape["associations"])
+    con.close()
+    assert synthetic_kg(path.with_name("again.duckdb"), terms=300, depth=5, entities=40, phenotypes=4, seed=3) == shape
+
+
+def test_synthetic_kg_rejects_impossible_shapes(tmp_path):
+    with pytest.raises(ValueError):
+        synthetic_kg(tmp_path / "kg.duckdb", terms=3, depth=5)
+
+
+def test_benchmark_report_and_regressions(synthetic):
+    engine = Ducksim.from_duckdb(str(synthetic[0]), minhash=True, embedding=True, page_cache_size=0)
+    report = run_benchmark(engine, sizes=(1, 3), queries=3, object_sets=2, k=5, prefix="MONDO")
+    report = json.loads(json.dumps(report))  # as read back from a report file
+    assert set(report["sizes"]) == {"1", "3"}
+    measured = report["sizes"]["3"]
+    assert set(measured["hybrid_search"]) == {"flat", "minhash", "embedding"}
+    for name in ("compare", "multi_compare", "full_search", "topk_search"):
+        assert measured[name]["latency_ms"]["p50"] > 0
+    assert measured["topk_search"]["recall_at_k"]["min"] == 1.0
+    assert report["peak_memory_mb"] > 0
+
+    assert regressions(report, report) == []
+    slower, worse = copy.deepcopy(report), copy.deepcopy(report)
+    slower["sizes"]["3"]["compare"]["latency_ms"]["p50"] *= 2
+    worse["sizes"]["1"]["hybrid_search"]["embedding"]["recall_at_k"]["mean"] = -1
+    assert [r.split(":")[0] for r in regressions(report, slower)] == ["size 3 compare"]
+    assert [r.split(":")[0] for r in regressions(report, worse)] == ["size 1 hybrid_search[embedding]"]
+    assert regressions(report, slower, latency_tolerance=1.5) == []
+    # reports from before top-k search was benchmarked still compare
+    older = copy.deepcopy(report)
+    for measured in older["sizes"].values():
+        del measured["topk_search"]
+    assert regressions(older, slower) == regressions(report, slower)
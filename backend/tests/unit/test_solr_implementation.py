@@ -490,6 +490,7 @@ def test_case_phenotype_matrix_complete_flow():
 
     with (
         patch.object(SolrImplementation, "_raw_solr_query", side_effect=side_effect),
+        patch.object(SolrImplementation, "_raw_solr_docs", return_value=iter(responses[1]["response"]["docs"])),
         patch.object(SolrImplementation, "_get_entity_name", return_value="Test Disease"),
     ):
         result = SolrImplementation().get_case_phenotype_matrix("MONDO:0007078")
@@ -553,6 +554,7 @@ def test_entity_grid_complete_flow():
 
     with (
         patch.object(SolrImplementation, "_raw_solr_query", side_effect=side_effect),
+        patch.object(SolrImplementation, "_raw_solr_docs", return_value=iter(responses[1]["response"]["docs"])),
         patch.object(SolrImplementation, "_get_entity_name", return_value="Test Entity"),
     ):
         result = SolrImplementation().get_entity_grid(context_id="MONDO:0007078", grid_type="case-phenotype")
@@ -667,6 +669,7 @@ def test_generic_grid_column_sorting():
         patch.object(SolrImplementation, "get_entity", return_value=_mock_gene_entity("HTT")),
         patch.object(SolrImplementation, "_get_entity_name", return_value="HTT"),
         patch.object(SolrImplementation, "_raw_solr_query", side_effect=side_effect),
+        patch.object(SolrImplementation, "_raw_solr_docs", return_value=iter([])),
     ):
         result = SolrImplementation().get_generic_entity_grid(
             context_id="HGNC:4851",
@@ -967,3 +970,54 @@ def test_cross_species_clique_singleton_no_sideways():
         assert len(result.clique_entities) == 1
         # Only vertical query, no sideways query
         assert mock_assocs.call_count == 1
+
+
+# =====================================================================
+# Tests for relation label prefetch / coalescing
+# =====================================================================
+
+
+def test_prefetch_relation_labels_resolves_all_in_one_query():
+    docs = [
+        {"id": "RO:0004003", "name": "has material basis in germline mutation in"},
+        {"id": "RO:0004026", "name": "disease has location"},
+    ]
+    with patch("monarch_py.implementations.solr.solr_implementation.SolrService") as mock_solr_cls:
+        mock_solr_cls.return_value.query.return_value.response.docs = docs
+        labels = SolrImplementation().prefetch_relation_labels()
+
+    assert mock_solr_cls.return_value.query.call_count == 1
+    query = mock_solr_cls.return_value.query.call_args.args[0]
+    assert query.rows == len(SolrImplementation.MONDO_HEADER_RELATIONS)
+    assert labels["RO:0004026"] == "disease has location"
+    # Relations the KG doesn't know are memoized as confirmed-missing
+    assert labels["RO:0014001"] is None
+    assert SolrImplementation._relation_label_cache == labels
+    with patch.object(SolrImplementation, "get_entity") as mock_get_entity:
+        assert SolrImplementation()._get_relation_label("RO:0004003") == "has material basis in germline mutation in"
+    mock_get_entity.assert_not_called()
+
+
+def test_concurrent_relation_label_misses_are_coalesced():
+    import threading
+    import time
+
+    ro_term = Entity(id="RO:0004003", name="has material basis in germline mutation in", category="biolink:NamedThing")
+
+    def slow_get_entity(*args, **kwargs):
+        time.sleep(0.1)
+        return ro_term
+
+    labels = []
+    with patch.object(SolrImplementation, "get_entity", side_effect=slow_get_entity) as mock_get_entity:
+        threads = [
+            threading.Thread(target=lambda: labels.append(SolrImplementation()._get_relation_label("RO:0004003")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_get_entity.call_count == 1
+    assert labels == ["has material basis in germline mutation in"] * 4
@@ -0,0 +1,86 @@
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from monarch_py.datamodels.model import (
+    AssociationDirectionEnum,
+    DirectionalAssociation,
+    ExpandedAssociation,
+    ExpandedCurie,
+    Mapping,
+    SearchResult,
+)
+from monarch_py.implementations.solr import solr_model_plans
+from monarch_py.implementations.solr.solr_model_plans import build_model, model_plan
+from monarch_py.implementations.solr.solr_parsers import get_association_links
+
+
+class Labelled(BaseModel):
+    id: str
+    label: Optional[str] = None
+    tags: List[str] = []
+    curie: Optional[ExpandedCurie] = None
+
+
+def test_model_plan_is_computed_once_per_model():
+    assert model_plan(Labelled) is model_plan(Labelled)
+
+
+def test_model_plan_classifies_fields():
+    plan = model_plan(Labelled)
+    assert plan.required_fields == ("id",)
+    assert plan.scalar_fields == {"id", "label"}
+    assert set(plan.converters) == {"curie"}
+
+
+def test_build_model_unwraps_scalar_lists_and_converts_nested_models():
+    doc = {"id": ["X:1"], "label": [], "tags": ["a", "b"], "curie": {"id": "X:1", "url": "http://x/1"}}
+    result = build_model(Labelled, doc)
+    assert result.id == "X:1"
+    assert result.label is None
+    assert result.tags == ["a", "b"]
+    assert isinstance(result.curie, ExpandedCurie)
+
+
+def test_build_model_raises_validation_error_for_missing_required_field():
+    with pytest.raises(ValidationError):
+        build_model(Labelled, {"label": "no id"})
+
+
+def test_build_model_validates_when_enabled():
+    with patch.object(solr_model_plans, "VALIDATE_SOLR_DOCS", True):
+        with pytest.raises(ValidationError):
+            build_model(Labelled, {"id": "X:1", "tags": "not a list"})
+    # trusted documents aren't validated field by field
+    assert build_model(Labelled, {"id": "X:1", "tags": "not a list"}).tags == "not a list"
+
+
+def _validated(model, doc, **values):
+    with patch.object(solr_model_plans, "VALIDATE_SOLR_DOCS", True):
+        return build_model(model, doc, **values)
+
+
+def test_constructed_associations_match_validated(association_response):
+    for doc in association_response["response"]["docs"]:
+        links = get_association_links(doc)
+        constructed = build_model(ExpandedAssociation, doc, **links)
+        assert constructed.model_dump() == _validated(ExpandedAssociation, doc, **links).model_dump()
+
+
+def test_constructed_directional_associations_match_validated(association_table_response):
+    for doc in association_table_response["response"]["docs"]:
+        values = dict(direction=AssociationDirectionEnum.outgoing, **get_association_links(doc))
+        constructed = build_model(DirectionalAssociation, doc, **values)
+        assert constructed.direction == AssociationDirectionEnum.outgoing.value
+        assert constructed.model_dump() == _validated(DirectionalAssociation, doc, **values).model_dump()
+
+
+@pytest.mark.parametrize(
+    "model, response_fixture",
+    [(SearchResult, "search_response"), (Mapping, "mapping_response")],
+)
+def test_constructed_documents_match_validated(model, response_fixture, request):
+    for doc in request.getfixturevalue(response_fixture)["response"]["docs"]:
+        assert build_model(model, doc).model_dump() == _validated(model, doc).model_dump()
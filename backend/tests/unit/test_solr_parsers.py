@@ -5,8 +5,8 @@ from pydantic import BaseModel, ValidationError
 
 from monarch_py.datamodels.model import AssociationDirectionEnum, Node
 from monarch_py.datamodels.solr import SolrQueryResult
+from monarch_py.implementations.solr.solr_model_plans import _is_scalar_type
 from monarch_py.implementations.solr.solr_parsers import (
-    _is_scalar_type,
     convert_facet_fields,
     convert_facet_queries,
     get_association_direction,
@@ -15,6 +15,7 @@ from monarch_py.implementations.solr.solr_parsers import (
     parse_association_table,
     parse_associations,
     parse_autocomplete,
+    parse_documents,
     parse_entity,
     parse_histopheno,
     parse_mappings,
@@ -225,6 +226,15 @@ def test_normalize_handles_optional_scalar():
     assert result["label"] == "Test Label"
 
 
+def test_parse_documents_reraises_validation_error():
+    class MyModel(BaseModel):
+        id: str
+
+    assert [item.id for item in parse_documents([{"id": ["X:1"]}, {"id": "X:2"}], MyModel)] == ["X:1", "X:2"]
+    with pytest.raises(ValidationError):
+        parse_documents([{"id": "X:1"}, {"name": "no id"}], MyModel)
+
+
 # =====================================================================
 # Tests for convert_facet_fields and convert_facet_queries
 # =====================================================================
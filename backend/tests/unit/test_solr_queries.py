@@ -6,6 +6,10 @@ from monarch_py.datamodels.category_enums import (
 )
 from monarch_py.datamodels.model import Node
 from monarch_py.implementations.solr.solr_query_utils import (
+    ASSOCIATION_FIELDS,
+    ENTITY_FIELDS,
+    association_group_query,
+    build_association_batch_query,
     build_association_counts_query,
     build_association_query,
     build_autocomplete_query,
@@ -483,3 +487,36 @@ def test_build_grounding_query_with_prefix_and_category():
     query = build_grounding_query("Marfan syndrome", prefix=["MONDO"], category=["biolink:Disease"])
     assert "namespace:MONDO" in query.filter_queries
     assert r"category:biolink\:Disease" in query.filter_queries
+
+
+def test_build_association_batch_query():
+    hierarchy = build_association_query(subject=["MONDO:0007947"], predicate=["biolink:subclass_of"], direct=True)
+    causal = build_association_query(object=["MONDO:0007947"], predicate=["biolink:causes"], direct=True, limit=1000)
+    params = build_association_batch_query({"hierarchy": hierarchy, "causal": causal, "again": hierarchy})
+    assert params["group"] is True
+    assert params["group.query"] == [
+        r"(predicate:biolink\:subclass_of) AND (subject:MONDO\:0007947)",
+        r"(predicate:biolink\:causes) AND (object:MONDO\:0007947)",
+    ]
+    assert params["rows"] == 2
+    assert params["group.limit"] == 1000
+    assert params["fl"] == ASSOCIATION_FIELDS
+
+
+def test_association_group_query_rejects_sorted_queries():
+    with pytest.raises(ValueError):
+        association_group_query(build_association_query(subject=["X:1"], sort=["subject asc"]))
+
+
+def test_entity_fields_skip_descendant_lists():
+    fields = ENTITY_FIELDS.split(",")
+    assert "has_descendant" not in fields
+    assert "has_descendant_label" not in fields
+    assert "has_descendant_count" in fields
+    assert "_version_" not in fields
+
+
+def test_field_list_is_sent_as_fl():
+    query_string = build_mapping_query(entity_id=["MONDO:0020121"]).query_string()
+    assert "fl=subject_id%2Csubject_label%2C" in query_string
+    assert "mapping_source" in query_string
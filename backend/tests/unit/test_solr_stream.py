@@ -0,0 +1,76 @@
+import asyncio
+import io
+import json
+from unittest.mock import patch
+
+import httpx
+import requests
+from urllib3 import HTTPResponse
+
+from monarch_py.implementations.solr.async_solr_implementation import AsyncSolrImplementation
+from monarch_py.service import solr_transport
+from monarch_py.service.solr_stream import iter_docs, stream_params
+
+DOCS = [
+    {"subject": "CASE:1", "object": "HP:0001250", "object_closure": ["HP:0001250", "UPHENO:0004523"], "score": 1.5},
+    {"subject": "CASE:2", "object": "HP:0000001", "negated": True},
+]
+BODY = json.dumps(
+    {
+        "response": {"numFound": 2, "start": 0, "docs": DOCS},
+        "facet_counts": {"facet_queries": {'object_closure:"UPHENO:0004523"': 1}},
+    }
+).encode()
+
+
+def test_stream_params_keep_the_query_and_its_facets():
+    params = {"q": "*:*", "rows": 50000, "facet": "true", "facet.query": ["a"]}
+    assert stream_params(params) == {**params, "omitHeader": True}
+
+
+def test_iter_docs_decodes_documents_incrementally():
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(body=io.BytesIO(BODY), preload_content=False)
+
+    facet_counts = {}
+    docs = iter_docs(response, facet_counts)
+    assert next(docs) == DOCS[0]
+    assert facet_counts == {}  # the facets follow the documents
+    assert list(docs) == DOCS[1:]
+    assert facet_counts == {"facet_queries": {'object_closure:"UPHENO:0004523"': 1}}
+    assert response.raw.closed
+
+
+def test_iter_docs_without_facets():
+    response = requests.Response()
+    response.status_code = 200
+    body = json.dumps({"response": {"numFound": 2, "start": 0, "docs": DOCS}}).encode()
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    facet_counts = {}
+    assert list(iter_docs(response, facet_counts)) == DOCS
+    assert facet_counts == {}
+
+
+def test_async_raw_solr_docs_reads_the_facets_after_the_documents():
+    seen = []
+
+    def _handler(request):
+        seen.append(request.url.params)
+        return httpx.Response(200, content=BODY)
+
+    async def _collect():
+        transport = solr_transport.get_async_transport("http://solr:8983/solr", "association")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        with patch.object(transport, "_client", return_value=client):
+            impl = AsyncSolrImplementation(base_url="http://solr:8983/solr")
+            return [doc async for doc in impl._raw_solr_docs({"q": "*:*", "rows": 10, "facet": "true"}, facet_counts)]
+
+    facet_counts = {}
+    try:
+        assert asyncio.run(_collect()) == DOCS
+    finally:
+        solr_transport.close_transports()
+    assert facet_counts["facet_queries"] == {'object_closure:"UPHENO:0004523"': 1}
+    assert len(seen) == 1 and seen[0]["facet"] == "true"
+    assert solr_transport.get_async_transport("http://solr:8983/solr", "association").stats()["in_flight"] == 0
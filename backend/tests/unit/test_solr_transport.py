@@ -0,0 +1,151 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from monarch_py.datamodels.solr import SolrQuery, core
+from monarch_py.service import solr_transport
+from monarch_py.service.solr_service import AsyncSolrService, SolrService
+from monarch_py.service.solr_transport import (
+    AsyncSolrTransport,
+    SolrTransport,
+    SolrTransportConfig,
+    get_transport,
+    transport_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_transports():
+    """Transports are process-level; start and end every test with an empty registry."""
+    solr_transport.close_transports()
+    yield
+    solr_transport.close_transports()
+
+
+def test_get_transport_is_shared_per_core():
+    entity = get_transport("http://solr:8983/solr", "entity")
+    assert get_transport("http://solr:8983/solr/", "entity") is entity
+    assert get_transport("http://solr:8983/solr", "association") is not entity
+    assert get_transport("http://solr:8983/solr") is not entity
+
+
+def test_solr_service_uses_core_transport():
+    service = SolrService(base_url="http://solr:8983/solr", core=core.ASSOCIATION)
+    assert service.transport is get_transport("http://solr:8983/solr", "association")
+
+
+def test_solr_service_get_restricts_fields():
+    service = SolrService(base_url="http://solr:8983/solr", core=core.ENTITY)
+    assert service._get_url("MONDO:0007947") == "http://solr:8983/solr/entity/get?id=MONDO:0007947"
+    assert (
+        service._get_url("MONDO:0007947", "id,name") == "http://solr:8983/solr/entity/get?id=MONDO:0007947&fl=id,name"
+    )
+
+
+def test_transport_applies_timeouts_and_counts_requests():
+    transport = SolrTransport(SolrTransportConfig(pool_size=4, connect_timeout=1.5, read_timeout=9))
+    session = MagicMock()
+    with patch.object(transport, "_session", return_value=session):
+        transport.get("http://solr/entity/get?id=X")
+        transport.post("http://solr/entity/select", data="q=*:*")
+
+    assert session.request.call_args_list[0].args == ("GET", "http://solr/entity/get?id=X")
+    assert session.request.call_args_list[0].kwargs["timeout"] == (1.5, 9)
+    assert session.request.call_args_list[1].args[0] == "POST"
+    stats = transport.stats()
+    assert stats["pool_size"] == 4
+    assert stats["requests"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["peak_in_flight"] == 1
+    assert stats["errors"] == 0
+
+
+def test_transport_counts_errors():
+    transport = SolrTransport()
+    session = MagicMock()
+    session.request.side_effect = requests.ConnectionError("refused")
+    with patch.object(transport, "_session", return_value=session), pytest.raises(requests.ConnectionError):
+        transport.get("http://solr/entity/get?id=X")
+    assert transport.stats()["errors"] == 1
+    assert transport.stats()["in_flight"] == 0
+
+
+def test_transport_retries_reads_with_backoff():
+    transport = SolrTransport(SolrTransportConfig(retries=3, backoff_factor=0.5, pool_size=7))
+    retry = transport.adapter.max_retries
+    assert retry.total == 3
+    assert retry.backoff_factor == 0.5
+    assert {"GET", "POST"} <= set(retry.allowed_methods)
+    assert 503 in retry.status_forcelist
+    assert transport.adapter._pool_maxsize == 7
+
+
+def test_transport_stats_keyed_by_core():
+    get_transport("http://solr:8983/solr", "entity")
+    get_transport("http://solr:8983/solr")
+    assert set(transport_stats()["sync"]) == {"http://solr:8983/solr/entity", "http://solr:8983/solr"}
+
+
+def _mock_async_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_async_transport_retries_unavailable_solr():
+    statuses = iter([503, 200])
+    transport = AsyncSolrTransport(SolrTransportConfig(retries=2, backoff_factor=0))
+    client = _mock_async_client(lambda request: httpx.Response(next(statuses), json={"doc": None}))
+
+    async def _get():
+        with patch.object(transport, "_client", return_value=client):
+            return await transport.get("http://solr/entity/get?id=X")
+
+    assert asyncio.run(_get()).status_code == 200
+    stats = transport.stats()
+    assert stats["requests"] == 1
+    assert stats["retries"] == 1
+    assert stats["in_flight"] == 0
+
+
+def test_async_transport_counts_errors_after_retries():
+    transport = AsyncSolrTransport(SolrTransportConfig(retries=1, backoff_factor=0))
+
+    def _refuse(request):
+        raise httpx.ConnectError("refused")
+
+    async def _get():
+        with patch.object(transport, "_client", return_value=_mock_async_client(_refuse)):
+            await transport.get("http://solr/entity/get?id=X")
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(_get())
+    assert transport.stats()["errors"] == 1
+    assert transport.stats()["retries"] == 1
+
+
+def test_async_solr_service_posts_form_query():
+    service = AsyncSolrService(base_url="http://solr:8983/solr", core=core.ENTITY)
+    seen = {}
+
+    def _handler(request):
+        seen["body"] = request.content.decode()
+        seen["url"] = str(request.url)
+        return httpx.Response(
+            200,
+            json={
+                "responseHeader": {"QTime": 1, "params": {}},
+                "response": {"numFound": 0, "start": 0, "docs": []},
+                "facet_counts": None,
+            },
+        )
+
+    async def _query():
+        with patch.object(service.transport, "_client", return_value=_mock_async_client(_handler)):
+            return await service.query(SolrQuery(q="marfan"))
+
+    result = asyncio.run(_query())
+    assert seen["url"] == "http://solr:8983/solr/entity/select"
+    assert "q=marfan" in seen["body"]
+    assert result.response.docs == []